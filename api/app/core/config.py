@@ -8,12 +8,26 @@ class Settings(BaseSettings):
     database_url: str
     test_database_url: str = ""
     redis_url: str
+    # Size of each process's shared async Redis pool (app/services/pubsub.py)
+    redis_max_connections: int = 50
 
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 30
     jwt_refresh_token_expire_days: int = 30
 
+    # bcrypt runs on a bounded thread pool (app/core/security.py)
+    password_hash_workers: int = 4
+    password_hash_max_queue: int = 64
+
+    # Users per daily fan-out job are split into this many shards (max 256)
+    job_shard_count: int = 8
+
+    # Authenticated-user cache (app/services/user_cache.py); 0 disables it
+    user_cache_ttl_seconds: int = 30
+    user_cache_max_entries: int = 10_000
+    user_cache_redis: bool = False
+
     cookie_secure: bool = False
     cookie_domain: str = "localhost"
 
@@ -27,6 +41,11 @@ class Settings(BaseSettings):
     vapid_contact_email: str = "admin@fintrack.app"
 
     upload_dir: str = "uploads"
+    # PDF extraction processes for solo/threads workers; prefork children read
+    # inline (app/services/pdf_extract.py)
+    pdf_extract_workers: int = 2
+    # A document still "processing" after this long lost its worker; it is requeued
+    document_processing_timeout_seconds: int = 1800
 
     @property
     def cors_origins_list(self) -> list[str]:
@@ -0,0 +1,69 @@
+"""Operational counters shared by every API and Celery process.
+
+Counters live in a single Redis hash so totals add up across uvicorn
+workers and Celery workers. Recording is best-effort: a Redis outage must
+never fail the request or task being measured.
+
+incr() is a blocking round trip. Code running on an event loop uses
+incr_nowait() or submit() instead, which hand the write to this process's
+metrics writer thread and return at once.
+"""
+import os
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from redis import Redis, RedisError
+from app.core.config import settings
+from app.core.logging import log
+
+METRICS_KEY = "metrics:counters"
+
+
+@lru_cache
+def get_sync_redis() -> Redis:
+    """Process-wide synchronous Redis client (pooled connections)."""
+    return Redis.from_url(settings.redis_url, decode_responses=True, socket_timeout=1)
+
+
+def incr(name: str, amount: int = 1) -> None:
+    try:
+        get_sync_redis().hincrby(METRICS_KEY, name, amount)
+    except RedisError as exc:
+        log.warning("metrics.incr_failed", metric=name, detail=str(exc))
+
+
+_writer: ThreadPoolExecutor | None = None
+_writer_pid: int | None = None
+
+
+def _get_writer() -> ThreadPoolExecutor:
+    global _writer, _writer_pid
+    # A forked child (Celery prefork) inherits the executor but not its thread
+    if _writer is None or _writer_pid != os.getpid():
+        _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metrics")
+        _writer_pid = os.getpid()
+    return _writer
+
+
+def submit(fn: Callable[..., None], *args) -> Future:
+    """Run ``fn(*args)`` on the metrics writer thread, in submission order."""
+    return _get_writer().submit(fn, *args)
+
+
+def incr_nowait(name: str, amount: int = 1) -> Future:
+    """incr() on the writer thread; returns without waiting for Redis."""
+    return submit(incr, name, amount)
+
+
+def wait_for_writes() -> None:
+    """Block until every write submitted so far has been applied."""
+    submit(lambda: None).result()
+
+
+def snapshot() -> dict[str, int]:
+    try:
+        raw = get_sync_redis().hgetall(METRICS_KEY)
+    except RedisError as exc:
+        log.warning("metrics.read_failed", detail=str(exc))
+        return {}
+    return {name: int(value) for name, value in sorted(raw.items())}
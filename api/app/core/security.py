@@ -1,10 +1,23 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import TypeVar
 
 import bcrypt
 import jwt
 
+from app.core import metrics
 from app.core.config import settings
 
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(Exception):
+    """The bcrypt pool's queue is full; the request should be retried later."""
+
 
 def hash_password(password: str) -> str:
     salt = bcrypt.gensalt()
@@ -15,6 +28,96 @@ def verify_password(plain: str, hashed: str) -> bool:
     return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
 
 
+# bcrypt is deliberately slow (~250 ms per call) but releases the GIL, so async
+# handlers run it on this pool instead of blocking the event loop. At most
+# password_hash_workers calls run at once and password_hash_max_queue wait;
+# beyond that, callers get PasswordHasherBusy rather than an unbounded backlog.
+_pool = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers, thread_name_prefix="bcrypt"
+)
+_pool_lock = threading.Lock()
+_in_flight = 0
+_peak_waiting = 0
+# Counters are batched so neither the event loop nor a bcrypt thread pays a
+# Redis round trip per call; the loop flushes them every METRICS_FLUSH_EVERY.
+METRICS_FLUSH_EVERY = 100
+_unflushed = {"calls": 0, "queued": 0, "queue_wait_ms": 0, "rejected": 0}
+
+
+def password_pool_stats() -> dict[str, int]:
+    """This process's bcrypt queue: calls running, waiting, and the peak wait depth."""
+    with _pool_lock:
+        running = min(_in_flight, settings.password_hash_workers)
+        return {
+            "auth.bcrypt.running": running,
+            "auth.bcrypt.queue_depth": _in_flight - running,
+            "auth.bcrypt.queue_depth_peak": _peak_waiting,
+        }
+
+
+def flush_metrics() -> None:
+    """Push bcrypt counters accumulated since the last flush to app.core.metrics."""
+    with _pool_lock:
+        pending = {name: amount for name, amount in _unflushed.items() if amount}
+        for name in _unflushed:
+            _unflushed[name] = 0
+    for name, amount in pending.items():
+        metrics.incr(f"auth.bcrypt.{name}", amount)
+
+
+def _maybe_flush_metrics() -> None:
+    # Called on the event loop: the Redis writes happen on the metrics thread
+    if _unflushed["calls"] + _unflushed["rejected"] >= METRICS_FLUSH_EVERY:
+        metrics.submit(flush_metrics)
+
+
+async def _run_in_pool(fn: Callable[..., T], *args) -> T:
+    global _in_flight, _peak_waiting
+    with _pool_lock:
+        admitted = _in_flight < settings.password_hash_workers + settings.password_hash_max_queue
+        if admitted:
+            _in_flight += 1
+            _peak_waiting = max(_peak_waiting, _in_flight - settings.password_hash_workers)
+        else:
+            _unflushed["rejected"] += 1
+    if not admitted:
+        _maybe_flush_metrics()
+        raise PasswordHasherBusy()
+
+    submitted = time.perf_counter()
+    waited_ms = 0.0
+
+    def job() -> T:
+        nonlocal waited_ms
+        waited_ms = (time.perf_counter() - submitted) * 1000
+        return fn(*args)
+
+    def release(future: Future) -> None:
+        # Also runs if the request was cancelled before its job started.
+        global _in_flight
+        with _pool_lock:
+            _in_flight -= 1
+            _unflushed["calls"] += 1
+            if waited_ms >= 1:
+                _unflushed["queued"] += 1
+                _unflushed["queue_wait_ms"] += int(waited_ms)
+
+    future = _pool.submit(job)
+    future.add_done_callback(release)
+    try:
+        return await asyncio.wrap_future(future)
+    finally:
+        _maybe_flush_metrics()
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_in_pool(hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run_in_pool(verify_password, plain, hashed)
+
+
 def create_access_token(subject: str) -> str:
     expire = datetime.now(timezone.utc) + timedelta(
         minutes=settings.jwt_access_token_expire_minutes
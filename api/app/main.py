@@ -4,8 +4,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.exc import IntegrityError
 from starlette.requests import Request
 from starlette.responses import JSONResponse
+from app.core import metrics, security
 from app.core.config import settings
 from app.core.logging import configure_logging, log
+from app.core.security import PasswordHasherBusy, password_pool_stats
 from app.routers import auth as auth_router
 from app.routers import accounts as accounts_router
 from app.routers import credit_cards as cc_router
@@ -21,13 +23,20 @@ from app.routers import analytics as analytics_router
 from app.routers import recurring_transactions as recurring_router
 from app.routers import credit_lines as credit_lines_router
 from app.routers.institutions import router as institutions_router
+from app.services import discord, pubsub, user_cache
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     configure_logging(settings.app_env)
     log.info("startup", env=settings.app_env)
+    await pubsub.get_redis()
     yield
+    await pubsub.close_redis()
+    await discord.close()
+    user_cache.flush_metrics()
+    security.flush_metrics()
+    metrics.wait_for_writes()
     log.info("shutdown")
 
 
@@ -67,6 +76,16 @@ async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSON
     )
 
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy) -> JSONResponse:
+    log.warning("password_hasher_busy", path=request.url.path)
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many sign-in attempts in progress. Try again shortly."},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     log.error("unhandled_exception", detail=str(exc), exc_info=True)
@@ -79,3 +98,10 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
 @app.get("/health")
 async def health() -> dict:
     return {"status": "ok"}
+
+
+@app.get("/health/metrics")
+def health_metrics() -> dict:
+    """Operational counters (e.g. budget_alerts.dispatch.coalesced), plus this
+    process's bcrypt pool and SSE stream gauges."""
+    return {**metrics.snapshot(), **password_pool_stats(), **pubsub.stream_stats()}
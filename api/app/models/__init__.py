@@ -12,3 +12,9 @@ from app.models.push_subscription import PushSubscription  # noqa: F401
 from app.models.credit_line import CreditLine  # noqa: F401
 from app.models.institution import Institution  # noqa: F401
 from app.models.loan import Loan  # noqa: F401
+from app.models.account_balance import AccountBalance  # noqa: F401
+from app.models.account_daily_delta import AccountDailyDelta  # noqa: F401
+from app.models.monthly_rollup import MonthlyRollup  # noqa: F401
+
+# Registers the Transaction flush hooks that keep derived tables in sync.
+import app.services.ledger  # noqa: E402, F401
@@ -0,0 +1,34 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import DateTime, Numeric, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.core.database import Base
+
+
+class AccountBalance(Base):
+    """Materialized sum of every transaction's effect on an account.
+
+    current_balance = accounts.opening_balance + transactions_net.
+    Maintained by the Transaction flush hooks in app/services/ledger.py and
+    rebuilt by the nightly reconciliation task.
+    """
+
+    __tablename__ = "account_balances"
+
+    account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    transactions_net: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+        server_default="0",
+        comment="income + transfer-in - expense - transfer-out - fees",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
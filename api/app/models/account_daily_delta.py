@@ -0,0 +1,27 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import Date, Numeric, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.core.database import Base
+
+
+class AccountDailyDelta(Base):
+    """Net balance change of an account on one calendar day.
+
+    balance at end of day D = opening_balance + SUM(delta WHERE date <= D).
+    Maintained alongside account_balances by app/services/ledger.py.
+    """
+
+    __tablename__ = "account_daily_deltas"
+
+    account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    delta: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2), nullable=False, default=Decimal("0.00"), server_default="0"
+    )
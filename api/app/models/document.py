@@ -1,7 +1,7 @@
 import enum
 import uuid
 from datetime import datetime
-from sqlalchemy import String, DateTime, Text, func, ForeignKey
+from sqlalchemy import String, DateTime, Index, Text, func, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from app.core.database import Base
@@ -29,6 +29,16 @@ class DocumentSourceModel(str, enum.Enum):
 
 class Document(Base):
     __tablename__ = "documents"
+    __table_args__ = (
+        # One row per file content per user; re-uploads resolve to it
+        Index(
+            "uq_documents_user_content",
+            "user_id",
+            "content_sha256",
+            unique=True,
+            postgresql_where=text("content_sha256 IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7()
@@ -41,9 +51,13 @@ class Document(Base):
     )
     filename: Mapped[str] = mapped_column(String(500), nullable=False)
     file_path: Mapped[str] = mapped_column(String(1000), nullable=False)
+    content_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
     document_type: Mapped[DocumentType] = mapped_column(nullable=False)
     status: Mapped[DocumentStatus] = mapped_column(default=DocumentStatus.pending)
     celery_task_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    processing_started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     source_model: Mapped[DocumentSourceModel | None] = mapped_column(nullable=True)
     extracted_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -0,0 +1,57 @@
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import Date, DateTime, Index, Integer, Numeric, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.core.database import Base
+from app.models.transaction import TransactionType
+
+
+class MonthlyRollup(Base):
+    """Per-month SUM(amount) and COUNT(*) of a user's transactions, grouped by
+    (category_id, account_id, type).
+
+    Serves analytics, budget status, the dashboard summary and budget alerts
+    without re-aggregating transactions. Maintained by the Transaction flush
+    hooks in app/services/ledger.py; a deleted category's rows are folded into
+    the uncategorized (NULL) bucket, mirroring transactions.category_id SET NULL.
+    """
+
+    __tablename__ = "monthly_rollups"
+    __table_args__ = (
+        Index(
+            "uq_monthly_rollups_key",
+            "user_id", "month", "category_id", "account_id", "type",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7()
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    month: Mapped[date] = mapped_column(
+        Date, nullable=False, comment="First day of the calendar month"
+    )
+    category_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("categories.id", ondelete="CASCADE"), nullable=True,
+        index=True,
+    )
+    account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False,
+        index=True,
+    )
+    type: Mapped[TransactionType] = mapped_column(nullable=False)
+    total: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2), nullable=False, default=Decimal("0.00"), server_default="0"
+    )
+    txn_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
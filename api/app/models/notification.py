@@ -1,7 +1,7 @@
 import uuid
 import enum
 from datetime import datetime
-from sqlalchemy import String, Text, Boolean, ForeignKey, func, DateTime
+from sqlalchemy import String, Text, Boolean, ForeignKey, Index, func, DateTime, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from app.core.database import Base
@@ -16,6 +16,17 @@ class NotificationType(str, enum.Enum):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Jobs that may run more than once (retries, resumed shards) set a
+        # dedup_key and insert with ON CONFLICT DO NOTHING against this index.
+        Index(
+            "uq_notifications_dedup_key",
+            "user_id",
+            "dedup_key",
+            unique=True,
+            postgresql_where=text("dedup_key IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7()
@@ -38,6 +49,7 @@ class Notification(Base):
     metadata_: Mapped[dict | None] = mapped_column(
         "metadata", JSONB, nullable=True
     )
+    dedup_key: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
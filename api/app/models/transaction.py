@@ -2,8 +2,10 @@ import enum
 import uuid
 from datetime import datetime, date
 from decimal import Decimal
-from sqlalchemy import DateTime, Date, Index, Numeric, ForeignKey, func, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DDL, Computed, DateTime, Date, Index, Numeric, ForeignKey, event, func, text, Text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from app.core.database import Base
 
@@ -59,31 +61,59 @@ class TransactionSource(str, enum.Enum):
 
 class Transaction(Base):
     __tablename__ = "transactions"
-    __table_args__ = (Index("ix_transactions_user_date", "user_id", "date"),)
+    # Columns marked active_history=True feed the derived tables maintained in
+    # app/services/ledger.py, which need their pre-update values.
+    __table_args__ = (
+        Index("ix_transactions_user_date", "user_id", "date"),
+        # Backs description ILIKE '%...%' and trigram similarity (pg_trgm)
+        Index(
+            "ix_transactions_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        Index("ix_transactions_search_vector", "search_vector", postgresql_using="gin"),
+        # One generated transaction per recurring rule and date; lets the
+        # generator re-run safely (app/services/recurring.py)
+        Index(
+            "uq_transactions_recurring_occurrence",
+            "recurring_id",
+            "date",
+            unique=True,
+            postgresql_where=text("recurring_id IS NOT NULL"),
+        ),
+    )
 
+    # Generated client-side: a primary key with a server default gives
+    # SQLAlchemy no insert sentinel, and bulk INSERT ... RETURNING would then
+    # fall back to one statement per row. The column keeps its uuidv7()
+    # server default for rows inserted outside the ORM.
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7()
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid7
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
+        active_history=True,
     )
     account_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("accounts.id", ondelete="RESTRICT"),
         nullable=False,
         index=True,
+        active_history=True,
     )
     category_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("categories.id", ondelete="SET NULL"),
         nullable=True,
         index=True,
+        active_history=True,
     )
     to_account_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="SET NULL"), nullable=True,
-        index=True,
+        index=True, active_history=True,
         comment="For transfer type: destination account (own_account sub_type only)"
     )
     document_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -94,11 +124,18 @@ class Transaction(Base):
         UUID(as_uuid=True), ForeignKey("recurring_transactions.id", ondelete="SET NULL"), nullable=True,
         index=True,
     )
-    amount: Mapped[Decimal] = mapped_column(Numeric(15, 2), nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(15, 2), nullable=False, active_history=True)
     description: Mapped[str] = mapped_column(Text, default="")
-    type: Mapped[TransactionType] = mapped_column(nullable=False)
+    # 'simple' config: descriptions are merchant names and mixed English/Filipino,
+    # where stemming and English stop words do more harm than good.
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple'::regconfig, COALESCE(description, ''::text))", persisted=True),
+        deferred=True,
+    )
+    type: Mapped[TransactionType] = mapped_column(nullable=False, active_history=True)
     sub_type: Mapped[TransactionSubType | None] = mapped_column(nullable=True)
-    date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    date: Mapped[date] = mapped_column(Date, nullable=False, index=True, active_history=True)
     source: Mapped[TransactionSource] = mapped_column(default=TransactionSource.manual)
 
     # ATM withdrawal / bank fee support
@@ -107,7 +144,7 @@ class Transaction(Base):
     #   fee_amount = 18.00 (ATM fee)
     #   Total deducted from account = 5,018.00
     fee_amount: Mapped[Decimal | None] = mapped_column(
-        Numeric(15, 2), nullable=True,
+        Numeric(15, 2), nullable=True, active_history=True,
         comment="Optional fee charged on this transaction (e.g. ATM fee, bank charge)"
     )
     fee_category_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -126,3 +163,8 @@ class Transaction(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+
+# gin_trgm_ops lives in the pg_trgm extension; create it before the tables when
+# the schema is built with metadata.create_all (tests). Alembic does the same.
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
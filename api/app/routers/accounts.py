@@ -1,17 +1,30 @@
 import uuid
+from datetime import date, timedelta
 from decimal import Decimal
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.database import get_db
 from app.dependencies import get_current_user
 from app.models.account import Account
 from app.models.user import User
-from app.schemas.account import AccountCreate, AccountUpdate, AccountResponse
-from app.services.account import compute_current_balance, compute_balances_bulk
+from app.schemas.account import (
+    AccountCreate, AccountUpdate, AccountResponse, BalanceHistoryResponse, BalanceAsOfResponse,
+)
+from app.services.account import (
+    compute_current_balance, compute_balances_bulk, compute_balance_as_of, compute_balance_history,
+)
 
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
+# Balance history walks the range day by day, so it is capped. The bounds keep
+# the day before 'from' and the end of the bucket holding 'to' inside the
+# range datetime.date can represent.
+BALANCE_HISTORY_MAX_DAYS = 3660
+BALANCE_HISTORY_MIN_DATE = date.min + timedelta(days=1)
+BALANCE_HISTORY_MAX_DATE = date(date.max.year, 11, 30)
+
 
 async def _to_response(db: AsyncSession, account: Account) -> AccountResponse:
     balance = await compute_current_balance(db, account.id, account.opening_balance)
@@ -72,6 +85,57 @@ async def get_account(
     return await _to_response(db, account)
 
 
+@router.get("/{account_id}/balance-history", response_model=BalanceHistoryResponse)
+async def get_balance_history(
+    account_id: uuid.UUID,
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+    granularity: Literal["day", "week", "month"] = "day",
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    date_to = date_to or date.today()
+    if date_from is None:
+        date_from = max(date_to, BALANCE_HISTORY_MIN_DATE + timedelta(days=365)) - timedelta(days=365)
+    if date_from > date_to:
+        raise HTTPException(status_code=422, detail="'from' must not be after 'to'")
+    if date_from < BALANCE_HISTORY_MIN_DATE or date_to > BALANCE_HISTORY_MAX_DATE:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Dates must be between {BALANCE_HISTORY_MIN_DATE} and {BALANCE_HISTORY_MAX_DATE}",
+        )
+    if (date_to - date_from).days >= BALANCE_HISTORY_MAX_DAYS:
+        raise HTTPException(
+            status_code=422, detail=f"Range is limited to {BALANCE_HISTORY_MAX_DAYS} days"
+        )
+    result = await db.execute(
+        select(Account).where(Account.id == account_id, Account.user_id == current_user.id)
+    )
+    account = result.scalar_one_or_none()
+    if not account:
+        raise HTTPException(status_code=404, detail="Account not found")
+    points = await compute_balance_history(db, account, date_from, date_to, granularity)
+    return BalanceHistoryResponse(account_id=account.id, granularity=granularity, points=points)
+
+
+@router.get("/{account_id}/balance", response_model=BalanceAsOfResponse)
+async def get_balance_as_of(
+    account_id: uuid.UUID,
+    as_of: date | None = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    as_of = as_of or date.today()
+    result = await db.execute(
+        select(Account).where(Account.id == account_id, Account.user_id == current_user.id)
+    )
+    account = result.scalar_one_or_none()
+    if not account:
+        raise HTTPException(status_code=404, detail="Account not found")
+    balance = await compute_balance_as_of(db, account, as_of)
+    return BalanceAsOfResponse(account_id=account.id, as_of=as_of, balance=balance)
+
+
 @router.patch("/{account_id}", response_model=AccountResponse)
 async def update_account(
     account_id: uuid.UUID,
@@ -6,12 +6,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
 from app.core.database import get_db
 from app.dependencies import get_current_user
-from app.models.transaction import Transaction, TransactionType
+from app.models.transaction import TransactionType
 from app.models.category import Category
+from app.models.monthly_rollup import MonthlyRollup
 from app.models.user import User
 from app.models.credit_card import CreditCard
 from app.models.statement import Statement
 from app.schemas.analytics import CategorySpendingItem, CardHistoryItem
+from app.services.periods import month_period
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -23,19 +25,20 @@ async def spending_by_category(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    period = month_period(year, month)
     result = await db.execute(
         select(
             Category.id,
             Category.name,
             Category.color,
-            func.sum(Transaction.amount).label("total"),
+            func.sum(MonthlyRollup.total).label("total"),
         )
-        .join(Transaction, Transaction.category_id == Category.id)
+        .join(MonthlyRollup, MonthlyRollup.category_id == Category.id)
         .where(
-            Transaction.user_id == current_user.id,
-            Transaction.type == TransactionType.expense,
-            func.extract("year", Transaction.date) == year,
-            func.extract("month", Transaction.date) == month,
+            MonthlyRollup.user_id == current_user.id,
+            MonthlyRollup.month == period.start,
+            MonthlyRollup.type == TransactionType.expense,
+            MonthlyRollup.txn_count > 0,
         )
         .group_by(Category.id, Category.name, Category.color)
         .order_by(desc("total"))
@@ -6,10 +6,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.config import settings
 from app.core.database import get_db
-from app.core.security import hash_password, verify_password, create_access_token, create_refresh_token, decode_token
+from app.core.security import (
+    hash_password_async, verify_password_async, create_access_token, create_refresh_token, decode_token,
+)
 from app.models.user import User
 from app.schemas.auth import RegisterRequest, LoginRequest, UserResponse, UpdateProfileRequest, ChangePasswordRequest
 from app.dependencies import get_current_user
+from app.services import user_cache
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -40,7 +43,7 @@ async def register(data: RegisterRequest, response: Response, db: AsyncSession =
     existing = await db.execute(select(User).where(User.email == data.email))
     if existing.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Email already registered")
-    user = User(email=data.email, name=data.name, password_hash=hash_password(data.password))
+    user = User(email=data.email, name=data.name, password_hash=await hash_password_async(data.password))
     db.add(user)
     await db.commit()
     await db.refresh(user)
@@ -52,7 +55,7 @@ async def register(data: RegisterRequest, response: Response, db: AsyncSession =
 async def login(data: LoginRequest, response: Response, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == data.email))
     user = result.scalar_one_or_none()
-    if not user or not verify_password(data.password, user.password_hash):
+    if not user or not await verify_password_async(data.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     _set_auth_cookies(response, user.id, remember_me=data.remember_me)
     return user
@@ -100,6 +103,7 @@ async def update_me(
 ):
     current_user.name = data.name
     await db.commit()
+    await user_cache.invalidate(current_user.id)
     await db.refresh(current_user)
     return current_user
 
@@ -110,8 +114,11 @@ async def change_password(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    if not verify_password(data.current_password, current_user.password_hash):
+    # current_user may come from the user cache, which never holds the hash
+    await db.refresh(current_user)
+    if not await verify_password_async(data.current_password, current_user.password_hash):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
-    current_user.password_hash = hash_password(data.new_password)
+    current_user.password_hash = await hash_password_async(data.new_password)
     await db.commit()
+    await user_cache.invalidate(current_user.id)
     return {"message": "Password updated"}
@@ -1,16 +1,15 @@
 import uuid
-from calendar import monthrange
 from datetime import date
-from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func as sa_func
+from sqlalchemy import select
 from app.core.database import get_db
 from app.dependencies import get_current_user
 from app.models.budget import Budget
-from app.models.transaction import Transaction, TransactionType
 from app.models.user import User
 from app.schemas.budget import BudgetCreate, BudgetUpdate, BudgetResponse, BudgetStatusItem
+from app.services.budget_alerts import compute_budget_spending
+from app.services.periods import month_of
 
 router = APIRouter(prefix="/budgets", tags=["budgets"])
 
@@ -46,55 +45,19 @@ async def get_budget_status(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    today = date.today()
-    month_start = today.replace(day=1)
-    days_in_month = monthrange(today.year, today.month)[1]
-    month_end = month_start.replace(day=days_in_month)
+    month_start = month_of(date.today()).start
 
     budgets_result = await db.execute(
         select(Budget).where(Budget.user_id == current_user.id)
     )
     budgets = budgets_result.scalars().all()
 
-    # Single aggregate query replaces the per-budget N+1 loop.
-    # Group by (category_id, account_id) so both budget types can be resolved
-    # from one result set.
-    spending_result = await db.execute(
-        select(
-            Transaction.category_id,
-            Transaction.account_id,
-            sa_func.sum(Transaction.amount).label("spent"),
-        )
-        .where(
-            Transaction.user_id == current_user.id,
-            Transaction.type == TransactionType.expense,
-            Transaction.date >= month_start,
-            Transaction.date <= month_end,
-        )
-        .group_by(Transaction.category_id, Transaction.account_id)
-    )
-    # Build a flat map keyed by (category_id, account_id) str-or-None tuples → spent.
-    spending_map: dict[tuple[str | None, str | None], Decimal] = {}
-    for row in spending_result.all():
-        cat_key = str(row.category_id) if row.category_id is not None else None
-        acc_key = str(row.account_id) if row.account_id is not None else None
-        spending_map[(cat_key, acc_key)] = Decimal(row.spent)
+    # One read of this month's rollups serves every budget (no per-budget N+1).
+    spending = await compute_budget_spending(db, current_user.id, budgets, month_start)
 
     items = []
     for budget in budgets:
-        if budget.type == "category":
-            cat_str = str(budget.category_id)
-            spent = sum(
-                (v for (cat, _), v in spending_map.items() if cat == cat_str),
-                Decimal("0.00"),
-            )
-        else:
-            acc_str = str(budget.account_id)
-            spent = sum(
-                (v for (_, acc), v in spending_map.items() if acc == acc_str),
-                Decimal("0.00"),
-            )
-
+        spent = spending[budget.id]
         percent = float(spent / budget.amount * 100) if budget.amount > 0 else 0.0
 
         if percent >= 100:
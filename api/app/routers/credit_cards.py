@@ -14,42 +14,48 @@ from app.services.credit_card import (
     get_due_date,
     days_until_due,
 )
-from app.services.credit_line import compute_card_available_credit
+from app.services.account import load_accounts
+from app.services.credit_line import compute_cards_available_credit
 
 router = APIRouter(prefix="/credit-cards", tags=["credit-cards"])
 
 
-async def _get_institution(card: CreditCard, db: AsyncSession):
+def _get_institution(card: CreditCard, accounts: dict[uuid.UUID, Account]):
     """Derive institution from credit_line (if in-line) or from account (if standalone)."""
     if card.credit_line_id is not None:
         if card.credit_line and card.credit_line.institution:
             return card.credit_line.institution
         return None
-    # Standalone: load account and its institution
-    result = await db.execute(select(Account).where(Account.id == card.account_id))
-    account = result.scalar_one_or_none()
+    account = accounts.get(card.account_id)
     if account and account.institution:
         return account.institution
     return None
 
 
+async def _enrich_many(cards: list[CreditCard], db: AsyncSession) -> list[CreditCardResponse]:
+    """Enrich cards with a fixed number of queries, however many there are."""
+    standalone = [c for c in cards if c.credit_line_id is None]
+    accounts = await load_accounts(db, [c.account_id for c in standalone])
+    available = await compute_cards_available_credit(db, standalone, accounts)
+    enriched = []
+    for card in cards:
+        closed = get_closed_statement_period(card.statement_day)
+        open_ = get_open_billing_period(card.statement_day)
+        due = get_due_date(card.statement_day, card.due_day)
+        enriched.append(CreditCardResponse.model_validate({
+            **card.__dict__,
+            "institution": _get_institution(card, accounts),
+            "closed_period": {k: str(v) for k, v in closed.items()},
+            "open_period": {k: str(v) for k, v in open_.items()},
+            "due_date": due,
+            "days_until_due": days_until_due(due),
+            "available_credit": available.get(card.id),
+        }))
+    return enriched
+
+
 async def _enrich(card: CreditCard, db: AsyncSession) -> CreditCardResponse:
-    closed = get_closed_statement_period(card.statement_day)
-    open_ = get_open_billing_period(card.statement_day)
-    due = get_due_date(card.statement_day, card.due_day)
-    available = None
-    if card.credit_line_id is None:
-        available = await compute_card_available_credit(db, card)
-    institution = await _get_institution(card, db)
-    return CreditCardResponse.model_validate({
-        **card.__dict__,
-        "institution": institution,
-        "closed_period": {k: str(v) for k, v in closed.items()},
-        "open_period": {k: str(v) for k, v in open_.items()},
-        "due_date": due,
-        "days_until_due": days_until_due(due),
-        "available_credit": available,
-    })
+    return (await _enrich_many([card], db))[0]
 
 
 @router.get("", response_model=list[CreditCardResponse])
@@ -60,7 +66,7 @@ async def list_credit_cards(
     result = await db.execute(
         select(CreditCard).where(CreditCard.user_id == current_user.id)
     )
-    return [await _enrich(c, db) for c in result.scalars().all()]
+    return await _enrich_many(list(result.scalars().all()), db)
 
 
 @router.post("", response_model=CreditCardResponse, status_code=201)
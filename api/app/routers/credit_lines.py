@@ -13,7 +13,7 @@ from app.schemas.credit_line import (
     CreditLineResponse,
     CreditCardInLine,
 )
-from app.services.credit_line import compute_line_available_credit
+from app.services.credit_line import compute_lines_available_credit
 from app.services.credit_card import (
     get_closed_statement_period,
     get_open_billing_period,
@@ -37,14 +37,21 @@ def _card_to_summary(card: CreditCard) -> CreditCardInLine:
     })
 
 
+async def _enrich_many(db: AsyncSession, lines: list[CreditLine]) -> list[CreditLineResponse]:
+    available = await compute_lines_available_credit(db, lines)
+    return [
+        CreditLineResponse.model_validate({
+            **line.__dict__,
+            "institution": line.institution,
+            "available_credit": available[line.id],
+            "cards": [_card_to_summary(c) for c in line.cards],
+        })
+        for line in lines
+    ]
+
+
 async def _enrich(db: AsyncSession, line: CreditLine) -> CreditLineResponse:
-    available = await compute_line_available_credit(db, line)
-    return CreditLineResponse.model_validate({
-        **line.__dict__,
-        "institution": line.institution,
-        "available_credit": available,
-        "cards": [_card_to_summary(c) for c in line.cards],
-    })
+    return (await _enrich_many(db, [line]))[0]
 
 
 @router.get("", response_model=list[CreditLineResponse])
@@ -55,8 +62,7 @@ async def list_credit_lines(
     result = await db.execute(
         select(CreditLine).where(CreditLine.user_id == current_user.id)
     )
-    lines = result.scalars().all()
-    return [await _enrich(db, line) for line in lines]
+    return await _enrich_many(db, list(result.scalars().all()))
 
 
 @router.post("", response_model=CreditLineResponse, status_code=201)
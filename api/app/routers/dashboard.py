@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,10 +6,12 @@ from sqlalchemy import select, func, case
 from app.core.database import get_db
 from app.dependencies import get_current_user
 from app.models.account import Account, AccountType
+from app.models.monthly_rollup import MonthlyRollup
 from app.models.transaction import Transaction, TransactionType
 from app.models.user import User
 from app.schemas.dashboard import NetWorthResponse
 from app.services.account import compute_balances_bulk
+from app.services.periods import Period, month_of
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -20,40 +22,39 @@ async def summary(
     db: AsyncSession = Depends(get_db),
 ):
     today = date.today()
-    month_start = today.replace(day=1)
+    month = month_of(today)
 
-    result = await db.execute(
-        select(
+    def totals_by_type(type_col, amount):
+        return [
             func.coalesce(
-                func.sum(
-                    case(
-                        (Transaction.type == TransactionType.income, Transaction.amount),
-                        else_=0,
-                    )
-                ),
-                0,
+                func.sum(case((type_col == TransactionType.income, amount), else_=0)), 0
             ).label("total_income"),
             func.coalesce(
-                func.sum(
-                    case(
-                        (Transaction.type == TransactionType.expense, Transaction.amount),
-                        else_=0,
-                    )
-                ),
-                0,
+                func.sum(case((type_col == TransactionType.expense, amount), else_=0)), 0
             ).label("total_expenses"),
-        ).where(
+        ]
+
+    month_totals = (await db.execute(
+        select(*totals_by_type(MonthlyRollup.type, MonthlyRollup.total)).where(
+            MonthlyRollup.user_id == current_user.id,
+            MonthlyRollup.month == month.start,
+        )
+    )).one()
+    # The rollup covers the whole month; back out anything dated after today
+    # (usually nothing, and a short index range on ix_transactions_user_date).
+    future = (await db.execute(
+        select(*totals_by_type(Transaction.type, Transaction.amount)).where(
             Transaction.user_id == current_user.id,
-            Transaction.date >= month_start,
-            Transaction.date <= today,
+            Period(today + timedelta(days=1), month.end).contains(Transaction.date),
         )
-    )
-    row = result.one()
+    )).one()
+    total_income = month_totals.total_income - future.total_income
+    total_expenses = month_totals.total_expenses - future.total_expenses
     return {
         "month": today.strftime("%B %Y"),
-        "total_income": row.total_income,
-        "total_expenses": row.total_expenses,
-        "net": row.total_income - row.total_expenses,
+        "total_income": total_income,
+        "total_expenses": total_expenses,
+        "net": total_income - total_expenses,
     }
 
 
@@ -1,15 +1,19 @@
 import uuid
 from pathlib import Path
-from fastapi import APIRouter, Depends, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, Form, HTTPException, Response, UploadFile
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.logging import log
 from app.dependencies import get_current_user
 from app.models.document import Document, DocumentStatus, DocumentType
 from app.models.user import User
 from app.schemas.document import DocumentResponse, DocumentUpdate
 from app.services.prompt import generate_prompt
+from app.services.uploads import UploadTooLarge, save_upload
+from app.tasks.documents import is_extractable, process_document
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
@@ -23,36 +27,71 @@ MAX_SIZE = 10 * 1024 * 1024  # 10MB
 @router.post("/upload", response_model=DocumentResponse, status_code=201)
 async def upload_document(
     file: UploadFile,
+    response: Response,
     document_type: DocumentType = Form(...),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    contents = await file.read()
-    if len(contents) > MAX_SIZE:
-        raise HTTPException(status_code=413, detail="File too large (max 10MB)")
     if file.content_type not in ALLOWED_TYPES:
         raise HTTPException(status_code=415, detail="Unsupported file type")
 
     ext = Path(file.filename or "file").suffix.lower() or ".bin"
     if ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(status_code=400, detail=f"File type '{ext}' is not allowed")
-    file_name = f"{uuid.uuid4()}{ext}"
     user_dir = Path(settings.upload_dir) / str(current_user.id)
-    user_dir.mkdir(parents=True, exist_ok=True)
-    file_path = user_dir / file_name
-    file_path.write_bytes(contents)
+    try:
+        stored = await save_upload(file, user_dir, ext, MAX_SIZE)
+    except UploadTooLarge:
+        raise HTTPException(status_code=413, detail="File too large (max 10MB)")
 
-    doc = Document(
-        user_id=current_user.id,
-        filename=file.filename or file_name,
-        file_path=str(file_path),
-        document_type=document_type,
-        status=DocumentStatus.pending,
+    # PDF statements are extracted in the background; the task id is known
+    # up front so it is stored with the row.
+    task_id = str(uuid.uuid4()) if is_extractable(document_type, str(stored.path)) else None
+    result = await db.execute(
+        pg_insert(Document)
+        .values(
+            user_id=current_user.id,
+            filename=file.filename or stored.path.name,
+            file_path=str(stored.path),
+            content_sha256=stored.sha256,
+            document_type=document_type,
+            status=DocumentStatus.pending,
+            celery_task_id=task_id,
+        )
+        .on_conflict_do_nothing(
+            index_elements=[Document.user_id, Document.content_sha256],
+            index_where=Document.content_sha256.isnot(None),
+        )
+        .returning(Document)
     )
-    db.add(doc)
-    await db.commit()
-    await db.refresh(doc)
-    return doc
+    doc = result.scalar_one_or_none()
+    if doc is not None:
+        await db.commit()
+        if task_id is not None:
+            try:
+                process_document.apply_async(args=[str(doc.id)], task_id=task_id)
+            except Exception as exc:
+                # The document stays pending; requeue_stale_documents sends
+                # it again once it is older than the processing timeout
+                log.warning("documents.enqueue_failed", document_id=str(doc.id), detail=str(exc))
+        return doc
+
+    # Same file uploaded before: return that document and what was
+    # extracted from it rather than processing it again.
+    result = await db.execute(
+        select(Document).where(
+            Document.user_id == current_user.id,
+            Document.content_sha256 == stored.sha256,
+        )
+    )
+    existing = result.scalar_one()
+    if existing.document_type != document_type:
+        raise HTTPException(
+            status_code=409,
+            detail=f"This file was already uploaded as {existing.document_type.value}.",
+        )
+    response.status_code = 200
+    return existing
 
 
 @router.get("", response_model=list[DocumentResponse])
@@ -1,15 +1,32 @@
+import base64
+import csv
+import enum
+import io
+import json
 import re
 import uuid
-from datetime import date
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from typing import Literal
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import and_, literal, literal_column, select, func, or_, tuple_, Text
+from sqlalchemy.sql.elements import ColumnElement
 from app.core.database import get_db
 from app.dependencies import get_current_user
+from app.models.account import Account
+from app.models.category import Category
 from app.models.transaction import Transaction, TransactionType
 from app.models.user import User
-from app.schemas.transaction import TransactionCreate, TransactionUpdate, TransactionResponse, TransactionListResponse
-from app.tasks import check_budget_alerts_task
+from app.schemas.transaction import (
+    TransactionCreate, TransactionUpdate, TransactionResponse, TransactionListResponse,
+    TransactionBulkCreate, TransactionBulkResponse,
+)
+from app.services.periods import custom_period
+from app.services.transactions import insert_transactions
+from app.tasks import schedule_budget_alerts
 
 
 def _escape_like(s: str) -> str:
@@ -17,44 +34,230 @@ def _escape_like(s: str) -> str:
     return re.sub(r"([%_\\])", r"\\\1", s)
 
 
+def _encode_cursor(txn: Transaction) -> str:
+    """Opaque keyset cursor pointing just past ``txn`` in list ordering."""
+    raw = json.dumps([txn.date.isoformat(), txn.created_at.isoformat(), str(txn.id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[date, datetime, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        d, created_at, txn_id = json.loads(base64.urlsafe_b64decode(padded))
+        return date.fromisoformat(d), datetime.fromisoformat(created_at), uuid.UUID(txn_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+SearchMode = Literal["contains", "fuzzy", "prefix", "fts"]
+
+# Must match the config of Transaction.search_vector for its index to apply.
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+
+class TransactionFilters:
+    """Query filters shared by the list and export endpoints.
+
+    ``search_mode`` picks how ``search`` matches the description:
+
+    - ``contains`` (default): case-insensitive substring, served by the
+      trigram index.
+    - ``fuzzy``: typo-tolerant word similarity (pg_trgm), ranked by score.
+    - ``prefix``: every word in the query is a word prefix ("jol ay" finds
+      "Jollibee Ayala"), via the full-text index.
+    - ``fts``: web-style full-text query (quoted phrases, ``or``, ``-word``),
+      ranked with ts_rank.
+    """
+
+    def __init__(
+        self,
+        type: TransactionType | None = Query(None),
+        account_id: uuid.UUID | None = Query(None),
+        category_id: uuid.UUID | None = Query(None),
+        date_from: date | None = Query(None),
+        date_to: date | None = Query(None),
+        search: str | None = Query(None),
+        search_mode: SearchMode = Query("contains"),
+    ):
+        self.type = type
+        self.account_id = account_id
+        self.category_id = category_id
+        self.date_from = date_from
+        self.date_to = date_to
+        self.search = search
+        self.search_mode = search_mode
+
+    def clauses(self, user_id: uuid.UUID) -> ColumnElement[bool]:
+        clauses = [Transaction.user_id == user_id]
+        if self.type:
+            clauses.append(Transaction.type == self.type)
+        if self.account_id:
+            clauses.append(Transaction.account_id == self.account_id)
+        if self.category_id:
+            clauses.append(Transaction.category_id == self.category_id)
+        if self.date_from or self.date_to:
+            clauses.append(custom_period(self.date_from, self.date_to).contains(Transaction.date))
+        if self.search:
+            clauses.append(self._search_clause())
+        return and_(*clauses)
+
+    def _search_clause(self) -> ColumnElement[bool]:
+        if self.search_mode == "fuzzy":
+            return literal(self.search, Text).op("<%", is_comparison=True)(Transaction.description)
+        if self.search_mode == "fts":
+            return Transaction.search_vector.bool_op("@@")(
+                func.websearch_to_tsquery(SEARCH_CONFIG, self.search)
+            )
+        if self.search_mode == "prefix":
+            words = re.findall(r"\w+", self.search)
+            if words:
+                query = " & ".join(f"{word}:*" for word in words)
+                return Transaction.search_vector.bool_op("@@")(
+                    func.to_tsquery(SEARCH_CONFIG, query)
+                )
+        return Transaction.description.ilike(f"%{_escape_like(self.search)}%")
+
+    def rank(self) -> ColumnElement[float] | None:
+        """Relevance score to order by, for the ranked search modes."""
+        if not self.search:
+            return None
+        if self.search_mode == "fuzzy":
+            return func.word_similarity(literal(self.search, Text), Transaction.description)
+        if self.search_mode == "fts":
+            return func.ts_rank(
+                Transaction.search_vector, func.websearch_to_tsquery(SEARCH_CONFIG, self.search)
+            )
+        return None
+
+
+LIST_ORDER = (Transaction.date.desc(), Transaction.created_at.desc(), Transaction.id.desc())
+
+
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
 
 @router.get("", response_model=TransactionListResponse)
 async def list_transactions(
-    type: TransactionType | None = Query(None),
-    account_id: uuid.UUID | None = Query(None),
-    category_id: uuid.UUID | None = Query(None),
-    date_from: date | None = Query(None),
-    date_to: date | None = Query(None),
-    search: str | None = Query(None),
+    filters: TransactionFilters = Depends(),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    paginate: Literal["offset", "cursor"] = Query("offset"),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(False),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    base = select(Transaction).where(Transaction.user_id == current_user.id)
-    if type:
-        base = base.where(Transaction.type == type)
-    if account_id:
-        base = base.where(Transaction.account_id == account_id)
-    if category_id:
-        base = base.where(Transaction.category_id == category_id)
-    if date_from:
-        base = base.where(Transaction.date >= date_from)
-    if date_to:
-        base = base.where(Transaction.date <= date_to)
-    if search:
-        base = base.where(Transaction.description.ilike(f"%{_escape_like(search)}%"))
-
-    count_result = await db.execute(select(func.count()).select_from(base.subquery()))
-    total = count_result.scalar_one()
-
-    items_result = await db.execute(
-        base.order_by(Transaction.date.desc(), Transaction.created_at.desc())
-        .limit(limit).offset(offset)
+    """List transactions newest first.
+
+    Offset mode (default) returns an exact ``total`` with every page.
+    Cursor mode (``paginate=cursor`` or any ``cursor``) seeks on
+    (date, created_at, id) so deep pages cost the same as the first one,
+    skips the count unless ``include_total=true``, and returns
+    ``next_cursor`` until the last page.
+
+    Ranked searches (``search_mode=fuzzy|fts``) order by relevance first and
+    only support offset pagination.
+    """
+    base = select(Transaction).where(filters.clauses(current_user.id))
+    rank = filters.rank()
+    if rank is not None and (paginate == "cursor" or cursor is not None):
+        raise HTTPException(
+            status_code=400, detail="Cursor pagination is not supported for ranked search"
+        )
+    ordered = base.order_by(*((rank.desc(),) if rank is not None else ()), *LIST_ORDER)
+
+    if paginate == "offset" and cursor is None:
+        count_result = await db.execute(select(func.count()).select_from(base.subquery()))
+        total = count_result.scalar_one()
+        items_result = await db.execute(ordered.limit(limit).offset(offset))
+        return {"items": items_result.scalars().all(), "total": total}
+
+    total = None
+    if include_total:
+        count_result = await db.execute(select(func.count()).select_from(base.subquery()))
+        total = count_result.scalar_one()
+
+    if cursor:
+        c_date, c_created_at, c_id = _decode_cursor(cursor)
+        ordered = ordered.where(
+            # Redundant with the row comparison, but gives the planner a plain
+            # range on ix_transactions_user_date to seek from.
+            Transaction.date <= c_date,
+            tuple_(Transaction.date, Transaction.created_at, Transaction.id)
+            < tuple_(c_date, c_created_at, c_id),
+        )
+    # Fetch one extra row to learn whether another page exists.
+    items_result = await db.execute(ordered.limit(limit + 1))
+    items = items_result.scalars().all()
+    next_cursor = _encode_cursor(items[limit - 1]) if len(items) > limit else None
+    return {"items": items[:limit], "total": total, "next_cursor": next_cursor}
+
+
+EXPORT_COLUMNS = (
+    Transaction.id, Transaction.date, Transaction.type, Transaction.sub_type,
+    Transaction.amount, Transaction.fee_amount, Transaction.description,
+    Transaction.account_id, Transaction.to_account_id, Transaction.category_id,
+    Transaction.fee_category_id, Transaction.source, Transaction.created_at,
+)
+EXPORT_BATCH = 2000
+
+
+def _export_value(value):
+    if value is None:
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return str(value)
+
+
+@router.get("/export")
+async def export_transactions(
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    filters: TransactionFilters = Depends(),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Stream every matching transaction as CSV or NDJSON, newest first.
+
+    Rows come off a server-side cursor EXPORT_BATCH at a time as plain
+    tuples (no ORM identity map), so memory stays flat however long the
+    history is.
+    """
+    stmt = (
+        select(*EXPORT_COLUMNS)
+        .where(filters.clauses(current_user.id))
+        .order_by(*LIST_ORDER)
+        .execution_options(yield_per=EXPORT_BATCH)
+    )
+    names = [c.key for c in EXPORT_COLUMNS]
+
+    async def body() -> AsyncIterator[str]:
+        result = await db.stream(stmt)
+        if format == "csv":
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(names)
+            async for batch in result.partitions():
+                writer.writerows([[_export_value(v) for v in row] for row in batch])
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+            if buf.tell():
+                yield buf.getvalue()
+        else:
+            async for batch in result.partitions():
+                yield "".join(
+                    json.dumps(dict(zip(names, map(_export_value, row)))) + "\n" for row in batch
+                )
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="transactions.{format}"'},
     )
-    return {"items": items_result.scalars().all(), "total": total}
 
 
 @router.post("", response_model=TransactionResponse, status_code=201)
@@ -71,10 +274,75 @@ async def create_transaction(
     db.add(txn)
     await db.commit()
     await db.refresh(txn)
-    check_budget_alerts_task.delay(str(current_user.id))
+    schedule_budget_alerts(current_user.id)
     return txn
 
 
+@router.post("/bulk", response_model=TransactionBulkResponse, status_code=201)
+async def create_transactions_bulk(
+    data: TransactionBulkCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create up to 5,000 transactions in one database transaction.
+
+    Every row is validated with the TransactionCreate rules and its account and
+    category references are checked against what the user owns. In ``atomic``
+    mode (default) any invalid row rejects the whole batch with 422; in
+    ``partial`` mode valid rows are saved and invalid ones are reported by index.
+    """
+    valid: list[tuple[int, TransactionCreate]] = []
+    errors: list[dict] = []
+    for index, raw in enumerate(data.rows):
+        try:
+            valid.append((index, TransactionCreate.model_validate(raw)))
+        except ValidationError as exc:
+            errors.append({"index": index, "errors": [
+                f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}" for err in exc.errors()
+            ]})
+
+    # Unknown or foreign references would fail the whole INSERT on a foreign
+    # key, so resolve them up front with one query per table.
+    account_ids = {r.account_id for _, r in valid} | {r.to_account_id for _, r in valid if r.to_account_id}
+    category_ids = {c for _, r in valid for c in (r.category_id, r.fee_category_id) if c}
+    owned_accounts = set((await db.execute(
+        select(Account.id).where(Account.user_id == current_user.id, Account.id.in_(account_ids))
+    )).scalars()) if account_ids else set()
+    visible_categories = set((await db.execute(
+        select(Category.id).where(
+            Category.id.in_(category_ids),
+            or_(Category.user_id == current_user.id, Category.user_id.is_(None)),
+        )
+    )).scalars()) if category_ids else set()
+
+    rows: list[dict] = []
+    for index, row in valid:
+        problems = [
+            f"{field}: not found"
+            for field, value, known in (
+                ("account_id", row.account_id, owned_accounts),
+                ("to_account_id", row.to_account_id, owned_accounts),
+                ("category_id", row.category_id, visible_categories),
+                ("fee_category_id", row.fee_category_id, visible_categories),
+            )
+            if value is not None and value not in known
+        ]
+        if problems:
+            errors.append({"index": index, "errors": problems})
+            continue
+        rows.append({**row.model_dump(), "user_id": current_user.id, "created_by": current_user.id})
+
+    errors.sort(key=lambda e: e["index"])
+    if errors and data.mode == "atomic":
+        raise HTTPException(status_code=422, detail=errors)
+
+    created = await insert_transactions(db, rows)
+    await db.commit()
+    if created:
+        schedule_budget_alerts(current_user.id)
+    return {"created": created, "errors": errors}
+
+
 @router.patch("/{transaction_id}", response_model=TransactionResponse)
 async def update_transaction(
     transaction_id: uuid.UUID,
@@ -95,7 +363,7 @@ async def update_transaction(
         setattr(txn, field, value)
     await db.commit()
     await db.refresh(txn)
-    check_budget_alerts_task.delay(str(current_user.id))
+    schedule_budget_alerts(current_user.id)
     return txn
 
 
@@ -116,3 +384,6 @@ async def delete_transaction(
         raise HTTPException(status_code=404, detail="Transaction not found")
     await db.delete(txn)
     await db.commit()
+    # Same debounce as create/update, so a burst ending in deletes is
+    # evaluated on its final state.
+    schedule_budget_alerts(current_user.id)
@@ -1,5 +1,7 @@
 import uuid
+import datetime as _dt
 from decimal import Decimal
+from typing import Literal
 from pydantic import BaseModel
 from app.models.account import AccountType
 from app.schemas.institution import InstitutionBrief
@@ -34,3 +36,20 @@ class AccountResponse(BaseModel):
     is_active: bool
 
     model_config = {"from_attributes": True}
+
+
+class BalancePoint(BaseModel):
+    date: _dt.date  # end of the bucket; balance is as of close of this day
+    balance: Decimal
+
+
+class BalanceHistoryResponse(BaseModel):
+    account_id: uuid.UUID
+    granularity: Literal["day", "week", "month"]
+    points: list[BalancePoint]
+
+
+class BalanceAsOfResponse(BaseModel):
+    account_id: uuid.UUID
+    as_of: _dt.date
+    balance: Decimal
@@ -1,7 +1,8 @@
 import uuid
 import datetime as _dt
 from decimal import Decimal
-from pydantic import BaseModel, model_validator
+from typing import Any, Literal
+from pydantic import BaseModel, Field, model_validator
 from app.models.transaction import TransactionType, TransactionSubType, TransactionSource
 
 date = _dt.date
@@ -78,4 +79,22 @@ class TransactionResponse(BaseModel):
 
 class TransactionListResponse(BaseModel):
     items: list[TransactionResponse]
-    total: int
+    total: int | None  # None in cursor mode unless include_total=true
+    next_cursor: str | None = None
+
+
+class TransactionBulkCreate(BaseModel):
+    # Rows are validated one by one against TransactionCreate so a bad row
+    # can be reported by index instead of failing the whole request body.
+    rows: list[dict[str, Any]] = Field(min_length=1, max_length=5000)
+    mode: Literal["atomic", "partial"] = "atomic"
+
+
+class BulkRowError(BaseModel):
+    index: int
+    errors: list[str]
+
+
+class TransactionBulkResponse(BaseModel):
+    created: list[TransactionResponse]
+    errors: list[BulkRowError]
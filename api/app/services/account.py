@@ -1,8 +1,12 @@
 import uuid
+from datetime import date, timedelta
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, case, func
-from app.models.transaction import Transaction, TransactionType
+from sqlalchemy import select, func
+from app.models.account import Account
+from app.models.account_balance import AccountBalance
+from app.models.account_daily_delta import AccountDailyDelta
+from app.services.periods import month_of, week_of
 
 
 async def compute_current_balance(
@@ -15,141 +19,97 @@ async def compute_current_balance(
         - SUM(expense transactions)
         - SUM(transfer-out transactions where account_id = account_id)
         - SUM(fee_amount on all transactions from this account)
-    """
 
+    The transaction sums are read from the account_balances ledger
+    (see app/services/ledger.py) instead of being rescanned.
+    """
     result = await db.execute(
-        select(
-            func.coalesce(
-                func.sum(
-                    case(
-                        (Transaction.type == TransactionType.income, Transaction.amount),
-                        else_=Decimal("0.00"),
-                    )
-                ),
-                Decimal("0.00"),
-            ).label("income"),
-            func.coalesce(
-                func.sum(
-                    case(
-                        (Transaction.type == TransactionType.expense, Transaction.amount),
-                        else_=Decimal("0.00"),
-                    )
-                ),
-                Decimal("0.00"),
-            ).label("expense"),
-            func.coalesce(
-                func.sum(
-                    case(
-                        (Transaction.type == TransactionType.transfer, Transaction.amount),
-                        else_=Decimal("0.00"),
-                    )
-                ),
-                Decimal("0.00"),
-            ).label("transfer_out"),
-            func.coalesce(
-                func.sum(func.coalesce(Transaction.fee_amount, Decimal("0.00"))),
-                Decimal("0.00"),
-            ).label("fees"),
-        ).where(Transaction.account_id == account_id)
-    )
-    row = result.one()
-
-    # Transfer-in: transactions where to_account_id = this account
-    transfer_in_result = await db.execute(
-        select(
-            func.coalesce(func.sum(Transaction.amount), Decimal("0.00"))
-        ).where(
-            Transaction.to_account_id == account_id,
-            Transaction.type == TransactionType.transfer,
-        )
-    )
-    transfer_in = transfer_in_result.scalar() or Decimal("0.00")
-
-    return (
-        opening_balance
-        + row.income
-        + transfer_in
-        - row.expense
-        - row.transfer_out
-        - row.fees
+        select(AccountBalance.transactions_net).where(AccountBalance.account_id == account_id)
     )
+    return opening_balance + (result.scalar_one_or_none() or Decimal("0.00"))
+
+
+async def load_accounts(
+    db: AsyncSession, account_ids
+) -> dict[uuid.UUID, Account]:
+    """Load many accounts (with their institutions) in one query, keyed by id."""
+    account_ids = set(account_ids)
+    if not account_ids:
+        return {}
+    result = await db.execute(select(Account).where(Account.id.in_(account_ids)))
+    return {a.id: a for a in result.scalars().all()}
 
 
 async def compute_balances_bulk(
     db: AsyncSession, accounts: list
 ) -> dict[uuid.UUID, Decimal]:
-    """Compute current balance for many accounts in 2 queries instead of 2*N."""
+    """Compute current balance for many accounts in one ledger lookup."""
     if not accounts:
         return {}
 
     account_ids = [a.id for a in accounts]
-    opening = {a.id: a.opening_balance for a in accounts}
-
-    # Outgoing aggregation: income, expense, transfer-out, fees per account
-    outgoing_result = await db.execute(
-        select(
-            Transaction.account_id,
-            func.coalesce(
-                func.sum(
-                    case(
-                        (Transaction.type == TransactionType.income, Transaction.amount),
-                        else_=Decimal("0.00"),
-                    )
-                ),
-                Decimal("0.00"),
-            ).label("income"),
-            func.coalesce(
-                func.sum(
-                    case(
-                        (Transaction.type == TransactionType.expense, Transaction.amount),
-                        else_=Decimal("0.00"),
-                    )
-                ),
-                Decimal("0.00"),
-            ).label("expense"),
-            func.coalesce(
-                func.sum(
-                    case(
-                        (Transaction.type == TransactionType.transfer, Transaction.amount),
-                        else_=Decimal("0.00"),
-                    )
-                ),
-                Decimal("0.00"),
-            ).label("transfer_out"),
-            func.coalesce(
-                func.sum(func.coalesce(Transaction.fee_amount, Decimal("0.00"))),
-                Decimal("0.00"),
-            ).label("fees"),
-        )
-        .where(Transaction.account_id.in_(account_ids))
-        .group_by(Transaction.account_id)
+    result = await db.execute(
+        select(AccountBalance.account_id, AccountBalance.transactions_net)
+        .where(AccountBalance.account_id.in_(account_ids))
     )
-    outgoing_map: dict[uuid.UUID, tuple] = {}
-    for row in outgoing_result:
-        outgoing_map[row.account_id] = (row.income, row.expense, row.transfer_out, row.fees)
-
-    # Transfer-in aggregation
-    transfer_in_result = await db.execute(
-        select(
-            Transaction.to_account_id,
-            func.coalesce(func.sum(Transaction.amount), Decimal("0.00")).label("transfer_in"),
+    net = {row.account_id: row.transactions_net for row in result}
+    return {
+        a.id: a.opening_balance + net.get(a.id, Decimal("0.00"))
+        for a in accounts
+    }
+
+
+async def compute_balance_as_of(db: AsyncSession, account: Account, as_of: date) -> Decimal:
+    """Balance at close of ``as_of``: opening_balance + every daily delta up to it."""
+    result = await db.execute(
+        select(func.coalesce(func.sum(AccountDailyDelta.delta), Decimal("0.00"))).where(
+            AccountDailyDelta.account_id == account.id,
+            AccountDailyDelta.date <= as_of,
         )
+    )
+    return account.opening_balance + result.scalar_one()
+
+
+def _bucket_end(day: date, granularity: str) -> date:
+    if granularity == "week":
+        return week_of(day).last_day
+    if granularity == "month":
+        return month_of(day).last_day
+    return day
+
+
+async def compute_balance_history(
+    db: AsyncSession,
+    account: Account,
+    date_from: date,
+    date_to: date,
+    granularity: str = "day",
+) -> list[dict]:
+    """Closing balance per day/week/month between date_from and date_to inclusive.
+
+    Two index range reads on account_daily_deltas (the sum before the window
+    and the deltas inside it) regardless of how much history the account has.
+    Week buckets end on Sunday, month buckets on the last day of the month;
+    the final bucket is clipped to date_to.
+    """
+    balance = await compute_balance_as_of(db, account, date_from - timedelta(days=1))
+    result = await db.execute(
+        select(AccountDailyDelta.date, AccountDailyDelta.delta)
         .where(
-            Transaction.to_account_id.in_(account_ids),
-            Transaction.type == TransactionType.transfer,
+            AccountDailyDelta.account_id == account.id,
+            AccountDailyDelta.date >= date_from,
+            AccountDailyDelta.date <= date_to,
         )
-        .group_by(Transaction.to_account_id)
+        .order_by(AccountDailyDelta.date)
     )
-    transfer_in_map: dict[uuid.UUID, Decimal] = {}
-    for row in transfer_in_result:
-        transfer_in_map[row.to_account_id] = row.transfer_in
-
-    # Compute final balances
-    result: dict[uuid.UUID, Decimal] = {}
-    for acc_id in account_ids:
-        income, expense, transfer_out, fees = outgoing_map.get(
-            acc_id, (Decimal("0.00"), Decimal("0.00"), Decimal("0.00"), Decimal("0.00"))
-        )
-        transfer_in = transfer_in_map.get(acc_id, Decimal("0.00"))
-        result[acc_id] = opening[acc_id] + income + transfer_in - expense - transfer_out - fees
-    return result
+    deltas = {row.date: row.delta for row in result}
+
+    points = []
+    day = date_from
+    while day <= date_to:
+        end = min(_bucket_end(day, granularity), date_to)
+        while day <= end:
+            balance += deltas.get(day, Decimal("0.00"))
+            day += timedelta(days=1)
+        points.append({"date": end, "balance": balance})
+    return points
@@ -1,14 +1,19 @@
 import uuid
+from collections import defaultdict
 from datetime import date
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, extract
+from sqlalchemy import insert, select
 from app.models.budget import Budget
-from app.models.transaction import Transaction
+from app.models.monthly_rollup import MonthlyRollup
+from app.models.transaction import TransactionType
 from app.models.notification import Notification, NotificationType
-from app.services.discord import send_discord_notification
+from app.services.discord import embed, send_discord_embeds
+from app.services.periods import month_of
 from app.services.pubsub import publish_notification
-from app.services.web_push import send_push_to_user
+from app.services.web_push import Push, send_pushes
+
+BUDGET_ALERT_TYPES = (NotificationType.budget_warning, NotificationType.budget_exceeded)
 
 
 async def check_budget_alerts(db: AsyncSession, user_id: uuid.UUID) -> None:
@@ -16,76 +21,106 @@ async def check_budget_alerts(db: AsyncSession, user_id: uuid.UUID) -> None:
 
     Called synchronously after every transaction write. Idempotent per month:
     at most one warning and one exceeded notification per budget per calendar month.
+
+    Fixed cost regardless of budget count: budgets, this month's spending and
+    this month's existing alerts are read with one query each, and new
+    notifications are written with one multi-row INSERT.
     """
-    today = date.today()
-    month_start = today.replace(day=1)
+    month_start = month_of(date.today()).start
 
     budgets_result = await db.execute(
         select(Budget).where(Budget.user_id == user_id)
     )
     budgets = budgets_result.scalars().all()
+    if not budgets:
+        return
+
+    spending = await compute_budget_spending(db, user_id, budgets, month_start)
+    already_sent = await _sent_this_month(db, user_id, month_start)
 
+    pending = []
     for budget in budgets:
         if budget.amount == 0:
             continue
 
-        spent = await get_month_spending(db, user_id, budget, month_start)
-        percent = float(spent / budget.amount * 100)
-
+        percent = float(spending[budget.id] / budget.amount * 100)
         if percent >= 100 and budget.alert_at_100:
-            await _maybe_notify(
-                db, user_id, budget, NotificationType.budget_exceeded, percent, spent
-            )
+            notif_type = NotificationType.budget_exceeded
         elif percent >= 80 and budget.alert_at_80:
-            await _maybe_notify(
-                db, user_id, budget, NotificationType.budget_warning, percent, spent
-            )
+            notif_type = NotificationType.budget_warning
+        else:
+            continue
+        if (str(budget.id), notif_type) in already_sent:
+            continue  # Already notified this month for this budget+type
+        pending.append(_notification_values(user_id, budget, notif_type, percent))
+
+    if not pending:
+        return
+    result = await db.execute(
+        insert(Notification)
+        .values(pending)
+        .returning(Notification.id, Notification.type, Notification.title, Notification.message)
+    )
+    created = result.all()
+    await db.commit()
+    await send_discord_embeds([embed(n.title, n.message) for n in created])
+    for n in created:
+        await publish_notification(user_id, {"id": str(n.id), "type": NotificationType(n.type).value, "title": n.title, "message": n.message})
+    await send_pushes(db, [Push(user_id, n.title, n.message) for n in created])
 
 
-async def get_month_spending(
+async def compute_budget_spending(
     db: AsyncSession,
     user_id: uuid.UUID,
-    budget: "Budget",
+    budgets: list[Budget],
     month_start: date,
-) -> Decimal:
-    from app.models.transaction import TransactionType
-    q = select(func.coalesce(func.sum(Transaction.amount), Decimal(0))).where(
-        Transaction.user_id == user_id,
-        Transaction.type == TransactionType.expense,
-        Transaction.date >= month_start,
-        extract("month", Transaction.date) == month_start.month,
-        extract("year", Transaction.date) == month_start.year,
+) -> dict[uuid.UUID, Decimal]:
+    """Expense total for the month per budget, from one read of monthly_rollups."""
+    result = await db.execute(
+        select(MonthlyRollup.category_id, MonthlyRollup.account_id, MonthlyRollup.total)
+        .where(
+            MonthlyRollup.user_id == user_id,
+            MonthlyRollup.month == month_start,
+            MonthlyRollup.type == TransactionType.expense,
+        )
     )
-    if budget.type == "category" and budget.category_id:
-        q = q.where(Transaction.category_id == budget.category_id)
-    elif budget.type == "account" and budget.account_id:
-        q = q.where(Transaction.account_id == budget.account_id)
-    result = await db.execute(q)
-    value = result.scalar()
-    return Decimal(value).quantize(Decimal("0.01")) if value is not None else Decimal("0.00")
+    by_category: dict[uuid.UUID, Decimal] = defaultdict(Decimal)
+    by_account: dict[uuid.UUID, Decimal] = defaultdict(Decimal)
+    for row in result:
+        if row.category_id is not None:
+            by_category[row.category_id] += row.total
+        by_account[row.account_id] += row.total
 
+    spending: dict[uuid.UUID, Decimal] = {}
+    for budget in budgets:
+        if budget.type == "category":
+            spent = by_category.get(budget.category_id, Decimal("0.00"))
+        else:
+            spent = by_account.get(budget.account_id, Decimal("0.00"))
+        spending[budget.id] = Decimal(spent).quantize(Decimal("0.01"))
+    return spending
 
-async def _maybe_notify(
-    db: AsyncSession,
-    user_id: uuid.UUID,
-    budget: Budget,
-    notif_type: NotificationType,
-    percent: float,
-    spent: Decimal,
-) -> None:
-    """Create notification only if one doesn't already exist this month."""
-    month_start = date.today().replace(day=1)
-    existing = await db.execute(
-        select(Notification).where(
+
+async def _sent_this_month(
+    db: AsyncSession, user_id: uuid.UUID, month_start: date
+) -> set[tuple[str, NotificationType]]:
+    """(budget_id, type) pairs already alerted this month."""
+    result = await db.execute(
+        select(Notification.metadata_["budget_id"].astext, Notification.type).where(
             Notification.user_id == user_id,
-            Notification.type == notif_type,
-            Notification.metadata_["budget_id"].astext == str(budget.id),
+            Notification.type.in_(BUDGET_ALERT_TYPES),
             Notification.created_at >= month_start,
         )
     )
-    if existing.scalar_one_or_none():
-        return  # Already notified this month for this budget+type
+    return {(budget_id, NotificationType(notif_type)) for budget_id, notif_type in result}
+
 
+def _notification_values(
+    user_id: uuid.UUID,
+    budget: Budget,
+    notif_type: NotificationType,
+    percent: float,
+) -> dict:
     label = "category" if budget.type == "category" else "account"
     is_warning = notif_type == NotificationType.budget_warning
     title = f"Budget {'Warning' if is_warning else 'Exceeded'}"
@@ -93,15 +128,10 @@ async def _maybe_notify(
         f"You've spent {percent:.1f}% of your {label} budget "
         f"(₱{budget.amount:,.2f})."
     )
-    n = Notification(
-        user_id=user_id,
-        type=notif_type,
-        title=title,
-        message=message,
-        metadata_={"budget_id": str(budget.id), "percent": percent},
-    )
-    db.add(n)
-    await db.commit()
-    await send_discord_notification(title, message)
-    await publish_notification(user_id, {"id": str(n.id), "type": notif_type.value, "title": title, "message": message})
-    await send_push_to_user(user_id, title, message)
+    return {
+        "user_id": user_id,
+        "type": notif_type.value,
+        "title": title,
+        "message": message,
+        "metadata": {"budget_id": str(budget.id), "percent": percent},
+    }
@@ -1,11 +1,10 @@
 import uuid
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from app.models.credit_line import CreditLine
 from app.models.credit_card import CreditCard
 from app.models.account import Account
-from app.services.account import compute_balances_bulk
+from app.services.account import compute_balances_bulk, load_accounts
 
 
 async def compute_line_available_credit(
@@ -18,22 +17,41 @@ async def compute_line_available_credit(
     Credit card accounts carry negative balances (debt), so adding them reduces availability.
     Returns None if total_limit is not set.
     """
-    if credit_line.available_override is not None:
-        return credit_line.available_override
-    if credit_line.total_limit is None:
-        return None
+    available = await compute_lines_available_credit(db, [credit_line])
+    return available[credit_line.id]
 
-    cards = credit_line.cards  # loaded via selectin
-    if not cards:
-        return credit_line.total_limit
 
-    account_ids = [c.account_id for c in cards]
-    result = await db.execute(select(Account).where(Account.id.in_(account_ids)))
-    accounts = result.scalars().all()
+async def compute_lines_available_credit(
+    db: AsyncSession,
+    credit_lines: list[CreditLine],
+) -> dict[uuid.UUID, Decimal | None]:
+    """
+    compute_line_available_credit for many lines, keyed by line id. Card
+    accounts across every line are loaded and balanced together, so the
+    query count doesn't grow with the number of lines.
+    """
+    pending = [
+        line for line in credit_lines
+        if line.available_override is None and line.total_limit is not None
+    ]
+    accounts = await load_accounts(
+        db, [card.account_id for line in pending for card in line.cards]  # cards loaded via selectin
+    )
+    balances = await compute_balances_bulk(db, list(accounts.values()))
 
-    balances = await compute_balances_bulk(db, list(accounts))
-    total_balance = sum(balances.values(), Decimal("0.00"))
-    return credit_line.total_limit + total_balance
+    available: dict[uuid.UUID, Decimal | None] = {}
+    for line in credit_lines:
+        if line.available_override is not None:
+            available[line.id] = line.available_override
+        elif line.total_limit is None:
+            available[line.id] = None
+        else:
+            account_ids = {card.account_id for card in line.cards}
+            total_balance = sum(
+                (balances[a] for a in account_ids if a in balances), Decimal("0.00")
+            )
+            available[line.id] = line.total_limit + total_balance
+    return available
 
 
 async def compute_card_available_credit(
@@ -46,16 +64,35 @@ async def compute_card_available_credit(
     Otherwise: credit_limit + current_account_balance.
     Returns None if credit_limit is not set.
     """
-    if card.available_override is not None:
-        return card.available_override
-    if card.credit_limit is None:
-        return None
+    accounts = await load_accounts(db, [card.account_id])
+    available = await compute_cards_available_credit(db, [card], accounts)
+    return available[card.id]
+
 
-    result = await db.execute(select(Account).where(Account.id == card.account_id))
-    account = result.scalar_one_or_none()
-    if account is None:
-        return None
+async def compute_cards_available_credit(
+    db: AsyncSession,
+    cards: list[CreditCard],
+    accounts: dict[uuid.UUID, Account],
+) -> dict[uuid.UUID, Decimal | None]:
+    """
+    compute_card_available_credit for many standalone cards, keyed by card id.
+    ``accounts`` must hold the cards' accounts (see load_accounts); balances
+    for all of them come from a single compute_balances_bulk call.
+    """
+    pending = [
+        c for c in cards
+        if c.available_override is None and c.credit_limit is not None and c.account_id in accounts
+    ]
+    balances = await compute_balances_bulk(
+        db, list({c.account_id: accounts[c.account_id] for c in pending}.values())
+    )
 
-    balances = await compute_balances_bulk(db, [account])
-    balance = balances.get(account.id, Decimal("0.00"))
-    return card.credit_limit + balance
+    available: dict[uuid.UUID, Decimal | None] = {}
+    for card in cards:
+        if card.available_override is not None:
+            available[card.id] = card.available_override
+        elif card.credit_limit is None or card.account_id not in accounts:
+            available[card.id] = None
+        else:
+            available[card.id] = card.credit_limit + balances.get(card.account_id, Decimal("0.00"))
+    return available
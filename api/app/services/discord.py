@@ -1,28 +1,148 @@
+"""Discord webhook notifications.
+
+Messages go through a per-process outbox. A single sender task takes up to
+MAX_EMBEDS queued embeds at a time and posts them in one webhook call, over
+a long-lived pooled httpx client. The API lifespan closes the client, and
+so does the Celery task runtime. A 429 is retried after the delay Discord
+asks for. 5xx responses are retried with exponential backoff. When the
+rate-limit headers say the bucket is empty, the next call waits for the
+reset.
+
+Sending only queues the embeds; callers don't wait for delivery (or its
+retry sleeps) unless they pass wait=True. Delivery stays best-effort: a
+Discord failure never breaks the app, and responses that are neither sent
+nor retried are logged with their status code.
+"""
+import asyncio
+import time
 import httpx
 from app.core.config import settings
+from app.core.logging import log
+
+DEFAULT_COLOR = 0x5865F2
+MAX_EMBEDS = 10  # Discord's limit per webhook message
+LINGER_SECONDS = 0.05
+MAX_ATTEMPTS = 5
+RETRY_STATUSES = (500, 502, 503, 504)
+
+_loop: asyncio.AbstractEventLoop | None = None
+_client: httpx.AsyncClient | None = None
+_outbox: asyncio.Queue | None = None
+_sender: asyncio.Task | None = None
+_resume_at = 0.0
+
+
+def embed(title: str, message: str, color: int = DEFAULT_COLOR) -> dict:
+    return {"title": title, "description": message, "color": color}
+
+
+def _state() -> asyncio.Queue:
+    global _loop, _client, _outbox, _sender
+    loop = asyncio.get_running_loop()
+    # Clients and queues belong to the loop that created them
+    if _loop is not loop:
+        _loop, _client, _outbox, _sender = loop, None, None, None
+    if _client is None:
+        _client = httpx.AsyncClient(timeout=10)
+    if _outbox is None:
+        _outbox = asyncio.Queue()
+    if _sender is None or _sender.done():
+        _sender = asyncio.create_task(_send_loop(_client, _outbox), name="discord-sender")
+    return _outbox
 
 
 async def send_discord_notification(
     title: str,
     message: str,
-    color: int = 0x5865F2,
+    color: int = DEFAULT_COLOR,
+    *,
+    wait: bool = False,
 ) -> None:
     """Send a notification to Discord webhook. Silently skipped if URL not configured."""
-    if not settings.discord_webhook_url:
+    await send_discord_embeds([embed(title, message, color)], wait=wait)
+
+
+async def send_discord_embeds(embeds: list[dict], *, wait: bool = False) -> None:
+    """Queue embeds for the webhook.
+
+    Returns once they are queued. With ``wait=True``, returns only after
+    they are sent or given up on.
+    """
+    if not settings.discord_webhook_url or not embeds:
         return
+    outbox = _state()
+    futures = []
+    for item in embeds:
+        future = asyncio.get_running_loop().create_future() if wait else None
+        outbox.put_nowait((item, future))
+        futures.append(future)
+    if wait:
+        await asyncio.gather(*futures)
+
+
+async def _send_loop(client: httpx.AsyncClient, outbox: asyncio.Queue) -> None:
+    while True:
+        batch = [await outbox.get()]
+        # Let concurrent senders add to this batch
+        await asyncio.sleep(LINGER_SECONDS)
+        while len(batch) < MAX_EMBEDS and not outbox.empty():
+            batch.append(outbox.get_nowait())
+        try:
+            await _post(client, [item for item, _ in batch])
+        except Exception as exc:
+            log.warning("discord.send_failed", embeds=len(batch), detail=str(exc))
+        finally:
+            for _, future in batch:
+                if future is not None and not future.done():
+                    future.set_result(None)
+                outbox.task_done()
+
+
+def _retry_after(r: httpx.Response) -> float:
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            await client.post(
-                settings.discord_webhook_url,
-                json={
-                    "embeds": [
-                        {
-                            "title": title,
-                            "description": message,
-                            "color": color,
-                        }
-                    ]
-                },
-            )
+        return float(r.json()["retry_after"])
     except Exception:
-        pass  # Never let Discord failure break the app
+        return float(r.headers.get("Retry-After", 1))
+
+
+async def _post(client: httpx.AsyncClient, embeds: list[dict]) -> None:
+    global _resume_at
+    for attempt in range(MAX_ATTEMPTS):
+        if (wait := _resume_at - time.monotonic()) > 0:
+            await asyncio.sleep(wait)
+        r = await client.post(settings.discord_webhook_url, json={"embeds": embeds})
+        if r.status_code == 429:
+            _resume_at = time.monotonic() + _retry_after(r)
+            log.info("discord.rate_limited", retry_after=_resume_at - time.monotonic())
+            continue
+        if r.status_code in RETRY_STATUSES:
+            _resume_at = time.monotonic() + 2 ** attempt
+            continue
+        if not r.is_success:
+            log.warning("discord.rejected", status=r.status_code, embeds=len(embeds))
+        elif r.headers.get("X-RateLimit-Remaining") == "0":
+            _resume_at = time.monotonic() + float(r.headers.get("X-RateLimit-Reset-After", 1))
+        return
+    log.warning("discord.gave_up", embeds=len(embeds), attempts=MAX_ATTEMPTS)
+
+
+async def close() -> None:
+    """Send what is queued (for up to a few seconds), then close the client."""
+    global _client, _sender
+    if _loop is not asyncio.get_running_loop():
+        return
+    if _outbox is not None:
+        try:
+            await asyncio.wait_for(_outbox.join(), timeout=5)
+        except asyncio.TimeoutError:
+            log.warning("discord.close_dropped", embeds=_outbox.qsize())
+    if _sender is not None:
+        _sender.cancel()
+        _sender = None
+    while _outbox is not None and not _outbox.empty():
+        _, future = _outbox.get_nowait()
+        if future is not None:
+            future.set_result(None)
+    if _client is not None:
+        await _client.aclose()
+        _client = None
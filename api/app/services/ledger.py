@@ -0,0 +1,296 @@
+"""Derived per-account aggregates kept in step with the transactions table.
+
+Every ORM insert, update and delete of a Transaction is turned into signed
+deltas and applied inside the same flush, so committed aggregates can never
+disagree with committed transactions:
+
+- account_balances: running net per account (current balance)
+- account_daily_deltas: net per account per day (balance history)
+- monthly_rollups: SUM(amount)/COUNT(*) per user, month, category, account
+  and type (analytics, budgets, dashboard)
+
+reconcile_ledgers() recomputes everything from scratch to detect and repair
+drift.
+"""
+import uuid
+from collections import defaultdict
+from collections.abc import Mapping
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import Connection, Date, case, cast, event, func, inspect, null, select, text, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.logging import log
+from app.models.account_balance import AccountBalance
+from app.models.account_daily_delta import AccountDailyDelta
+from app.models.category import Category
+from app.models.monthly_rollup import MonthlyRollup
+from app.models.transaction import Transaction, TransactionType
+from app.services.periods import month_of
+
+ZERO = Decimal("0.00")
+UPSERT_CHUNK = 1000
+
+# Transaction columns that feed the ledgers (all active_history=True).
+LEDGER_FIELDS = (
+    "user_id", "account_id", "to_account_id", "category_id", "type", "amount", "fee_amount", "date",
+)
+ROLLUP_KEYS = ("user_id", "month", "category_id", "account_id", "type")
+
+
+def _as_uuid(value) -> uuid.UUID:
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def _as_date(value) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(str(value))
+
+
+def _sort_key(key) -> tuple:
+    # Keys may contain NULLs (uncategorized rollups); order those last.
+    return tuple((k is None, k) for k in (key if isinstance(key, tuple) else (key,)))
+
+
+def balance_effects(values: Mapping) -> dict[uuid.UUID, Decimal]:
+    """Signed effect of one transaction on every account it touches.
+
+    Same semantics as the original full-scan balance query:
+    income adds, expense and transfer-out subtract, transfer-in adds to
+    to_account_id, and fee_amount is always charged to account_id.
+    """
+    txn_type = TransactionType(values["type"])
+    amount = Decimal(str(values["amount"]))
+    account_id = _as_uuid(values["account_id"])
+    effects: dict[uuid.UUID, Decimal] = defaultdict(Decimal)
+    effects[account_id] += amount if txn_type == TransactionType.income else -amount
+    if txn_type == TransactionType.transfer and values.get("to_account_id") is not None:
+        effects[_as_uuid(values["to_account_id"])] += amount
+    if values.get("fee_amount") is not None:
+        effects[account_id] -= Decimal(str(values["fee_amount"]))
+    return effects
+
+
+class LedgerDeltas:
+    """Accumulates the signed effects of transaction rows, then writes them
+    to every ledger table with one upsert per table."""
+
+    def __init__(self) -> None:
+        self.balances: dict[uuid.UUID, Decimal] = defaultdict(Decimal)
+        self.daily: dict[tuple[uuid.UUID, date], Decimal] = defaultdict(Decimal)
+        self.rollups: dict[tuple, tuple[Decimal, int]] = defaultdict(lambda: (ZERO, 0))
+
+    def add(self, values: Mapping, sign: int = 1) -> None:
+        day = _as_date(values["date"])
+        for account_id, delta in balance_effects(values).items():
+            self.balances[account_id] += sign * delta
+            self.daily[(account_id, day)] += sign * delta
+
+        category_id = values.get("category_id")
+        key = (
+            _as_uuid(values["user_id"]),
+            month_of(day).start,
+            _as_uuid(category_id) if category_id is not None else None,
+            _as_uuid(values["account_id"]),
+            TransactionType(values["type"]),
+        )
+        total, count = self.rollups[key]
+        self.rollups[key] = (total + sign * Decimal(str(values["amount"])), count + sign)
+
+    def apply(self, conn: Connection) -> None:
+        _upsert_increments(conn, AccountBalance, ("account_id",), ("transactions_net",), self.balances)
+        _upsert_increments(conn, AccountDailyDelta, ("account_id", "date"), ("delta",), self.daily)
+        _upsert_increments(conn, MonthlyRollup, ROLLUP_KEYS, ("total", "txn_count"), self.rollups)
+
+
+def _upsert_increments(
+    conn: Connection,
+    model: type,
+    keys: tuple[str, ...],
+    values: tuple[str, ...],
+    deltas: Mapping,
+) -> None:
+    """Add deltas to the ``values`` columns of ``model`` keyed by ``keys``,
+    inserting missing rows. A delta is a scalar for single-value tables and a
+    tuple aligned with ``values`` otherwise.
+
+    Rows are sorted so concurrent writers lock them in the same order.
+    """
+    rows = []
+    for key, delta in sorted(deltas.items(), key=lambda item: _sort_key(item[0])):
+        amounts = delta if isinstance(delta, tuple) else (delta,)
+        if not any(amounts):
+            continue
+        key = key if isinstance(key, tuple) else (key,)
+        rows.append({**dict(zip(keys, key)), **dict(zip(values, amounts))})
+    table = model.__table__
+    for i in range(0, len(rows), UPSERT_CHUNK):
+        stmt = pg_insert(table).values(rows[i:i + UPSERT_CHUNK])
+        set_ = {v: table.c[v] + stmt.excluded[v] for v in values}
+        if "updated_at" in table.c:
+            set_["updated_at"] = func.now()
+        conn.execute(stmt.on_conflict_do_update(index_elements=list(keys), set_=set_))
+
+
+def _current_values(target: Transaction) -> dict:
+    return {field: getattr(target, field) for field in LEDGER_FIELDS}
+
+
+def _previous_values(target: Transaction) -> dict:
+    state = inspect(target)
+    values = {}
+    for field in LEDGER_FIELDS:
+        history = state.attrs[field].history
+        values[field] = history.deleted[0] if history.deleted else getattr(target, field)
+    return values
+
+
+@event.listens_for(Transaction, "after_insert")
+def _on_insert(mapper, connection: Connection, target: Transaction) -> None:
+    deltas = LedgerDeltas()
+    deltas.add(_current_values(target))
+    deltas.apply(connection)
+
+
+@event.listens_for(Transaction, "after_update")
+def _on_update(mapper, connection: Connection, target: Transaction) -> None:
+    deltas = LedgerDeltas()
+    deltas.add(_previous_values(target), sign=-1)
+    deltas.add(_current_values(target))
+    deltas.apply(connection)
+
+
+@event.listens_for(Transaction, "before_delete")
+def _on_delete(mapper, connection: Connection, target: Transaction) -> None:
+    deltas = LedgerDeltas()
+    deltas.add(_previous_values(target), sign=-1)
+    deltas.apply(connection)
+
+
+@event.listens_for(Category, "before_delete")
+def _on_category_delete(mapper, connection: Connection, target: Category) -> None:
+    """Fold the category's rollups into the uncategorized bucket.
+
+    transactions.category_id is SET NULL by the database, so its totals move
+    to category_id IS NULL; the old rollup rows then go with the category's
+    ON DELETE CASCADE.
+    """
+    table = MonthlyRollup.__table__
+    stmt = pg_insert(table).from_select(
+        [*ROLLUP_KEYS, "total", "txn_count"],
+        select(
+            table.c.user_id, table.c.month, null(), table.c.account_id, table.c.type,
+            table.c.total, table.c.txn_count,
+        ).where(table.c.category_id == target.id),
+    )
+    connection.execute(stmt.on_conflict_do_update(
+        index_elements=list(ROLLUP_KEYS),
+        set_={
+            "total": table.c.total + stmt.excluded.total,
+            "txn_count": table.c.txn_count + stmt.excluded.txn_count,
+            "updated_at": func.now(),
+        },
+    ))
+
+
+def _transaction_effects():
+    """Ground truth: one signed (account_id, date, delta) row per effect."""
+    outgoing = select(
+        Transaction.account_id.label("account_id"),
+        Transaction.date.label("date"),
+        (
+            case(
+                (Transaction.type == TransactionType.income, Transaction.amount),
+                else_=-Transaction.amount,
+            )
+            - func.coalesce(Transaction.fee_amount, ZERO)
+        ).label("delta"),
+    )
+    incoming = select(
+        Transaction.to_account_id.label("account_id"),
+        Transaction.date.label("date"),
+        Transaction.amount.label("delta"),
+    ).where(
+        Transaction.type == TransactionType.transfer,
+        Transaction.to_account_id.is_not(None),
+    )
+    return union_all(outgoing, incoming).subquery()
+
+
+def _effects_grouped_by(*keys: str):
+    effects = _transaction_effects()
+    cols = [effects.c[k] for k in keys]
+    return select(*cols, func.sum(effects.c.delta).label("net")).group_by(*cols)
+
+
+def _rollups_from_transactions():
+    month = cast(func.date_trunc("month", Transaction.date), Date)
+    cols = [Transaction.user_id, month, Transaction.category_id, Transaction.account_id, Transaction.type]
+    return select(*cols, func.sum(Transaction.amount), func.count()).group_by(*cols)
+
+
+# (table, key columns, value columns, ground-truth query returning keys + values)
+LEDGERS = [
+    (AccountBalance.__table__, ("account_id",), ("transactions_net",),
+     lambda: _effects_grouped_by("account_id")),
+    (AccountDailyDelta.__table__, ("account_id", "date"), ("delta",),
+     lambda: _effects_grouped_by("account_id", "date")),
+    (MonthlyRollup.__table__, ROLLUP_KEYS, ("total", "txn_count"),
+     _rollups_from_transactions),
+]
+
+
+def _unwrap(amounts: tuple):
+    return amounts[0] if len(amounts) == 1 else amounts
+
+
+async def reconcile_ledgers(db: AsyncSession, repair: bool = True) -> dict[str, list[dict]]:
+    """Compare every ledger table with a full recompute; optionally fix drift.
+
+    With repair=True the tables are locked against concurrent ledger writes
+    for the duration, so the recompute and the fix see the same set of
+    transactions. Returns drifted rows keyed by table name; "expected" and
+    "actual" are scalars for single-value tables and tuples otherwise.
+    """
+    if repair:
+        names = ", ".join(table.name for table, *_ in LEDGERS)
+        await db.execute(text(f"LOCK TABLE {names} IN SHARE ROW EXCLUSIVE MODE"))
+
+    report: dict[str, list[dict]] = {}
+    for table, keys, values, truth_query in LEDGERS:
+        n = len(keys)
+        empty = (0,) * len(values)
+        truth_result = await db.execute(truth_query())
+        truth = {tuple(row[:n]): tuple(row[n:]) for row in truth_result}
+        stored_result = await db.execute(select(*(table.c[k] for k in keys + values)))
+        stored = {tuple(row[:n]): tuple(row[n:]) for row in stored_result}
+
+        drifted = [
+            key for key in sorted(truth.keys() | stored.keys(), key=_sort_key)
+            if truth.get(key, empty) != stored.get(key, empty)
+        ]
+        drift = [
+            {
+                **dict(zip(keys, key)),
+                "expected": _unwrap(truth.get(key, empty)),
+                "actual": _unwrap(stored.get(key, empty)),
+            }
+            for key in drifted
+        ]
+        if drifted and repair:
+            for i in range(0, len(drifted), UPSERT_CHUNK):
+                stmt = pg_insert(table).values([
+                    {**dict(zip(keys, key)), **dict(zip(values, truth.get(key, empty)))}
+                    for key in drifted[i:i + UPSERT_CHUNK]
+                ])
+                set_ = {v: stmt.excluded[v] for v in values}
+                if "updated_at" in table.c:
+                    set_["updated_at"] = func.now()
+                await db.execute(stmt.on_conflict_do_update(index_elements=list(keys), set_=set_))
+        report[table.name] = drift
+
+        if drift:
+            log.warning("ledger.drift", table=table.name, rows=len(drift), repaired=repair)
+        else:
+            log.info("ledger.ok", table=table.name, rows=len(stored))
+    await db.commit()
+    return report
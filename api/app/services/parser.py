@@ -1,4 +1,5 @@
 # api/app/services/parser.py
+import calendar
 import json
 import re
 from decimal import Decimal, InvalidOperation
@@ -26,8 +27,12 @@ def parse_bulk(text: str) -> BulkParseResponse:
         else:
             results = [_parse_json_obj(data)]
     except (json.JSONDecodeError, ValueError):
-        lines = [l.strip() for l in text.split("\n") if l.strip()]
-        results = [r for r in (_parse_freeform(l) for l in lines) if r.amount is not None]
+        # Lines without an amount are dropped, so skip the other extractors for them
+        results = [
+            _parse_freeform(line, amount)
+            for raw in text.split("\n")
+            if (line := raw.strip()) and (amount := _extract_amount(line)) is not None
+        ]
     return BulkParseResponse(transactions=results, count=len(results))
 
 
@@ -62,19 +67,51 @@ def _to_decimal(value) -> Decimal | None:
         return None
 
 
+_DATE_FORMATS = ["%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%B %d, %Y", "%b %d, %Y",
+                 "%B %d %Y", "%b %d %Y"]
+
+# Common date shapes are parsed directly instead of trying each strptime
+# format in turn; anything else falls back to the formats.
+_ISO_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)
+_SLASH_DATE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})", re.ASCII)
+_NAMED_DATE = re.compile(r"([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})", re.ASCII)
+_MONTHS = {
+    name.lower(): number
+    for number in range(1, 13)
+    for name in (calendar.month_name[number], calendar.month_abbr[number])
+}
+
+
+def _iso(year: int, month: int, day: int) -> str | None:
+    try:
+        return datetime(year, month, day).strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
 def _normalize_date(raw: str) -> str | None:
-    fmts = ["%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%B %d, %Y", "%b %d, %Y",
-            "%B %d %Y", "%b %d %Y"]
-    for fmt in fmts:
+    raw = raw.strip()
+    if m := _ISO_DATE.fullmatch(raw):
+        return _iso(int(m[1]), int(m[2]), int(m[3]))
+    if m := _SLASH_DATE.fullmatch(raw):
+        year = int(m[3])
+        if len(m[3]) == 2:
+            year += 2000 if year < 69 else 1900  # strptime's %y pivot
+        return _iso(year, int(m[1]), int(m[2]))
+    if m := _NAMED_DATE.fullmatch(raw):
+        month = _MONTHS.get(m[1].lower())
+        return _iso(int(m[3]), month, int(m[2])) if month else None
+    for fmt in _DATE_FORMATS:
         try:
-            return datetime.strptime(raw.strip(), fmt).strftime("%Y-%m-%d")
+            return datetime.strptime(raw, fmt).strftime("%Y-%m-%d")
         except ValueError:
             continue
     return None
 
 
-def _parse_freeform(text: str) -> ParsedTransaction:
-    amount = _extract_amount(text)
+def _parse_freeform(text: str, amount: Decimal | None = None) -> ParsedTransaction:
+    if amount is None:
+        amount = _extract_amount(text)
     date = _extract_date(text)
     description = _extract_merchant(text)
     txn_type = _extract_type(text)
@@ -91,9 +128,41 @@ def _parse_freeform(text: str) -> ParsedTransaction:
     )
 
 
+_AMOUNT_PATTERNS = (
+    re.compile(r"[₱PHP]\s*([\d,]+\.?\d*)", re.IGNORECASE),
+    re.compile(r"([\d,]+\.\d{2})\s*(?:PHP|peso)", re.IGNORECASE),
+)
+# (pattern, substring every match contains) pairs; a cheap `in` check skips
+# searches that can't match
+_DATE_PATTERNS = (
+    (re.compile(r"\b(\d{4}-\d{2}-\d{2})\b"), "-"),
+    (re.compile(r"\b(\d{1,2}/\d{1,2}/\d{2,4})\b"), "/"),
+    (
+        re.compile(
+            r"\b((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4})\b",
+            re.IGNORECASE,
+        ),
+        "",
+    ),
+)
+_MERCHANT_PATTERNS = (
+    (re.compile(r"\bat\s+([A-Z][A-Za-z0-9 &'.,-]{2,40}?)(?:\s+on\b|\s+for\b|\.|$)"), "at"),
+    (re.compile(r"\bto\s+([A-Z][A-Za-z0-9 &'.,-]{2,40}?)(?:\s+on\b|\s+dated\b|\.|$)"), "to"),
+)
+# Checked in order: the first type with a keyword anywhere in the text wins
+_TYPE_KEYWORDS = (
+    ("expense", ["debited", "deducted", "paid", "purchased", "charged"]),
+    ("income", ["credited", "received", "deposited", "salary", "payroll"]),
+    ("transfer", ["transferred", "sent to", "transfer to"]),
+)
+_TYPE_PATTERNS = tuple(
+    (txn_type, re.compile("|".join(map(re.escape, words)))) for txn_type, words in _TYPE_KEYWORDS
+)
+
+
 def _extract_amount(text: str) -> Decimal | None:
-    for pattern in [r"[₱PHP]\s*([\d,]+\.?\d*)", r"([\d,]+\.\d{2})\s*(?:PHP|peso)"]:
-        m = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _AMOUNT_PATTERNS:
+        m = pattern.search(text)
         if m:
             val = m.group(1).replace(",", "")
             try:
@@ -104,13 +173,8 @@ def _extract_amount(text: str) -> Decimal | None:
 
 
 def _extract_date(text: str) -> str | None:
-    patterns = [
-        r"\b(\d{4}-\d{2}-\d{2})\b",
-        r"\b(\d{1,2}/\d{1,2}/\d{2,4})\b",
-        r"\b((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4})\b",
-    ]
-    for pattern in patterns:
-        m = re.search(pattern, text, re.IGNORECASE)
+    for pattern, marker in _DATE_PATTERNS:
+        m = marker in text and pattern.search(text)
         if m:
             result = _normalize_date(m.group(1))
             if result:
@@ -119,25 +183,16 @@ def _extract_date(text: str) -> str | None:
 
 
 def _extract_merchant(text: str) -> str | None:
-    m = re.search(
-        r"\bat\s+([A-Z][A-Za-z0-9 &'.,-]{2,40}?)(?:\s+on\b|\s+for\b|\.|$)", text
-    )
-    if m:
-        return m.group(1).strip()
-    m = re.search(
-        r"\bto\s+([A-Z][A-Za-z0-9 &'.,-]{2,40}?)(?:\s+on\b|\s+dated\b|\.|$)", text
-    )
-    if m:
-        return m.group(1).strip()
+    for pattern, marker in _MERCHANT_PATTERNS:
+        m = marker in text and pattern.search(text)
+        if m:
+            return m.group(1).strip()
     return None
 
 
 def _extract_type(text: str) -> str | None:
     lower = text.lower()
-    if any(w in lower for w in ["debited", "deducted", "paid", "purchased", "charged"]):
-        return "expense"
-    if any(w in lower for w in ["credited", "received", "deposited", "salary", "payroll"]):
-        return "income"
-    if any(w in lower for w in ["transferred", "sent to", "transfer to"]):
-        return "transfer"
+    for txn_type, pattern in _TYPE_PATTERNS:
+        if pattern.search(lower):
+            return txn_type
     return None
@@ -0,0 +1,113 @@
+"""Text extraction from PDF statements with PyMuPDF.
+
+Extraction is CPU-bound, so it runs in a process pool of
+``pdf_extract_workers`` processes. A document is split into ranges of
+PAGES_PER_CHUNK pages, and each worker opens the file and reads only its
+own range. Results come back in page order, with at most two chunks per
+worker submitted ahead of the one being consumed, so a long statement is
+never held in memory all at once, and its pages are read in parallel.
+
+Celery's default prefork pool runs tasks in daemon processes, which may
+not start children. There the chunks are read inline instead: the task
+already has a process of its own, and worker --concurrency sets how many
+statements are read in parallel. The pool is used by solo and threads
+workers and by scripts.
+
+A statement lays out each transaction as a row of separate cells (date,
+description, amount). Rows are rebuilt from word positions and turned
+into lines that services/parser.py understands.
+"""
+import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import current_process, get_context
+import pymupdf
+from app.core.config import settings
+
+PAGES_PER_CHUNK = 8
+ROW_TOLERANCE = 2.0  # points between baselines still counted as one row
+
+_AMOUNT = r"(\d{1,3}(?:,\d{3})*\.\d{2})"
+_ROW = re.compile(rf"^(\d{{1,2}}/\d{{1,2}}/\d{{2,4}})\s+(.+?)\s+{_AMOUNT}$")
+_TRAILING_AMOUNT = re.compile(rf"(?<![\d,.]){_AMOUNT}$")
+_pool: ProcessPoolExecutor | None = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn: the Celery worker that owns the pool also runs an event
+        # loop thread, which a forked child must not inherit
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.pdf_extract_workers, mp_context=get_context("spawn")
+        )
+    return _pool
+
+
+def shutdown() -> None:
+    """Stop the pool's processes, if it was started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+def _page_rows(page: pymupdf.Page) -> list[str]:
+    rows: list[list[tuple[float, str]]] = []
+    baseline = None
+    for x0, _, _, y1, word, *_ in sorted(page.get_text("words"), key=lambda w: (w[3], w[0])):
+        if baseline is None or abs(y1 - baseline) > ROW_TOLERANCE:
+            rows.append([])
+            baseline = y1
+        rows[-1].append((x0, word))
+    return [" ".join(word for _, word in sorted(row)) for row in rows]
+
+
+def _statement_line(row: str) -> str:
+    """Rephrase a "date description amount" row the way the parser reads
+    messages. Statement amounts carry no currency marker; they are pesos."""
+    if "₱" in row or "PHP" in row:
+        return row
+    if m := _ROW.match(row):
+        date, description, amount = m.groups()
+        return f"₱{amount} at {description} on {date}"
+    return _TRAILING_AMOUNT.sub(r"₱\1", row)
+
+
+def extract_lines(path: str, start: int, stop: int) -> list[str]:
+    """Lines of pages [start, stop) of the PDF at ``path``."""
+    lines = []
+    with pymupdf.open(path) as doc:
+        for number in range(start, min(stop, doc.page_count)):
+            lines.extend(_statement_line(row) for row in _page_rows(doc[number]))
+    return lines
+
+
+def page_count(path: str) -> int:
+    with pymupdf.open(path) as doc:
+        return doc.page_count
+
+
+def iter_statement_lines(path: str) -> Iterator[list[str]]:
+    """Lines of the statement at ``path``, one list per chunk of pages, in order."""
+    starts = range(0, page_count(path), PAGES_PER_CHUNK)
+    stops = [start + PAGES_PER_CHUNK for start in starts]
+    if current_process().daemon:
+        yield from map(extract_lines, [path] * len(starts), starts, stops)
+        return
+    # Executor.map submits every chunk up front and keeps each result until
+    # it is consumed; a bounded window of futures keeps memory flat.
+    pool = _get_pool()
+    window = 2 * settings.pdf_extract_workers
+    pending = deque()
+    try:
+        for start, stop in zip(starts, stops):
+            pending.append(pool.submit(extract_lines, path, start, stop))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
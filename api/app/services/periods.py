@@ -0,0 +1,54 @@
+"""Calendar periods as half-open [start, end) date ranges.
+
+Filter with ``period.contains(Transaction.date)`` rather than extract()/
+date_trunc() on the column, so Postgres can range-scan
+ix_transactions_user_date (user_id, date) instead of evaluating a function
+on every row of the user's history.
+"""
+from calendar import monthrange
+from datetime import date, timedelta
+from typing import NamedTuple
+from sqlalchemy import and_, true
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class Period(NamedTuple):
+    start: date | None  # inclusive; None = unbounded
+    end: date | None  # exclusive; None = unbounded
+
+    @property
+    def last_day(self) -> date | None:
+        return self.end - timedelta(days=1) if self.end is not None else None
+
+    def contains(self, column) -> ColumnElement[bool]:
+        clauses = []
+        if self.start is not None:
+            clauses.append(column >= self.start)
+        if self.end is not None:
+            clauses.append(column < self.end)
+        return and_(*clauses) if clauses else true()
+
+
+def month_period(year: int, month: int) -> Period:
+    start = date(year, month, 1)
+    return Period(start, start + timedelta(days=monthrange(year, month)[1]))
+
+
+def month_of(day: date) -> Period:
+    return month_period(day.year, day.month)
+
+
+def week_of(day: date) -> Period:
+    """Monday-to-Sunday week containing ``day``."""
+    start = day - timedelta(days=day.weekday())
+    return Period(start, start + timedelta(days=7))
+
+
+def custom_period(date_from: date | None, date_to: date | None) -> Period:
+    """Period for inclusive user-facing bounds (e.g. ?date_from=&date_to=).
+
+    date_to=date.max has no following day; it leaves the end open.
+    """
+    if date_to is None or date_to == date.max:
+        return Period(date_from, None)
+    return Period(date_from, date_to + timedelta(days=1))
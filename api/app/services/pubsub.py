@@ -1,24 +1,158 @@
+"""Redis client and pub/sub fan-out for live notifications.
+
+Each process shares one async Redis client, and with it one bounded
+connection pool, for publishing and caching. The API opens it in the
+lifespan. Celery workers and scripts open it lazily on first use. Callers
+must not close it.
+
+SSE streams don't subscribe in Redis themselves. The first stream in a
+process starts a single listener, pattern-subscribed to
+``notifications:*``, which hands each message to the in-memory queues of
+that user's open streams. Hundreds of dashboards then cost one Redis
+connection rather than one each.
+"""
+import asyncio
 import json
 import uuid
-from redis.asyncio import Redis
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import PubSub
 from app.core.config import settings
+from app.core.logging import log
+
+CHANNEL_PREFIX = "notifications:"
+STREAM_QUEUE_SIZE = 100
+
+_redis: Redis | None = None
+_redis_loop: asyncio.AbstractEventLoop | None = None
+_listener: asyncio.Task | None = None
+_listener_lock: asyncio.Lock | None = None
+_streams: dict[uuid.UUID, set[asyncio.Queue]] = {}
+_dropped = 0
 
 
 def _channel(user_id: uuid.UUID) -> str:
-    return f"notifications:{user_id}"
+    return f"{CHANNEL_PREFIX}{user_id}"
 
 
 async def get_redis() -> Redis:
-    return Redis.from_url(settings.redis_url, decode_responses=True)
+    """This process's shared Redis client."""
+    global _redis, _redis_loop, _listener, _listener_lock, _streams
+    loop = asyncio.get_running_loop()
+    # Connections belong to the loop that opened them; a process that runs
+    # more than one loop (tests, scripts) gets a fresh client per loop.
+    if _redis is None or _redis_loop is not loop:
+        pool = BlockingConnectionPool.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            max_connections=settings.redis_max_connections,
+            timeout=5,
+        )
+        _redis, _redis_loop = Redis(connection_pool=pool), loop
+        _listener, _listener_lock, _streams = None, None, {}
+    return _redis
+
+
+async def close_redis() -> None:
+    """Stop the stream listener and close the pool (API shutdown)."""
+    global _redis, _redis_loop, _listener
+    if _listener is not None:
+        _listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await _listener
+        _listener = None
+    if _redis is not None:
+        await _redis.aclose(close_connection_pool=True)
+        _redis = _redis_loop = None
 
 
 async def publish_notification(user_id: uuid.UUID, payload: dict) -> None:
     try:
         r = await get_redis()
-        try:
-            await r.publish(_channel(user_id), json.dumps(payload))
-        finally:
-            await r.aclose()
+        await r.publish(_channel(user_id), json.dumps(payload))
     except Exception:
         pass  # Non-critical: SSE clients will miss this event but DB has the notification
 
+
+def _end_stream(queue: asyncio.Queue) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(None)
+
+
+async def _listen(pubsub: PubSub) -> None:
+    global _dropped
+    try:
+        async for message in pubsub.listen():
+            if message["type"] != "pmessage":
+                continue
+            try:
+                user_id = uuid.UUID(message["channel"].removeprefix(CHANNEL_PREFIX))
+            except ValueError:
+                continue
+            for queue in _streams.get(user_id, ()):
+                try:
+                    queue.put_nowait(message["data"])
+                except asyncio.QueueFull:
+                    _dropped += 1  # a stalled client; the notification is still in the DB
+    except Exception as exc:
+        log.warning("pubsub.listener_failed", detail=str(exc))
+    finally:
+        # Open streams end and their clients reconnect, which starts a new
+        # listener.
+        for queues in _streams.values():
+            for queue in queues:
+                _end_stream(queue)
+        with suppress(Exception):
+            await pubsub.aclose()
+
+
+async def _ensure_listener() -> None:
+    global _listener, _listener_lock
+    r = await get_redis()
+    if _listener is not None and not _listener.done():
+        return
+    if _listener_lock is None:
+        _listener_lock = asyncio.Lock()
+    async with _listener_lock:
+        if _listener is not None and not _listener.done():
+            return
+        pubsub = r.pubsub()
+        try:
+            await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+        except Exception:
+            await pubsub.aclose()
+            raise
+        _listener = asyncio.create_task(_listen(pubsub), name="notifications-listener")
+
+
+@asynccontextmanager
+async def subscribe_notifications(user_id: uuid.UUID) -> AsyncIterator[asyncio.Queue]:
+    """Queue of the payloads (JSON strings) published for ``user_id`` while
+    the context is open. ``None`` on the queue means the stream has ended.
+
+    Raises if Redis is unreachable when the listener has to be started.
+    """
+    await _ensure_listener()
+    queue: asyncio.Queue = asyncio.Queue(STREAM_QUEUE_SIZE)
+    streams = _streams
+    streams.setdefault(user_id, set()).add(queue)
+    try:
+        yield queue
+    finally:
+        queues = streams.get(user_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del streams[user_id]
+
+
+def stream_stats() -> dict[str, int]:
+    """Open SSE streams in this process."""
+    streams = list(_streams.values())
+    return {
+        "sse.streams": sum(len(queues) for queues in streams),
+        "sse.users": len(streams),
+        "sse.dropped": _dropped,
+    }
@@ -1,14 +1,21 @@
+import uuid
 from datetime import date, timedelta
 
 from dateutil.relativedelta import relativedelta
-from sqlalchemy import select
+from sqlalchemy import insert, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import AsyncSessionLocal
 from app.models.notification import Notification, NotificationType
 from app.models.recurring_transaction import RecurrenceFrequency, RecurringTransaction
-from app.models.transaction import Transaction, TransactionSource
+from app.models.transaction import TransactionSource
 from app.services.pubsub import publish_notification
-from app.services.web_push import send_push_to_user
+from app.services.sharding import Shard
+from app.services.transactions import insert_recurring_occurrences
+from app.services.web_push import Push, send_pushes
+
+# Rows per multi-row INSERT (transactions have 11 bound columns each)
+INSERT_CHUNK = 1000
 
 
 def advance_date(current: date, freq: RecurrenceFrequency) -> date:
@@ -25,56 +32,100 @@ def advance_date(current: date, freq: RecurrenceFrequency) -> date:
             return current + relativedelta(years=1)
 
 
-async def generate_recurring_transactions() -> int:
-    today = date.today()
-    count = 0
+async def generate_recurring_transactions(
+    today: date | None = None, shard: Shard | None = None
+) -> int:
     async with AsyncSessionLocal() as db:
-        result = await db.execute(
-            select(RecurringTransaction).where(
-                RecurringTransaction.is_active == True,  # noqa: E712
-                RecurringTransaction.next_due_date <= today,
-            )
-        )
-        for rec in result.scalars().all():
-            txn = Transaction(
-                user_id=rec.user_id,
-                account_id=rec.account_id,
-                category_id=rec.category_id,
-                amount=rec.amount,
-                description=rec.description,
-                type=rec.type,
-                sub_type=rec.sub_type,
-                date=rec.next_due_date,
-                source=TransactionSource.recurring,
-                recurring_id=rec.id,
-                created_by=rec.user_id,
-            )
-            db.add(txn)
-            await db.flush()
+        return await generate_due_occurrences(db, today or date.today(), shard)
+
 
-            n = Notification(
-                user_id=rec.user_id,
-                type=NotificationType.recurring_created,
-                title="Recurring Transaction Created",
-                message=f"\u20b1{rec.amount:,.2f} \u2014 {rec.description}",
-                metadata_={"recurring_id": str(rec.id), "transaction_id": str(txn.id)},
-            )
-            db.add(n)
+def _due_dates(rec: RecurringTransaction, today: date) -> list[date]:
+    """Every occurrence from next_due_date through today, within end_date."""
+    dates = []
+    due = rec.next_due_date
+    while due <= today and (rec.end_date is None or due <= rec.end_date):
+        dates.append(due)
+        due = advance_date(due, rec.frequency)
+    rec.next_due_date = due
+    if rec.end_date and due > rec.end_date:
+        rec.is_active = False
+    return dates
 
-            rec.next_due_date = advance_date(rec.next_due_date, rec.frequency)
-            if rec.end_date and rec.next_due_date > rec.end_date:
-                rec.is_active = False
-            count += 1
 
-            await publish_notification(
-                rec.user_id,
-                {
-                    "id": str(n.id),
-                    "type": "recurring_created",
-                    "title": n.title,
-                    "message": n.message,
-                },
-            )
-            await send_push_to_user(rec.user_id, n.title, n.message)
-        await db.commit()
-    return count
+async def generate_due_occurrences(
+    db: AsyncSession, today: date, shard: Shard | None = None
+) -> int:
+    """Create every occurrence due up to ``today`` for all active rules
+    (of users in ``shard``, when given).
+
+    A rule that fell behind (worker down) is caught up in one run rather than
+    one occurrence per run. Transactions and notifications are bulk-inserted
+    in chunks and committed together with the rules' new next_due_date;
+    pub/sub and push fan-out happens only after the commit. Occurrences that
+    already exist are skipped, so re-running is idempotent.
+    """
+    result = await db.execute(
+        select(RecurringTransaction)
+        .where(
+            RecurringTransaction.is_active == True,  # noqa: E712
+            RecurringTransaction.next_due_date <= today,
+            shard.contains(RecurringTransaction.user_id) if shard else true(),
+        )
+        # Concurrent runs split the rules between them instead of colliding
+        .with_for_update(skip_locked=True)
+    )
+    rows = []
+    for rec in result.scalars().all():
+        for due in _due_dates(rec, today):
+            rows.append({
+                "user_id": rec.user_id,
+                "account_id": rec.account_id,
+                "category_id": rec.category_id,
+                "amount": rec.amount,
+                "description": rec.description,
+                "type": rec.type,
+                "sub_type": rec.sub_type,
+                "date": due,
+                "source": TransactionSource.recurring,
+                "recurring_id": rec.id,
+                "created_by": rec.user_id,
+            })
+
+    created: list[Notification] = []
+    for start in range(0, len(rows), INSERT_CHUNK):
+        txns = await insert_recurring_occurrences(db, rows[start:start + INSERT_CHUNK])
+        if not txns:
+            continue
+        notifications = [
+            {
+                "user_id": txn.user_id,
+                "type": NotificationType.recurring_created,
+                "title": "Recurring Transaction Created",
+                "message": f"\u20b1{txn.amount:,.2f} \u2014 {txn.description}",
+                "metadata_": {"recurring_id": str(txn.recurring_id), "transaction_id": str(txn.id)},
+            }
+            for txn in sorted(txns, key=lambda t: (t.date, t.id))
+        ]
+        inserted = await db.execute(
+            insert(Notification)
+            .values(notifications)
+            .returning(Notification.id, Notification.user_id, Notification.title, Notification.message)
+        )
+        created.extend(inserted.all())
+    await db.commit()
+
+    for n in created:
+        await publish_notification(
+            n.user_id,
+            {"id": str(n.id), "type": "recurring_created", "title": n.title, "message": n.message},
+        )
+    # One push per user: a caught-up daily rule shouldn't buzz a phone 30 times.
+    by_user: dict[uuid.UUID, list] = {}
+    for n in created:
+        by_user.setdefault(n.user_id, []).append(n)
+    await send_pushes(db, [
+        Push(user_id, notes[0].title, notes[0].message) if len(notes) == 1
+        else Push(user_id, "Recurring Transactions Created", f"{len(notes)} recurring transactions were added")
+        for user_id, notes in by_user.items()
+    ])
+    return len(created)
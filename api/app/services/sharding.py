@@ -0,0 +1,33 @@
+"""Stable partitioning of users into shards for fan-out jobs.
+
+A user's shard is the last byte of their UUID modulo the shard count. For
+uuidv7 ids that byte is random, so shards come out evenly sized. The
+mapping never changes for a given count, and it can be evaluated both in
+Python and in SQL: ``shard.contains(Model.user_id)`` filters a query to
+one shard's users.
+"""
+import uuid
+from typing import NamedTuple
+from sqlalchemy import func, true
+from sqlalchemy.sql.elements import ColumnElement
+
+MAX_SHARDS = 256  # one byte of the UUID
+
+
+class Shard(NamedTuple):
+    index: int
+    count: int
+
+    def contains(self, user_id_column) -> ColumnElement[bool]:
+        if self.count == 1:
+            return true()
+        return func.get_byte(func.uuid_send(user_id_column), 15) % self.count == self.index
+
+    def owns(self, user_id: uuid.UUID) -> bool:
+        return user_id.bytes[15] % self.count == self.index
+
+
+def all_shards(count: int) -> list[Shard]:
+    if not 1 <= count <= MAX_SHARDS:
+        raise ValueError(f"shard count must be between 1 and {MAX_SHARDS}")
+    return [Shard(i, count) for i in range(count)]
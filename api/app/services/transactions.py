@@ -0,0 +1,54 @@
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.transaction import Transaction
+from app.services.ledger import LEDGER_FIELDS, LedgerDeltas
+
+
+async def _apply_ledger(db: AsyncSession, created: list[Transaction]) -> None:
+    deltas = LedgerDeltas()
+    for txn in created:
+        deltas.add({field: getattr(txn, field) for field in LEDGER_FIELDS})
+    await db.run_sync(lambda session: deltas.apply(session.connection()))
+
+
+async def insert_transactions(db: AsyncSession, rows: list[dict]) -> list[Transaction]:
+    """Insert many transactions with batched multi-row INSERT ... RETURNING.
+
+    Bulk ORM inserts skip the per-row mapper events in app/services/ledger.py,
+    so the ledger deltas for the whole batch are applied here, in the same
+    transaction, with one upsert per ledger table. Does not commit; rows are
+    returned in input order, matched up by their client-generated ids (see
+    Transaction.id), so SQLAlchemy can send up to 1,000 rows per statement.
+    """
+    if not rows:
+        return []
+    result = await db.execute(
+        insert(Transaction).returning(Transaction, sort_by_parameter_order=True), rows
+    )
+    created = list(result.scalars().all())
+    await _apply_ledger(db, created)
+    return created
+
+
+async def insert_recurring_occurrences(db: AsyncSession, rows: list[dict]) -> list[Transaction]:
+    """Like insert_transactions, for rows generated from recurring rules.
+
+    Rows whose (recurring_id, date) already exists are skipped
+    (uq_transactions_recurring_occurrence), so re-running a generation is
+    harmless. Returns only the rows actually inserted, in no particular order.
+    """
+    if not rows:
+        return []
+    result = await db.execute(
+        pg_insert(Transaction)
+        .values(rows)
+        .on_conflict_do_nothing(
+            index_elements=[Transaction.recurring_id, Transaction.date],
+            index_where=Transaction.recurring_id.isnot(None),
+        )
+        .returning(Transaction)
+    )
+    created = list(result.scalars().all())
+    await _apply_ledger(db, created)
+    return created
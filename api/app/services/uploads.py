@@ -0,0 +1,147 @@
+"""Content-addressed storage of uploaded files.
+
+An upload is copied in CHUNK_SIZE pieces, so memory per upload stays
+constant whatever the file size. The size limit is enforced as the bytes
+arrive, and the SHA-256 is computed along the way. Bytes go to a temporary
+file in the user's directory. Once complete, that file is renamed to
+``<sha256><ext>``, so a reader never sees a partial file and identical
+content is stored once.
+
+Files can end up unreferenced: an upload that failed before its row was
+committed, or a user who was deleted. collect_orphans removes those.
+"""
+import asyncio
+import hashlib
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import NamedTuple
+import aiofiles
+import aiofiles.os
+from fastapi import UploadFile
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.logging import log
+from app.models.document import Document
+
+CHUNK_SIZE = 1024 * 1024
+ORPHAN_GRACE_SECONDS = 3600  # leave room for uploads still being committed
+LOOKUP_CHUNK = 1000
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class StoredFile(NamedTuple):
+    path: Path
+    size: int
+    sha256: str
+
+
+async def save_upload(file: UploadFile, directory: Path, suffix: str, max_size: int) -> StoredFile:
+    """Stream ``file`` into ``directory`` as ``<sha256><suffix>``.
+
+    Raises UploadTooLarge past ``max_size`` bytes.
+    """
+    await aiofiles.os.makedirs(directory, exist_ok=True)
+    tmp = directory / f".{uuid.uuid4()}.part"
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(tmp, "wb") as out:
+            while chunk := await file.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLarge(f"File exceeds {max_size} bytes")
+                digest.update(chunk)
+                await out.write(chunk)
+        path = directory / f"{digest.hexdigest()}{suffix}"
+        # Same name means same bytes, so replacing an existing copy is harmless
+        await aiofiles.os.replace(tmp, path)
+    except BaseException:
+        try:
+            await aiofiles.os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return StoredFile(path, size, digest.hexdigest())
+
+
+def _storage_key(path: str | Path) -> tuple[str, ...]:
+    """``(user_id, name)`` of a stored file, whatever root its path starts from.
+
+    Rows keep the path as the API saw it; a relative ``upload_dir`` or a
+    later move to an absolute one must not make a referenced file look
+    orphaned.
+    """
+    return Path(path).parts[-2:]
+
+
+def _stale_files(root: Path, cutoff: float) -> list[Path]:
+    """Files in ``root``'s per-user directories not modified since ``cutoff``."""
+    stale = []
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = Path(directory, name)
+            try:
+                uuid.UUID(path.parent.name)
+            except ValueError:
+                continue  # not one of ours
+            if path.parent.parent != root:
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    stale.append(path)
+            except FileNotFoundError:
+                pass
+    return stale
+
+
+def _remove_stale(paths: list[Path], cutoff: float) -> int:
+    """Remove each of ``paths`` unless it was rewritten after ``cutoff``.
+
+    An upload of the same bytes may have replaced a file, and committed its
+    row, since the file was listed. So each file is first renamed aside,
+    which is atomic, and its mtime checked there. A fresh copy is renamed
+    back; same name means same bytes, so that is harmless even if another
+    upload has written the path again meanwhile.
+    """
+    removed = 0
+    for path in paths:
+        aside = path.with_name(f".{path.name}.gc")
+        try:
+            os.replace(path, aside)
+        except FileNotFoundError:
+            continue
+        if aside.stat().st_mtime >= cutoff:
+            os.replace(aside, path)
+        else:
+            os.remove(aside)
+            removed += 1
+    return removed
+
+
+async def collect_orphans(
+    db: AsyncSession, root: Path, grace_seconds: int = ORPHAN_GRACE_SECONDS
+) -> int:
+    """Delete files under ``root`` that no document references. Returns how many.
+
+    Files modified in the last ``grace_seconds`` are left alone.
+    """
+    cutoff = time.time() - grace_seconds
+    candidates = await asyncio.to_thread(_stale_files, root, cutoff)
+    user_ids = sorted({uuid.UUID(path.parent.name) for path in candidates})
+    referenced: set[tuple[str, ...]] = set()
+    for start in range(0, len(user_ids), LOOKUP_CHUNK):
+        result = await db.execute(
+            select(Document.file_path).where(
+                Document.user_id.in_(user_ids[start:start + LOOKUP_CHUNK])
+            )
+        )
+        referenced.update(_storage_key(path) for path in result.scalars())
+    orphans = [path for path in candidates if _storage_key(path) not in referenced]
+    removed = await asyncio.to_thread(_remove_stale, orphans, cutoff)
+    log.info("uploads.orphans_removed", scanned=len(candidates), removed=removed)
+    return removed
@@ -0,0 +1,168 @@
+"""Short-lived cache of authenticated users for get_current_user.
+
+Every authenticated request used to re-select its user row. Rows are now
+kept in a per-process LRU for ``user_cache_ttl_seconds`` and, with
+``user_cache_redis`` enabled, in Redis too so other workers can skip the
+database on their own misses. Profile and password changes invalidate
+both layers; other workers' local copies can stay stale for at most one
+TTL.
+
+``password_hash`` is never cached: the only reader, change-password,
+refreshes the user from the database first.
+"""
+import json
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.logging import log
+from app.models.user import User
+from app.services.pubsub import get_redis
+
+CACHED_FIELDS = ("id", "email", "name", "avatar", "created_at", "updated_at")
+# Counters are batched so the hot path doesn't pay a Redis round trip.
+METRICS_FLUSH_EVERY = 100
+
+_entries: OrderedDict[uuid.UUID, tuple[float, dict[str, Any]]] = OrderedDict()
+_counts = {"hit": 0, "redis_hit": 0, "miss": 0}
+_unflushed = dict(_counts)
+
+
+def _redis_key(user_id: uuid.UUID) -> str:
+    return f"user-cache:{user_id}"
+
+
+def _count(outcome: str) -> None:
+    _counts[outcome] += 1
+    _unflushed[outcome] += 1
+    if sum(_unflushed.values()) >= METRICS_FLUSH_EVERY:
+        # Called on the event loop: the Redis writes happen on the metrics thread
+        metrics.submit(_record, _take_unflushed())
+
+
+def _take_unflushed() -> dict[str, int]:
+    pending = {outcome: amount for outcome, amount in _unflushed.items() if amount}
+    for outcome in pending:
+        _unflushed[outcome] = 0
+    return pending
+
+
+def _record(pending: dict[str, int]) -> None:
+    for outcome, amount in pending.items():
+        metrics.incr(f"auth.user_cache.{outcome}", amount)
+
+
+def flush_metrics() -> None:
+    """Push counts accumulated since the last flush to app.core.metrics."""
+    _record(_take_unflushed())
+
+
+def stats() -> dict[str, float]:
+    """This process's counts since start (or clear()), with the hit ratio."""
+    total = sum(_counts.values())
+    hits = _counts["hit"] + _counts["redis_hit"]
+    return {**_counts, "hit_ratio": hits / total if total else 0.0}
+
+
+def clear() -> None:
+    _entries.clear()
+    for outcome in _counts:
+        _counts[outcome] = _unflushed[outcome] = 0
+
+
+def _get_local(user_id: uuid.UUID) -> dict[str, Any] | None:
+    entry = _entries.get(user_id)
+    if entry is None:
+        return None
+    expires_at, row = entry
+    if expires_at <= time.monotonic():
+        del _entries[user_id]
+        return None
+    _entries.move_to_end(user_id)
+    return row
+
+
+def _put_local(row: dict[str, Any]) -> None:
+    _entries[row["id"]] = (time.monotonic() + settings.user_cache_ttl_seconds, row)
+    _entries.move_to_end(row["id"])
+    while len(_entries) > settings.user_cache_max_entries:
+        _entries.popitem(last=False)
+
+
+async def _get_redis(user_id: uuid.UUID) -> dict[str, Any] | None:
+    try:
+        r = await get_redis()
+        raw = await r.get(_redis_key(user_id))
+    except Exception as exc:
+        log.warning("user_cache.redis_failed", detail=str(exc))
+        return None
+    if raw is None:
+        return None
+    row = json.loads(raw)
+    row["id"] = uuid.UUID(row["id"])
+    for field in ("created_at", "updated_at"):
+        if row[field] is not None:
+            row[field] = datetime.fromisoformat(row[field])
+    return row
+
+
+async def _put_redis(row: dict[str, Any]) -> None:
+    try:
+        r = await get_redis()
+        await r.set(
+            _redis_key(row["id"]),
+            json.dumps(row, default=str),
+            ex=settings.user_cache_ttl_seconds,
+        )
+    except Exception as exc:
+        log.warning("user_cache.redis_failed", detail=str(exc))
+
+
+async def get_user(db: AsyncSession, user_id: uuid.UUID) -> User | None:
+    """The user attached to ``db``, from cache when possible."""
+    if settings.user_cache_ttl_seconds <= 0:
+        result = await db.execute(select(User).where(User.id == user_id))
+        return result.scalar_one_or_none()
+
+    row = _get_local(user_id)
+    if row is not None:
+        _count("hit")
+    elif settings.user_cache_redis and (row := await _get_redis(user_id)) is not None:
+        _count("redis_hit")
+        _put_local(row)
+    else:
+        _count("miss")
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is not None:
+            row = {field: getattr(user, field) for field in CACHED_FIELDS}
+            _put_local(row)
+            if settings.user_cache_redis:
+                await _put_redis(row)
+        return user
+
+    # Rebuild a detached instance and attach it without a SELECT, so routes
+    # can still modify and commit current_user as before.
+    user = User(**row)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
+async def invalidate(user_id: uuid.UUID) -> None:
+    """Drop the user from this process's cache and from Redis."""
+    _entries.pop(user_id, None)
+    if not settings.user_cache_redis:
+        return
+    try:
+        r = await get_redis()
+        await r.delete(_redis_key(user_id))
+    except Exception as exc:
+        log.warning("user_cache.redis_failed", detail=str(exc))
@@ -1,40 +1,142 @@
+"""Web Push delivery.
+
+A batch of pushes loads every recipient's subscriptions with one query and
+sends to them concurrently over one HTTP client, at most MAX_CONCURRENT_SENDS
+at a time. Payload encryption is CPU work and runs on the default thread
+pool. Subscriptions the push service reports as gone (404/410) are deleted
+together at the end of the batch.
+
+The VAPID key is parsed once per process. The signed Authorization header
+is reused per push service until it is close to expiry.
+"""
+import asyncio
 import json
+import time
 import uuid
+from functools import lru_cache
+from typing import NamedTuple
+from urllib.parse import urlparse
 
-from pywebpush import WebPushException, webpush
-from sqlalchemy import select
+import httpx
+from py_vapid import Vapid
+from pywebpush import WebPusher
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import metrics
 from app.core.config import settings
-from app.core.database import AsyncSessionLocal
+from app.core.logging import log
 from app.models.push_subscription import PushSubscription
 
+MAX_CONCURRENT_SENDS = 20
+SEND_TIMEOUT = 10
+VAPID_TTL = 12 * 3600
+GONE = (404, 410)
+
+
+class Push(NamedTuple):
+    user_id: uuid.UUID
+    title: str
+    message: str
+
+
+@lru_cache
+def _vapid(private_key: str) -> Vapid:
+    return Vapid.from_string(private_key=private_key)
+
+
+_vapid_headers: dict[str, tuple[float, dict[str, str]]] = {}
+
+
+def _authorization(endpoint: str) -> dict[str, str]:
+    """Signed VAPID headers for the push service behind ``endpoint``."""
+    url = urlparse(endpoint)
+    aud = f"{url.scheme}://{url.netloc}"
+    cached = _vapid_headers.get(aud)
+    if cached is not None and cached[0] > time.time() + 3600:
+        return cached[1]
+    exp = int(time.time()) + VAPID_TTL
+    headers = _vapid(settings.vapid_private_key).sign({
+        "sub": f"mailto:{settings.vapid_contact_email}",
+        "aud": aud,
+        "exp": exp,
+    })
+    _vapid_headers[aud] = (exp, headers)
+    return headers
 
-async def send_push_to_user(user_id: uuid.UUID, title: str, message: str) -> int:
-    """Send push notification to all subscriptions for a user. Returns count sent."""
-    if not settings.vapid_private_key:
+
+def _encrypt(sub: PushSubscription, payload: bytes) -> bytes:
+    pusher = WebPusher({"endpoint": sub.endpoint, "keys": {"p256dh": sub.p256dh, "auth": sub.auth}})
+    return pusher.encode(payload)["body"]
+
+
+async def send_pushes(db: AsyncSession, pushes: list[Push]) -> int:
+    """Send each push to all of its user's subscriptions. Returns count sent.
+
+    Commits if expired subscriptions were pruned.
+    """
+    if not settings.vapid_private_key or not pushes:
         return 0
+    start = time.perf_counter()
 
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(
-            select(PushSubscription).where(PushSubscription.user_id == user_id)
+    result = await db.execute(
+        select(PushSubscription).where(
+            PushSubscription.user_id.in_({push.user_id for push in pushes})
         )
-        subscriptions = result.scalars().all()
-
-    sent = 0
-    for sub in subscriptions:
-        subscription_info = {
-            "endpoint": sub.endpoint,
-            "keys": {"p256dh": sub.p256dh, "auth": sub.auth},
-        }
-        payload = json.dumps({"title": title, "body": message, "icon": "/icons/icon-192x192.png"})
-        try:
-            webpush(
-                subscription_info=subscription_info,
-                data=payload,
-                vapid_private_key=settings.vapid_private_key,
-                vapid_claims={"sub": f"mailto:{settings.vapid_contact_email}"},
-            )
-            sent += 1
-        except WebPushException:
-            pass
+    )
+    subscriptions: dict[uuid.UUID, list[PushSubscription]] = {}
+    for sub in result.scalars().all():
+        subscriptions.setdefault(sub.user_id, []).append(sub)
+
+    limit = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+    gone: set[str] = set()
+    failed = 0
+
+    async def send(client: httpx.AsyncClient, sub: PushSubscription, push: Push) -> bool:
+        nonlocal failed
+        payload = json.dumps({"title": push.title, "body": push.message, "icon": "/icons/icon-192x192.png"})
+        async with limit:
+            try:
+                body = await asyncio.to_thread(_encrypt, sub, payload.encode())
+                r = await client.post(
+                    sub.endpoint,
+                    content=body,
+                    headers={
+                        **_authorization(sub.endpoint),
+                        "Content-Encoding": "aes128gcm",
+                        "TTL": "0",
+                    },
+                )
+            except Exception as exc:
+                failed += 1
+                log.warning("web_push.send_failed", detail=str(exc))
+                return False
+        if r.status_code in GONE:
+            gone.add(sub.endpoint)
+            return False
+        if r.status_code >= 400:
+            failed += 1
+            log.warning("web_push.rejected", status=r.status_code)
+            return False
+        return True
+
+    async with httpx.AsyncClient(timeout=SEND_TIMEOUT) as client:
+        results = await asyncio.gather(*(
+            send(client, sub, push)
+            for push in pushes
+            for sub in subscriptions.get(push.user_id, ())
+        ))
+
+    if gone:
+        await db.execute(delete(PushSubscription).where(PushSubscription.endpoint.in_(gone)))
+        await db.commit()
+
+    sent = sum(results)
+    duration_ms = int((time.perf_counter() - start) * 1000)
+    metrics.incr_nowait("web_push.batches")
+    metrics.incr_nowait("web_push.batch_ms", duration_ms)
+    log.info(
+        "web_push.batch", pushes=len(pushes), sent=sent, failed=failed,
+        pruned=len(gone), duration_ms=duration_ms,
+    )
     return sent
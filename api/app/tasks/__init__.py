@@ -1,8 +1,21 @@
-import asyncio
 import uuid
 
+from redis import RedisError
+
+from app.core import metrics
+from app.tasks import runtime
 from app.tasks.celery import celery_app
 
+# Writes within this window after the first one share a single alert check.
+BUDGET_ALERT_DEBOUNCE_SECONDS = 5
+# Safety expiry for the pending marker in case the queued check is lost;
+# normally the task clears it as soon as it starts.
+BUDGET_ALERT_PENDING_TTL = 60
+
+
+def _pending_key(user_id: str) -> str:
+    return f"budget-alerts:pending:{user_id}"
+
 
 @celery_app.task(
     name="app.tasks.check_budget_alerts_task",
@@ -14,8 +27,47 @@ def check_budget_alerts_task(user_id: str) -> None:
     from app.services.budget_alerts import check_budget_alerts
     from app.core.database import AsyncSessionLocal
 
+    # Clear the marker before reading, so a write committed after this point
+    # schedules a fresh check instead of being folded into this one.
+    try:
+        metrics.get_sync_redis().delete(_pending_key(user_id))
+    except RedisError:
+        pass
+
     async def _run() -> None:
         async with AsyncSessionLocal() as db:
             await check_budget_alerts(db, uuid.UUID(user_id))
 
-    asyncio.run(_run())
+    runtime.run(_run())
+
+
+def schedule_budget_alerts(user_id: uuid.UUID) -> bool:
+    """Queue a budget-alert check for the user, coalescing bursts of writes.
+
+    The first write sets a Redis marker (SET NX) and enqueues the check with
+    a countdown; writes that arrive while the marker exists are folded into
+    that pending check. Returns True if a task was enqueued, False if this
+    call was coalesced.
+    """
+    key = _pending_key(str(user_id))
+    try:
+        first = metrics.get_sync_redis().set(key, "1", nx=True, ex=BUDGET_ALERT_PENDING_TTL)
+    except RedisError:
+        first = True  # Can't coordinate: better a duplicate check than a missed alert
+    if not first:
+        metrics.incr_nowait("budget_alerts.dispatch.coalesced")
+        return False
+
+    try:
+        check_budget_alerts_task.apply_async(
+            args=[str(user_id)], countdown=BUDGET_ALERT_DEBOUNCE_SECONDS
+        )
+    except Exception:
+        # Don't leave a marker that would swallow the next writes' checks
+        try:
+            metrics.get_sync_redis().delete(key)
+        except RedisError:
+            pass
+        raise
+    metrics.incr_nowait("budget_alerts.dispatch.enqueued")
+    return True
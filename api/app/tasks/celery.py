@@ -6,7 +6,13 @@ celery_app = Celery(
     "finance",
     broker=settings.redis_url,
     backend=settings.redis_url,
-    include=["app.tasks.documents", "app.tasks.notifications", "app.tasks.recurring"],
+    include=[
+        "app.tasks.documents",
+        "app.tasks.notifications",
+        "app.tasks.recurring",
+        "app.tasks.ledger",
+        "app.tasks.shards",
+    ],
 )
 
 celery_app.conf.update(
@@ -18,12 +24,27 @@ celery_app.conf.update(
 )
 
 celery_app.conf.beat_schedule = {
+    # Per-user jobs fan out across workers by user shard (app/tasks/shards.py)
     "check-statement-due-dates": {
-        "task": "app.tasks.notifications.check_statement_due_dates",
+        "task": "app.tasks.shards.dispatch_shards",
+        "kwargs": {"job": "statement_due"},
         "schedule": crontab(hour=9, minute=0),  # 9am Asia/Manila daily
     },
     "generate-recurring-transactions": {
-        "task": "app.tasks.recurring.generate_recurring_transactions_task",
+        "task": "app.tasks.shards.dispatch_shards",
+        "kwargs": {"job": "recurring"},
         "schedule": crontab(hour=0, minute=5),  # 00:05 Asia/Manila daily
     },
+    "reconcile-ledgers": {
+        "task": "app.tasks.ledger.reconcile_ledgers_task",
+        "schedule": crontab(hour=3, minute=30),  # 03:30 Asia/Manila daily
+    },
+    "requeue-stale-documents": {
+        "task": "app.tasks.documents.requeue_stale_documents",
+        "schedule": crontab(minute="*/15"),
+    },
+    "collect-orphaned-uploads": {
+        "task": "app.tasks.documents.collect_orphaned_uploads",
+        "schedule": crontab(hour=4, minute=0),  # 04:00 Asia/Manila daily
+    },
 }
@@ -1,9 +1,183 @@
+import uuid
+from celery.signals import worker_process_shutdown, worker_shutdown
+from app.tasks import runtime
 from app.tasks.celery import celery_app
 from app.core.logging import log
 
 
-@celery_app.task(bind=True, max_retries=3)
+def is_extractable(document_type: str, file_path: str) -> bool:
+    return document_type == "cc_statement" and file_path.lower().endswith(".pdf")
+
+
+@celery_app.task(bind=True, name="app.tasks.documents.process_document")
 def process_document(self, document_id: str) -> dict:
-    """OCR/PDF parsing — implemented in Phase 2."""
-    log.info("process_document.placeholder", document_id=document_id)
-    return {"status": "placeholder", "document_id": document_id}
+    """Extract the transactions of a PDF statement into extracted_data.
+
+    pending -> processing -> done, or failed with error_message. Documents
+    that aren't PDF statements, or aren't pending, are left alone. The row
+    is only claimed and finished under this task's id (its celery_task_id),
+    so once requeue_stale_documents hands a document to a new task, a
+    late-finishing old one can't overwrite it.
+    """
+    from app.services.parser import parse_bulk
+    from app.services.pdf_extract import iter_statement_lines
+
+    task_id = self.request.id
+    file_path = runtime.run(_start(uuid.UUID(document_id), task_id))
+    if file_path is None:
+        return {"status": "skipped", "document_id": document_id}
+
+    try:
+        transactions = []
+        lines = 0
+        for chunk in iter_statement_lines(file_path):
+            lines += len(chunk)
+            transactions.extend(parse_bulk("\n".join(chunk)).transactions)
+    except Exception as exc:
+        log.error("process_document.failed", document_id=document_id, detail=str(exc))
+        finished = runtime.run(
+            _finish(uuid.UUID(document_id), task_id, "failed", error_message=str(exc)[:500])
+        )
+        return {"status": "failed" if finished else "superseded", "document_id": document_id}
+
+    extracted = {
+        "transactions": [t.model_dump(mode="json") for t in transactions],
+        "count": len(transactions),
+    }
+    if not runtime.run(_finish(uuid.UUID(document_id), task_id, "done", extracted_data=extracted)):
+        log.warning("process_document.superseded", document_id=document_id, task_id=task_id)
+        return {"status": "superseded", "document_id": document_id}
+    log.info("process_document.done", document_id=document_id, lines=lines, transactions=len(transactions))
+    return {"status": "done", "document_id": document_id}
+
+
+async def _start(document_id: uuid.UUID, task_id: str | None) -> str | None:
+    """Claim a pending PDF statement for processing; returns its file path."""
+    from sqlalchemy import func, update
+    from app.core.database import AsyncSessionLocal
+    from app.models.document import Document, DocumentStatus, DocumentType
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(Document)
+            .where(
+                Document.id == document_id,
+                Document.status == DocumentStatus.pending,
+                Document.document_type == DocumentType.cc_statement,
+                Document.file_path.ilike("%.pdf"),
+                Document.celery_task_id == task_id,
+            )
+            .values(status=DocumentStatus.processing, processing_started_at=func.now())
+            .returning(Document.file_path)
+        )
+        file_path = result.scalar_one_or_none()
+        await db.commit()
+    return file_path
+
+
+async def _finish(document_id: uuid.UUID, task_id: str | None, status: str, **values) -> bool:
+    """Record the outcome; False if the document is no longer this task's."""
+    from sqlalchemy import update
+    from app.core.database import AsyncSessionLocal
+    from app.models.document import Document, DocumentStatus
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(Document)
+            .where(
+                Document.id == document_id,
+                Document.status == DocumentStatus.processing,
+                Document.celery_task_id == task_id,
+            )
+            .values(status=status, processing_started_at=None, **values)
+        )
+        await db.commit()
+    return result.rowcount == 1
+
+
+@celery_app.task(name="app.tasks.documents.requeue_stale_documents")
+def requeue_stale_documents() -> int:
+    """Every 15 minutes: requeue documents whose extraction lost its worker.
+
+    A worker killed between claiming a document and finishing it leaves the
+    row processing, and its task message is already acknowledged, so
+    nothing else would retry it. A statement whose task could not be
+    enqueued at upload stays pending; it is sent again once it is older than
+    the timeout. Returns how many were requeued.
+    """
+    requeued = runtime.run(_reset_stale())
+    for document_id, task_id in requeued:
+        process_document.apply_async(args=[str(document_id)], task_id=task_id)
+    if requeued:
+        log.warning("process_document.requeued", documents=len(requeued))
+    return len(requeued)
+
+
+async def _reset_stale() -> list[tuple[uuid.UUID, str]]:
+    """Find timed-out statements to requeue, as (document id, task id).
+
+    Pending ones keep their task id, so a message that was enqueued after
+    all only claims the document once. Processing ones go back to pending
+    with a new task id.
+    """
+    from datetime import timedelta
+    from sqlalchemy import String, cast, func, select, update
+    from app.core.config import settings
+    from app.core.database import AsyncSessionLocal
+    from app.models.document import Document, DocumentStatus, DocumentType
+
+    timeout = timedelta(seconds=settings.document_processing_timeout_seconds)
+    async with AsyncSessionLocal() as db:
+        # Only upload sets a task id on a pending document, and only for PDF
+        # statements; read these before the reset below adds to them.
+        result = await db.execute(
+            select(Document.id, Document.celery_task_id).where(
+                Document.status == DocumentStatus.pending,
+                Document.document_type == DocumentType.cc_statement,
+                Document.file_path.ilike("%.pdf"),
+                Document.celery_task_id.isnot(None),
+                Document.created_at < func.now() - timeout,
+            )
+        )
+        requeued = [tuple(row) for row in result.all()]
+        # Only process_document sets processing_started_at; a status set by
+        # hand through the API is not ours to reset.
+        result = await db.execute(
+            update(Document)
+            .where(
+                Document.status == DocumentStatus.processing,
+                Document.processing_started_at < func.now() - timeout,
+            )
+            .values(
+                status=DocumentStatus.pending,
+                processing_started_at=None,
+                celery_task_id=cast(func.gen_random_uuid(), String),
+            )
+            .returning(Document.id, Document.celery_task_id)
+        )
+        requeued += [tuple(row) for row in result.all()]
+        await db.commit()
+    return requeued
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _on_worker_shutdown(**kwargs) -> None:
+    from app.services import pdf_extract
+
+    pdf_extract.shutdown()
+
+
+@celery_app.task(name="app.tasks.documents.collect_orphaned_uploads")
+def collect_orphaned_uploads() -> int:
+    """Nightly: delete uploaded files no document references."""
+    from pathlib import Path
+    from app.core.config import settings
+    from app.core.database import AsyncSessionLocal
+    from app.services.uploads import collect_orphans
+
+    async def _run() -> int:
+        async with AsyncSessionLocal() as db:
+            return await collect_orphans(db, Path(settings.upload_dir))
+
+    return runtime.run(_run())
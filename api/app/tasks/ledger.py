@@ -0,0 +1,16 @@
+from app.tasks import runtime
+from app.tasks.celery import celery_app
+
+
+@celery_app.task(name="app.tasks.ledger.reconcile_ledgers_task")
+def reconcile_ledgers_task() -> dict[str, int]:
+    """Nightly: rebuild the ledger tables from transactions and report drift."""
+    from app.core.database import AsyncSessionLocal
+    from app.services.ledger import reconcile_ledgers
+
+    async def _run() -> dict[str, int]:
+        async with AsyncSessionLocal() as db:
+            report = await reconcile_ledgers(db)
+        return {table: len(drift) for table, drift in report.items()}
+
+    return runtime.run(_run())
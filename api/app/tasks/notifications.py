@@ -1,67 +1,98 @@
+from app.services.sharding import Shard
+from app.tasks import runtime
 from app.tasks.celery import celery_app
 
+TARGET_DAYS = (7, 1)
+FANOUT_CONCURRENCY = 20
+
 
 @celery_app.task(name="app.tasks.notifications.check_statement_due_dates")
 def check_statement_due_dates() -> None:
     """Daily task: notify users about statements due in 7 or 1 day."""
-    import asyncio
-    asyncio.run(_async_check_statements())
+    runtime.run(_async_check_statements())
+
 
+async def _async_check_statements(shard: Shard | None = None) -> int:
+    """Notify about unpaid statements due in 7 or 1 day; returns how many were created.
 
-async def _async_check_statements() -> None:
+    Every reminder carries a dedup_key (statement, due date, lead time), so one
+    INSERT ... ON CONFLICT DO NOTHING both creates the new reminders and skips
+    ones already sent by an earlier or concurrent run. Discord, pub/sub and
+    push go out concurrently once the batch is committed.
+    """
+    import asyncio
     from datetime import date, timedelta
-    from sqlalchemy import select, func, cast, Date
+    from sqlalchemy import select, true
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
     from app.core.database import AsyncSessionLocal
     from app.models.statement import Statement
     from app.models.credit_card import CreditCard
     from app.models.notification import Notification, NotificationType
-    from app.services.discord import send_discord_notification
+    from app.services.discord import embed, send_discord_embeds
+    from app.services.pubsub import publish_notification
+    from app.services.web_push import Push, send_pushes
 
     today = date.today()
-    target_days = [7, 1]
+    lead_days = {today + timedelta(days=days): days for days in TARGET_DAYS}
 
     async with AsyncSessionLocal() as db:
-        for days in target_days:
-            target_date = today + timedelta(days=days)
+        result = await db.execute(
+            select(Statement, CreditCard.user_id)
+            .join(CreditCard, Statement.credit_card_id == CreditCard.id)
+            .where(
+                Statement.due_date.in_(lead_days),
+                Statement.is_paid == False,  # noqa: E712
+                shard.contains(CreditCard.user_id) if shard else true(),
+            )
+        )
+        values = []
+        for stmt, user_id in result.all():
+            days = lead_days[stmt.due_date]
+            label = "Tomorrow" if days == 1 else f"in {days} Days"
+            amount = float(stmt.total_amount or 0)
+            values.append({
+                "user_id": user_id,
+                "type": NotificationType.statement_due,
+                "title": f"Statement Due {label}",
+                "message": (
+                    f"Your credit card statement (₱{amount:,.2f}) "
+                    f"is due on {stmt.due_date}."
+                ),
+                "metadata_": {"statement_id": str(stmt.id), "days": days},
+                "dedup_key": f"statement_due:{stmt.id}:{stmt.due_date}:{days}",
+            })
+        if not values:
+            return 0
 
-            result = await db.execute(
-                select(Statement, CreditCard)
-                .join(CreditCard, Statement.credit_card_id == CreditCard.id)
-                .where(
-                    Statement.due_date == target_date,
-                    Statement.is_paid == False,  # noqa: E712
-                )
+        inserted = await db.execute(
+            pg_insert(Notification)
+            .values(values)
+            .on_conflict_do_nothing(
+                index_elements=[Notification.user_id, Notification.dedup_key],
+                index_where=Notification.dedup_key.isnot(None),
             )
-            rows = result.all()
+            .returning(Notification.id, Notification.user_id, Notification.title, Notification.message)
+        )
+        created = inserted.all()
+        await db.commit()
 
-            for stmt, cc in rows:
-                # Dedup: skip if already notified today for this statement+days
-                # Use DB-side date cast to avoid Python local-date vs UTC mismatch
-                existing = await db.execute(
-                    select(Notification).where(
-                        Notification.type == NotificationType.statement_due,
-                        Notification.metadata_["statement_id"].astext == str(stmt.id),
-                        Notification.metadata_["days"].astext == str(days),
-                        cast(Notification.created_at, Date) == func.current_date(),
-                    )
-                )
-                if existing.scalar_one_or_none():
-                    continue
+        limit = asyncio.Semaphore(FANOUT_CONCURRENCY)
 
-                label = "Tomorrow" if days == 1 else f"in {days} Days"
-                title = f"Statement Due {label}"
-                amount = float(stmt.total_amount or 0)
-                message = (
-                    f"Your credit card statement (₱{amount:,.2f}) "
-                    f"is due on {stmt.due_date}."
-                )
-                n = Notification(
-                    user_id=cc.user_id,
-                    type=NotificationType.statement_due,
-                    title=title,
-                    message=message,
-                    metadata_={"statement_id": str(stmt.id), "days": days},
-                )
-                db.add(n)
-                await db.commit()
-                await send_discord_notification(title, message)
+        async def bounded(coro):
+            async with limit:
+                return await coro
+
+        sends = [
+            bounded(publish_notification(
+                n.user_id,
+                {"id": str(n.id), "type": "statement_due", "title": n.title, "message": n.message},
+            ))
+            for n in created
+        ]
+        # Discord batches embeds and web push bounds its own concurrency
+        sends.append(send_discord_embeds([embed(n.title, n.message) for n in created]))
+        sends.append(send_pushes(db, [Push(n.user_id, n.title, n.message) for n in created]))
+        # Each sender already handles its own delivery errors; return_exceptions
+        # keeps one unexpected failure from cancelling the rest.
+        await asyncio.gather(*sends, return_exceptions=True)
+    return len(created)
@@ -1,5 +1,4 @@
-import asyncio
-
+from app.tasks import runtime
 from app.tasks.celery import celery_app
 
 
@@ -7,4 +6,4 @@ from app.tasks.celery import celery_app
 def generate_recurring_transactions_task():
     from app.services.recurring import generate_recurring_transactions
 
-    return asyncio.run(generate_recurring_transactions())
+    return runtime.run(generate_recurring_transactions())
@@ -0,0 +1,87 @@
+"""Long-lived asyncio runtime for Celery worker processes.
+
+Celery tasks are synchronous, but the services they call are async. Calling
+asyncio.run() per task builds and tears down an event loop every time, and
+the shared engine's asyncpg pool can't be reused across loops, so each
+task paid for fresh connections (or tripped over ones bound to a dead
+loop).
+
+Instead, each worker process runs one event loop in a background thread,
+started from the worker_process_init signal, and tasks submit coroutines
+to it with run(). The engine in app.core.database is only ever used from
+that loop, so its pool stays warm across tasks. Outside a prefork worker
+(solo/threads pools, eager mode, scripts) the runtime starts lazily on
+first use.
+"""
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from app.core.logging import log
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_thread: threading.Thread | None = None
+_lock = threading.Lock()
+
+
+def start() -> asyncio.AbstractEventLoop:
+    """Start the process's event loop thread if it isn't running yet."""
+    global _loop, _thread
+    with _lock:
+        if _loop is not None and _thread is not None and _thread.is_alive():
+            return _loop
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=loop.run_forever, name="celery-asyncio-runtime", daemon=True
+        )
+        thread.start()
+        _loop, _thread = loop, thread
+        log.info("task_runtime.started")
+        return loop
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on the worker's loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, start()).result()
+
+
+def stop() -> None:
+    """Close pooled connections on the loop that opened them, then stop it."""
+    global _loop, _thread
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop = _thread = None
+    if loop is None or thread is None:
+        return
+    from app.core.database import engine
+    from app.services import discord
+
+    for close in (discord.close, engine.dispose):
+        try:
+            asyncio.run_coroutine_threadsafe(close(), loop).result(timeout=10)
+        except Exception as exc:
+            log.warning("task_runtime.dispose_failed", detail=str(exc))
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=10)
+    loop.close()
+    log.info("task_runtime.stopped")
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs) -> None:
+    from app.core.database import engine
+
+    # Connections inherited across fork belong to the parent; drop them
+    # without closing the parent's sockets.
+    engine.sync_engine.dispose(close=False)
+    start()
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**kwargs) -> None:
+    stop()
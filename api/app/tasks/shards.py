@@ -0,0 +1,122 @@
+"""Sharded fan-out for the daily per-user jobs.
+
+Beat triggers dispatch_shards for a job. It splits users into
+``job_shard_count`` shards (app/services/sharding.py) and sends one
+run_shard task per shard as a Celery group, so the work spreads across
+workers instead of running as one long serial task.
+
+Each run has an id (by default today's date), and its shard states live in
+the Redis hash ``shard-run:{job}:{run_id}``, with TTL RUN_STATE_TTL. Each
+shard's entry holds its status, duration and processed count. Dispatching
+the same run again sends only the shards that are not done, which is how
+failed or lost shards are resumed:
+
+    dispatch_shards.delay("recurring", run_id="2026-10-17")
+"""
+import json
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date
+
+from celery import group
+from redis import RedisError
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.logging import log
+from app.services.sharding import Shard, all_shards
+from app.tasks import runtime
+from app.tasks.celery import celery_app
+
+RUN_STATE_TTL = 7 * 24 * 3600
+_COUNT_FIELD = "count"
+
+
+async def _recurring(shard: Shard) -> int:
+    from app.services.recurring import generate_recurring_transactions
+
+    return await generate_recurring_transactions(shard=shard)
+
+
+async def _statement_due(shard: Shard) -> int:
+    from app.tasks.notifications import _async_check_statements
+
+    return await _async_check_statements(shard)
+
+
+# Job name -> coroutine processing one shard, returning how many items it handled
+JOBS: dict[str, Callable[[Shard], Awaitable[int]]] = {
+    "recurring": _recurring,
+    "statement_due": _statement_due,
+}
+
+
+def _run_key(job: str, run_id: str) -> str:
+    return f"shard-run:{job}:{run_id}"
+
+
+def run_state(job: str, run_id: str) -> dict[int, dict]:
+    """Recorded state of each shard of a run that has been dispatched."""
+    raw = metrics.get_sync_redis().hgetall(_run_key(job, run_id))
+    raw.pop(_COUNT_FIELD, None)
+    return {int(index): json.loads(state) for index, state in raw.items()}
+
+
+def _record(job: str, run_id: str, index: int, **state) -> None:
+    key = _run_key(job, run_id)
+    try:
+        redis = metrics.get_sync_redis()
+        redis.hset(key, str(index), json.dumps(state))
+        redis.expire(key, RUN_STATE_TTL)
+    except RedisError as exc:
+        log.warning("shards.record_failed", job=job, run_id=run_id, shard=index, detail=str(exc))
+
+
+@celery_app.task(name="app.tasks.shards.dispatch_shards")
+def dispatch_shards(job: str, run_id: str | None = None) -> list[int]:
+    """Send every shard of ``job`` that isn't done yet for this run; returns their indexes."""
+    if job not in JOBS:
+        raise ValueError(f"Unknown sharded job: {job}")
+    run_id = run_id or date.today().isoformat()
+    key = _run_key(job, run_id)
+    redis = metrics.get_sync_redis()
+
+    # A resumed run keeps the shard count it started with, even if the
+    # setting changed since, so every user still belongs to exactly one shard.
+    redis.hsetnx(key, _COUNT_FIELD, settings.job_shard_count)
+    redis.expire(key, RUN_STATE_TTL)
+    count = int(redis.hget(key, _COUNT_FIELD))
+    state = run_state(job, run_id)
+    pending = [
+        shard.index for shard in all_shards(count)
+        if state.get(shard.index, {}).get("status") != "done"
+    ]
+    for index in pending:
+        _record(job, run_id, index, status="queued")
+    if pending:
+        group(run_shard.s(job, run_id, index, count) for index in pending).apply_async()
+    log.info("shards.dispatched", job=job, run_id=run_id, shards=len(pending), total=count)
+    return pending
+
+
+@celery_app.task(name="app.tasks.shards.run_shard", acks_late=True)
+def run_shard(job: str, run_id: str, index: int, count: int) -> int:
+    _record(job, run_id, index, status="running")
+    start = time.perf_counter()
+    try:
+        processed = runtime.run(JOBS[job](Shard(index, count)))
+    except Exception as exc:
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        _record(job, run_id, index, status="failed", duration_ms=duration_ms, error=str(exc)[:500])
+        metrics.incr(f"shards.{job}.failed")
+        log.error("shards.failed", job=job, run_id=run_id, shard=index, detail=str(exc))
+        raise
+    duration_ms = int((time.perf_counter() - start) * 1000)
+    _record(job, run_id, index, status="done", duration_ms=duration_ms, processed=processed)
+    metrics.incr(f"shards.{job}.done")
+    metrics.incr(f"shards.{job}.duration_ms", duration_ms)
+    log.info(
+        "shards.done", job=job, run_id=run_id, shard=index,
+        duration_ms=duration_ms, processed=processed,
+    )
+    return processed
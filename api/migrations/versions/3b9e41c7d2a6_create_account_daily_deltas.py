@@ -0,0 +1,52 @@
+"""Create account_daily_deltas ledger and backfill it from transactions
+
+Revision ID: 3b9e41c7d2a6
+Revises: 754c80708b52
+Create Date: 2026-10-17
+"""
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9e41c7d2a6"
+down_revision: str | None = "754c80708b52"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def upgrade() -> None:
+    op.create_table(
+        "account_daily_deltas",
+        sa.Column("account_id", sa.UUID(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("delta", sa.Numeric(15, 2), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(
+            ["account_id"], ["accounts.id"],
+            name=op.f("fk_account_daily_deltas_account_id_accounts"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("account_id", "date", name=op.f("pk_account_daily_deltas")),
+    )
+    # Same semantics as app/services/ledger.py::balance_effects
+    op.execute(
+        """
+        INSERT INTO account_daily_deltas (account_id, date, delta)
+        SELECT account_id, date, SUM(delta)
+        FROM (
+            SELECT account_id, date,
+                   CASE WHEN type = 'income' THEN amount ELSE -amount END
+                   - COALESCE(fee_amount, 0) AS delta
+            FROM transactions
+            UNION ALL
+            SELECT to_account_id, date, amount
+            FROM transactions
+            WHERE type = 'transfer' AND to_account_id IS NOT NULL
+        ) AS effects
+        GROUP BY account_id, date
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("account_daily_deltas")
@@ -0,0 +1,63 @@
+"""Create account_balances ledger and backfill it from transactions
+
+Revision ID: 754c80708b52
+Revises: e5f6a7b8c9e0
+Create Date: 2026-10-17
+"""
+
+# revision identifiers, used by Alembic.
+revision: str = "754c80708b52"
+down_revision: str | None = "e5f6a7b8c9e0"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def upgrade() -> None:
+    op.create_table(
+        "account_balances",
+        sa.Column("account_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "transactions_net",
+            sa.Numeric(15, 2),
+            server_default="0",
+            nullable=False,
+            comment="income + transfer-in - expense - transfer-out - fees",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["account_id"], ["accounts.id"],
+            name=op.f("fk_account_balances_account_id_accounts"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("account_id", name=op.f("pk_account_balances")),
+    )
+    # Same semantics as app/services/ledger.py::balance_effects
+    op.execute(
+        """
+        INSERT INTO account_balances (account_id, transactions_net)
+        SELECT account_id, SUM(delta)
+        FROM (
+            SELECT account_id,
+                   CASE WHEN type = 'income' THEN amount ELSE -amount END
+                   - COALESCE(fee_amount, 0) AS delta
+            FROM transactions
+            UNION ALL
+            SELECT to_account_id, amount
+            FROM transactions
+            WHERE type = 'transfer' AND to_account_id IS NOT NULL
+        ) AS effects
+        GROUP BY account_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("account_balances")
@@ -0,0 +1,79 @@
+"""Create monthly_rollups and backfill it from transactions
+
+Revision ID: a7d3e9f1c4b2
+Revises: 3b9e41c7d2a6
+Create Date: 2026-10-17
+"""
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d3e9f1c4b2"
+down_revision: str | None = "3b9e41c7d2a6"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+def upgrade() -> None:
+    op.create_table(
+        "monthly_rollups",
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuidv7()"), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False, comment="First day of the calendar month"),
+        sa.Column("category_id", sa.UUID(), nullable=True),
+        sa.Column("account_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "type",
+            postgresql.ENUM("income", "expense", "transfer", name="transactiontype", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("total", sa.Numeric(15, 2), server_default="0", nullable=False),
+        sa.Column("txn_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"],
+            name=op.f("fk_monthly_rollups_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["category_id"], ["categories.id"],
+            name=op.f("fk_monthly_rollups_category_id_categories"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["account_id"], ["accounts.id"],
+            name=op.f("fk_monthly_rollups_account_id_accounts"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_monthly_rollups")),
+    )
+    op.create_index(
+        "uq_monthly_rollups_key",
+        "monthly_rollups",
+        ["user_id", "month", "category_id", "account_id", "type"],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+    op.create_index(op.f("ix_monthly_rollups_category_id"), "monthly_rollups", ["category_id"])
+    op.create_index(op.f("ix_monthly_rollups_account_id"), "monthly_rollups", ["account_id"])
+    # Same grouping as app/services/ledger.py::_rollups_from_transactions
+    op.execute(
+        """
+        INSERT INTO monthly_rollups (user_id, month, category_id, account_id, type, total, txn_count)
+        SELECT user_id, date_trunc('month', date)::date, category_id, account_id, type,
+               SUM(amount), COUNT(*)
+        FROM transactions
+        GROUP BY 1, 2, 3, 4, 5
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("monthly_rollups")
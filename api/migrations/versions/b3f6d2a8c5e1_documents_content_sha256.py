@@ -0,0 +1,33 @@
+"""Content hash on documents
+
+Revision ID: b3f6d2a8c5e1
+Revises: e2b7c9d4f1a6
+Create Date: 2026-10-17
+"""
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f6d2a8c5e1"
+down_revision: str | None = "e2b7c9d4f1a6"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def upgrade() -> None:
+    # Existing documents keep a NULL hash: they are never matched as
+    # duplicates, and their files stay where they are.
+    op.add_column("documents", sa.Column("content_sha256", sa.String(64), nullable=True))
+    op.create_index(
+        "uq_documents_user_content",
+        "documents",
+        ["user_id", "content_sha256"],
+        unique=True,
+        postgresql_where=sa.text("content_sha256 IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_documents_user_content", table_name="documents")
+    op.drop_column("documents", "content_sha256")
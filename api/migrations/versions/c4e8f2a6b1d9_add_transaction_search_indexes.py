@@ -0,0 +1,53 @@
+"""Add trigram and full-text search indexes on transactions.description
+
+Revision ID: c4e8f2a6b1d9
+Revises: a7d3e9f1c4b2
+Create Date: 2026-10-17
+"""
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e8f2a6b1d9"
+down_revision: str | None = "a7d3e9f1c4b2"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Stored generated column: adding it rewrites the table once.
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple'::regconfig, COALESCE(description, ''::text))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_transactions_description_trgm",
+        "transactions",
+        ["description"],
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_transactions_search_vector",
+        "transactions",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_search_vector", table_name="transactions")
+    op.drop_index("ix_transactions_description_trgm", table_name="transactions")
+    op.drop_column("transactions", "search_vector")
+    # pg_trgm is left installed; it may have existed before this revision.
@@ -0,0 +1,28 @@
+"""Processing start time on documents
+
+Revision ID: c7e4a1f9d3b2
+Revises: b3f6d2a8c5e1
+Create Date: 2026-10-17
+"""
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e4a1f9d3b2"
+down_revision: str | None = "b3f6d2a8c5e1"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def upgrade() -> None:
+    # Set when process_document claims a document, so one whose worker died
+    # can be told apart from one still being read.
+    op.add_column(
+        "documents",
+        sa.Column("processing_started_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("documents", "processing_started_at")
@@ -0,0 +1,46 @@
+"""Unique (recurring_id, date) on transactions
+
+Revision ID: d8a1f3c5e7b9
+Revises: c4e8f2a6b1d9
+Create Date: 2026-10-17
+"""
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a1f3c5e7b9"
+down_revision: str | None = "c4e8f2a6b1d9"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def upgrade() -> None:
+    # Keep the earliest row of any existing duplicate as the rule's
+    # occurrence; later copies stay as ordinary transactions.
+    op.execute(
+        """
+        UPDATE transactions SET recurring_id = NULL
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY recurring_id, date ORDER BY created_at, id
+                ) AS rn
+                FROM transactions
+                WHERE recurring_id IS NOT NULL
+            ) ranked
+            WHERE rn > 1
+        )
+        """
+    )
+    op.create_index(
+        "uq_transactions_recurring_occurrence",
+        "transactions",
+        ["recurring_id", "date"],
+        unique=True,
+        postgresql_where=sa.text("recurring_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_transactions_recurring_occurrence", table_name="transactions")
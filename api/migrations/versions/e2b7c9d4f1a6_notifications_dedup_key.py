@@ -0,0 +1,51 @@
+"""Dedup key on notifications
+
+Revision ID: e2b7c9d4f1a6
+Revises: d8a1f3c5e7b9
+Create Date: 2026-10-17
+"""
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7c9d4f1a6"
+down_revision: str | None = "d8a1f3c5e7b9"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def upgrade() -> None:
+    op.add_column("notifications", sa.Column("dedup_key", sa.String(255), nullable=True))
+    # Existing statement reminders get the key the task now uses, so a run
+    # right after deploy doesn't repeat today's reminders. If there are
+    # duplicates, only the earliest one gets the key.
+    op.execute(
+        """
+        UPDATE notifications n SET dedup_key = ranked.key
+        FROM (
+            SELECT n2.id,
+                   'statement_due:' || s.id || ':' || s.due_date || ':' || (n2.metadata->>'days') AS key,
+                   row_number() OVER (
+                       PARTITION BY n2.user_id, s.id, s.due_date, n2.metadata->>'days'
+                       ORDER BY n2.created_at, n2.id
+                   ) AS rn
+            FROM notifications n2
+            JOIN statements s ON s.id::text = n2.metadata->>'statement_id'
+            WHERE n2.type = 'statement_due' AND n2.metadata ? 'days'
+        ) ranked
+        WHERE n.id = ranked.id AND ranked.rn = 1
+        """
+    )
+    op.create_index(
+        "uq_notifications_dedup_key",
+        "notifications",
+        ["user_id", "dedup_key"],
+        unique=True,
+        postgresql_where=sa.text("dedup_key IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_notifications_dedup_key", table_name="notifications")
+    op.drop_column("notifications", "dedup_key")
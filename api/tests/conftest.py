@@ -1,6 +1,8 @@
+from contextlib import contextmanager
+import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy import NullPool, text
+from sqlalchemy import NullPool, event, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
@@ -9,6 +11,7 @@ from sqlalchemy.ext.asyncio import (
 from app.main import app
 from app.core.database import Base, get_db
 from app.core.config import settings
+from app.services import user_cache
 
 
 TEST_DATABASE_URL = settings.test_database_url or settings.database_url.replace(
@@ -31,6 +34,12 @@ async def setup_test_database():
     await engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    """Tables are truncated between tests; cached users must not outlive them."""
+    user_cache.clear()
+
+
 @pytest_asyncio.fixture
 async def db(setup_test_database) -> AsyncSession:
     """Per-test async session. Truncates all tables after each test for isolation."""
@@ -45,6 +54,30 @@ async def db(setup_test_database) -> AsyncSession:
     await engine.dispose()
 
 
+@pytest.fixture
+def count_queries(db: AsyncSession):
+    """Collect the SQL statements run on the test session's engine.
+
+        with count_queries() as statements:
+            await auth_client.get("/credit-cards")
+        assert len(statements) == 3
+    """
+    @contextmanager
+    def counting():
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.bind.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.bind.sync_engine, "before_cursor_execute", record)
+
+    return counting
+
+
 @pytest_asyncio.fixture
 async def client(db: AsyncSession):
     """HTTP client with DB dependency overridden to use test session."""
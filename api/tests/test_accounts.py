@@ -92,3 +92,53 @@ async def test_account_institution_is_null_for_cash(auth_client):
     assert r.status_code == 201
     assert r.json()["institution_id"] is None
     assert r.json()["institution"] is None
+
+
+@pytest.mark.asyncio
+async def test_balance_history_and_as_of(client):
+    await client.post("/auth/register", json={"email": "hist@test.com", "name": "H", "password": "changeme123"})
+    r = await client.post("/accounts", json={"name": "Wallet", "type": "wallet", "opening_balance": "1000.00"})
+    account_id = r.json()["id"]
+    for day, amount, kind in [
+        ("2026-01-05", "200.00", "expense"),
+        ("2026-01-20", "500.00", "income"),
+        ("2026-02-03", "100.00", "expense"),
+    ]:
+        await client.post("/transactions", json={
+            "account_id": account_id, "amount": amount, "type": kind, "date": day,
+        })
+
+    r = await client.get(f"/accounts/{account_id}/balance", params={"as_of": "2026-01-19"})
+    assert r.status_code == 200
+    assert r.json()["balance"] == "800.00"
+
+    r = await client.get(f"/accounts/{account_id}/balance-history", params={
+        "from": "2026-01-01", "to": "2026-02-10", "granularity": "month",
+    })
+    assert r.status_code == 200
+    assert r.json()["points"] == [
+        {"date": "2026-01-31", "balance": "1300.00"},
+        {"date": "2026-02-10", "balance": "1200.00"},
+    ]
+
+    r = await client.get(f"/accounts/{account_id}/balance-history", params={
+        "from": "2026-01-04", "to": "2026-01-06",
+    })
+    assert [p["balance"] for p in r.json()["points"]] == ["1000.00", "800.00", "800.00"]
+
+    r = await client.get(f"/accounts/{account_id}/balance-history", params={
+        "from": "2026-02-01", "to": "2026-01-01",
+    })
+    assert r.status_code == 422
+
+    # Bounds at the edge of datetime.date, and spans too long to walk day by day
+    for params in (
+        {"from": "0001-01-01", "to": "0001-01-10"},
+        {"from": "9999-12-01", "to": "9999-12-31", "granularity": "week"},
+        {"from": "2000-01-01", "to": "2026-01-01"},
+    ):
+        r = await client.get(f"/accounts/{account_id}/balance-history", params=params)
+        assert r.status_code == 422
+    # The default window is clipped at the earliest supported date
+    r = await client.get(f"/accounts/{account_id}/balance-history", params={"to": "0001-01-10"})
+    assert r.json()["points"][0]["date"] == "0001-01-02"
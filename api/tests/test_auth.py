@@ -148,3 +148,51 @@ async def test_register_empty_name_rejected(client):
         "email": "noname@test.com", "name": "", "password": "validpass123"
     })
     assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_me_served_from_user_cache(client, count_queries):
+    from app.services import user_cache
+
+    await client.post("/auth/register", json={
+        "email": "cache@example.com", "name": "Cached", "password": "password123"
+    })
+    with count_queries() as statements:
+        for _ in range(3):
+            r = await client.get("/auth/me")
+            assert r.status_code == 200
+    assert len([s for s in statements if "FROM users" in s]) == 1
+    assert user_cache.stats()["hit"] == 2
+
+    # Profile and password changes invalidate the cached row
+    await client.patch("/auth/me", json={"name": "Renamed"})
+    assert (await client.get("/auth/me")).json()["name"] == "Renamed"
+    r = await client.post("/auth/change-password", json={
+        "current_password": "password123", "new_password": "newpassword1",
+    })
+    assert r.status_code == 200
+    r = await client.post("/auth/change-password", json={
+        "current_password": "password123", "new_password": "otherpassword1",
+    })
+    assert r.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_user_cache_redis_layer(client, monkeypatch):
+    from app.core.config import settings
+    from app.services import user_cache
+
+    monkeypatch.setattr(settings, "user_cache_redis", True)
+    await client.post("/auth/register", json={
+        "email": "shared@example.com", "name": "Shared", "password": "password123"
+    })
+    assert (await client.get("/auth/me")).status_code == 200
+    # Another worker: empty local cache, warm Redis
+    user_cache._entries.clear()
+    r = await client.get("/auth/me")
+    assert r.status_code == 200 and r.json()["email"] == "shared@example.com"
+    assert user_cache.stats()["redis_hit"] == 1
+
+    await client.patch("/auth/me", json={"name": "Renamed"})
+    user_cache._entries.clear()
+    assert (await client.get("/auth/me")).json()["name"] == "Renamed"
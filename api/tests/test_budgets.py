@@ -232,18 +232,19 @@ async def test_budget_status_wrong_category_not_counted(
     assert items[0]["spent"] == "0.00"
 
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy import select
 import app.core.config as cfg
 from app.models.notification import Notification, NotificationType
 from app.services.budget_alerts import check_budget_alerts
+from app.services import discord
 
 
 async def test_budget_alert_fires_at_80_percent(
     auth_client: AsyncClient, db, account_id: str, category_id: str, monkeypatch
 ):
     monkeypatch.setattr(cfg.settings, "discord_webhook_url", "")
-    monkeypatch.setattr("app.tasks.check_budget_alerts_task.delay", lambda *a, **kw: None)
+    monkeypatch.setattr("app.tasks.check_budget_alerts_task.apply_async", lambda *a, **kw: None)
 
     # Create budget ₱10,000
     await auth_client.post("/budgets", json={
@@ -280,7 +281,7 @@ async def test_budget_alert_not_duplicated(
     auth_client: AsyncClient, db, account_id: str, category_id: str, monkeypatch
 ):
     monkeypatch.setattr(cfg.settings, "discord_webhook_url", "")
-    monkeypatch.setattr("app.tasks.check_budget_alerts_task.delay", lambda *a, **kw: None)
+    monkeypatch.setattr("app.tasks.check_budget_alerts_task.apply_async", lambda *a, **kw: None)
 
     await auth_client.post("/budgets", json={
         "type": "category", "category_id": category_id, "amount": "10000.00"
@@ -327,7 +328,7 @@ async def test_budget_exceeded_alert(
     auth_client: AsyncClient, db, account_id: str, category_id: str, monkeypatch
 ):
     monkeypatch.setattr(cfg.settings, "discord_webhook_url", "")
-    monkeypatch.setattr("app.tasks.check_budget_alerts_task.delay", lambda *a, **kw: None)
+    monkeypatch.setattr("app.tasks.check_budget_alerts_task.apply_async", lambda *a, **kw: None)
 
     await auth_client.post("/budgets", json={
         "type": "category", "category_id": category_id, "amount": "10000.00"
@@ -362,7 +363,7 @@ async def test_budget_alert_discord_called(
     auth_client: AsyncClient, db, account_id: str, category_id: str, monkeypatch
 ):
     monkeypatch.setattr(cfg.settings, "discord_webhook_url", "https://discord.com/api/webhooks/test")
-    monkeypatch.setattr("app.tasks.check_budget_alerts_task.delay", lambda *a, **kw: None)
+    monkeypatch.setattr("app.tasks.check_budget_alerts_task.apply_async", lambda *a, **kw: None)
 
     await auth_client.post("/budgets", json={
         "type": "category", "category_id": category_id, "amount": "10000.00"
@@ -380,7 +381,79 @@ async def test_budget_alert_discord_called(
         "date": str(date.today()),
         "description": "webhook test",
     })
-    with patch("app.services.discord.httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+    with patch("app.services.discord.httpx.AsyncClient.post", new_callable=AsyncMock, return_value=MagicMock()) as mock_post:
         # Run alert check synchronously inside the patch context (simulates Celery task)
         await check_budget_alerts(db, uuid.UUID(user_id))
+        await discord.close()
         mock_post.assert_called_once()
+
+
+async def test_budget_alert_query_count_is_constant(
+    auth_client: AsyncClient, db, account_id: str, monkeypatch, count_queries
+):
+    monkeypatch.setattr(cfg.settings, "discord_webhook_url", "")
+    me = await auth_client.get("/auth/me")
+    user_id = me.json()["id"]
+
+    async def add_budgets(n: int) -> None:
+        for i in range(n):
+            r = await auth_client.post("/categories", json={"name": f"Cat {i}", "type": "expense"})
+            cat_id = r.json()["id"]
+            await auth_client.post("/budgets", json={
+                "type": "category", "category_id": cat_id, "amount": "100.00"
+            })
+            await _create_expense(db, user_id, account_id, cat_id, "90.00")
+
+    async def run_check() -> int:
+        with count_queries() as statements:
+            await check_budget_alerts(db, uuid.UUID(user_id))
+        return len(statements)
+
+    await add_budgets(1)
+    single = await run_check()
+    await add_budgets(30)
+    many = await run_check()
+    assert many == single
+
+    notifs = await db.execute(
+        select(Notification).where(Notification.user_id == uuid.UUID(user_id))
+    )
+    assert len(notifs.scalars().all()) == 31
+
+
+async def test_budget_alert_dispatch_is_debounced(
+    auth_client: AsyncClient, account_id: str, monkeypatch
+):
+    from app.core import metrics
+    from app.tasks import _pending_key
+
+    enqueued = []
+    monkeypatch.setattr(
+        "app.tasks.check_budget_alerts_task.apply_async",
+        lambda *a, **kw: enqueued.append(kw),
+    )
+    me = await auth_client.get("/auth/me")
+    user_id = me.json()["id"]
+    metrics.get_sync_redis().delete(_pending_key(user_id))
+    coalesced_before = metrics.snapshot().get("budget_alerts.dispatch.coalesced", 0)
+
+    ids = []
+    for i in range(5):
+        r = await auth_client.post("/transactions", json={
+            "account_id": account_id, "amount": "10.00", "type": "expense",
+            "date": str(date.today()), "description": f"burst {i}",
+        })
+        ids.append(r.json()["id"])
+    await auth_client.patch(f"/transactions/{ids[0]}", json={"amount": "12.00"})
+    await auth_client.delete(f"/transactions/{ids[1]}")
+
+    assert len(enqueued) == 1
+    assert enqueued[0]["args"] == [user_id]
+    assert enqueued[0]["countdown"] > 0
+    metrics.wait_for_writes()
+    assert metrics.snapshot()["budget_alerts.dispatch.coalesced"] - coalesced_before == 6
+
+    # Once the queued check starts (and clears the marker) the next write queues again
+    metrics.get_sync_redis().delete(_pending_key(user_id))
+    await auth_client.delete(f"/transactions/{ids[2]}")
+    assert len(enqueued) == 2
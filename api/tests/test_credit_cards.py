@@ -108,3 +108,33 @@ async def test_delete_credit_card_not_found(auth_client):
 async def test_credit_cards_require_auth(client):
     r = await client.get("/credit-cards")
     assert r.status_code == 401
+
+
+async def test_list_credit_cards_query_count_is_constant(auth_client, count_queries):
+    inst = await auth_client.post("/institutions", json={"name": "BPI", "type": "traditional"})
+
+    async def add_cards(n: int) -> None:
+        for i in range(n):
+            account = await auth_client.post("/accounts", json={
+                "name": f"Card {i}", "type": "credit_card", "institution_id": inst.json()["id"],
+            })
+            r = await auth_client.post("/credit-cards", json={
+                "account_id": account.json()["id"], "last_four": f"{i:04d}",
+                "credit_limit": "10000.00", "statement_day": 15, "due_day": 5,
+            })
+            assert r.status_code == 201
+
+    async def list_cards() -> tuple[int, list[dict]]:
+        with count_queries() as statements:
+            r = await auth_client.get("/credit-cards")
+        assert r.status_code == 200
+        return len(statements), r.json()
+
+    await add_cards(1)
+    single, _ = await list_cards()
+    await add_cards(49)
+    many, cards = await list_cards()
+    assert many == single
+    assert len(cards) == 50
+    assert all(c["institution"]["name"] == "BPI" for c in cards)
+    assert all(c["available_credit"] == "10000.00" for c in cards)
@@ -173,3 +173,37 @@ async def test_credit_line_available_credit_decreases_with_spending(
     line_r = await auth_client.get("/credit-lines")
     line = next(ln for ln in line_r.json() if ln["id"] == credit_line_id)
     assert Decimal(line["available_credit"]) == Decimal("45000.00")
+
+
+async def test_list_credit_lines_query_count_is_constant(auth_client, count_queries):
+    async def add_lines(n: int, start: int) -> None:
+        for i in range(start, start + n):
+            line = await auth_client.post("/credit-lines", json={
+                "name": f"Line {i}", "total_limit": "20000.00",
+            })
+            for j in range(2):
+                account = await auth_client.post("/accounts", json={
+                    "name": f"Card {i}-{j}", "type": "credit_card",
+                })
+                await auth_client.post("/credit-cards", json={
+                    "account_id": account.json()["id"], "last_four": f"{j:04d}",
+                    "statement_day": 15, "due_day": 5, "credit_line_id": line.json()["id"],
+                })
+                await auth_client.post("/transactions", json={
+                    "account_id": account.json()["id"], "type": "expense",
+                    "amount": "1000.00", "date": "2026-02-24",
+                })
+
+    async def list_lines() -> tuple[int, list[dict]]:
+        with count_queries() as statements:
+            r = await auth_client.get("/credit-lines")
+        assert r.status_code == 200
+        return len(statements), r.json()
+
+    await add_lines(1, 0)
+    single, _ = await list_lines()
+    await add_lines(9, 1)
+    many, lines = await list_lines()
+    assert many == single
+    assert len(lines) == 10
+    assert all(Decimal(ln["available_credit"]) == Decimal("18000.00") for ln in lines)
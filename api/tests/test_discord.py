@@ -8,7 +8,7 @@ async def test_send_discord_calls_webhook(monkeypatch):
     monkeypatch.setattr(cfg.settings, "discord_webhook_url", "https://discord.com/api/webhooks/test")
     mock_response = MagicMock()
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock, return_value=mock_response) as mock_post:
-        await send_discord_notification("Test Title", "Test message")
+        await send_discord_notification("Test Title", "Test message", wait=True)
         mock_post.assert_called_once()
         call_kwargs = mock_post.call_args
         if call_kwargs.args:
@@ -24,7 +24,7 @@ async def test_send_discord_calls_webhook(monkeypatch):
 async def test_send_discord_skipped_when_no_url(monkeypatch):
     monkeypatch.setattr(cfg.settings, "discord_webhook_url", "")
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
-        await send_discord_notification("Title", "Message")
+        await send_discord_notification("Title", "Message", wait=True)
         mock_post.assert_not_called()
 
 
@@ -32,20 +32,97 @@ async def test_send_discord_silently_handles_network_error(monkeypatch):
     monkeypatch.setattr(cfg.settings, "discord_webhook_url", "https://discord.com/api/webhooks/test")
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock, side_effect=Exception("network error")):
         # Must not raise
-        await send_discord_notification("Title", "Message")
+        await send_discord_notification("Title", "Message", wait=True)
 
 
 async def test_send_discord_default_color(monkeypatch):
     monkeypatch.setattr(cfg.settings, "discord_webhook_url", "https://discord.com/api/webhooks/test")
-    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
-        await send_discord_notification("T", "M")
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock, return_value=MagicMock()) as mock_post:
+        await send_discord_notification("T", "M", wait=True)
         payload = mock_post.call_args.kwargs.get("json")
         assert payload["embeds"][0]["color"] == 0x5865F2
 
 
 async def test_send_discord_custom_color(monkeypatch):
     monkeypatch.setattr(cfg.settings, "discord_webhook_url", "https://discord.com/api/webhooks/test")
-    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
-        await send_discord_notification("T", "M", color=0xFF0000)
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock, return_value=MagicMock()) as mock_post:
+        await send_discord_notification("T", "M", color=0xFF0000, wait=True)
         payload = mock_post.call_args.kwargs.get("json")
         assert payload["embeds"][0]["color"] == 0xFF0000
+
+
+@pytest.fixture
+def webhook_stub(monkeypatch):
+    """Local webhook that rate-limits the first call and records the rest."""
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    received: list[dict] = []
+    calls = {"n": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            calls["n"] += 1
+            if calls["n"] == 1:
+                reply = json.dumps({"retry_after": 0.05}).encode()
+                self.send_response(429)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(reply)))
+                self.end_headers()
+                self.wfile.write(reply)
+                return
+            received.append(body)
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(cfg.settings, "discord_webhook_url", f"http://127.0.0.1:{server.server_port}/hook")
+    yield received, calls
+    server.shutdown()
+
+
+async def test_send_discord_batches_embeds_and_retries_rate_limit(webhook_stub):
+    import asyncio
+    from app.services import discord
+
+    received, calls = webhook_stub
+    await asyncio.gather(*(send_discord_notification(f"T{i}", "M", wait=True) for i in range(12)))
+
+    # First call hit the 429 and was retried; 12 embeds arrive in two messages
+    assert calls["n"] == 3
+    assert [len(body["embeds"]) for body in received] == [10, 2]
+    assert sorted(e["title"] for body in received for e in body["embeds"]) == sorted(f"T{i}" for i in range(12))
+    await discord.close()
+
+
+async def test_send_discord_returns_once_queued(webhook_stub):
+    from app.services import discord
+
+    received, calls = webhook_stub
+    await discord.send_discord_notification("T", "M")
+
+    # Nothing has been posted yet, let alone the retry after the 429
+    assert calls["n"] == 0
+    await discord.close()
+    assert calls["n"] == 2
+    assert [e["title"] for body in received for e in body["embeds"]] == ["T"]
+
+
+async def test_send_discord_logs_rejected_status(monkeypatch):
+    from app.services import discord
+
+    monkeypatch.setattr(cfg.settings, "discord_webhook_url", "https://discord.com/api/webhooks/test")
+    response = MagicMock(status_code=400, is_success=False)
+    with (
+        patch("httpx.AsyncClient.post", new_callable=AsyncMock, return_value=response) as mock_post,
+        patch.object(discord.log, "warning") as warning,
+    ):
+        await send_discord_notification("T", "M", wait=True)
+    mock_post.assert_called_once()
+    warning.assert_called_once_with("discord.rejected", status=400, embeds=1)
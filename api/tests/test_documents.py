@@ -28,6 +28,36 @@ async def test_upload_rejects_oversized_file(auth_client, tmp_path, monkeypatch)
     assert r.status_code == 413
 
 
+async def test_upload_streams_to_disk_without_leftovers(
+    auth_client, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(cfg.settings, "upload_dir", str(tmp_path))
+    contents = bytes(range(256)) * 12_000  # ~3MB, several chunks
+    r = await auth_client.post(
+        "/documents/upload",
+        files={"file": ("s.pdf", io.BytesIO(contents), "application/pdf")},
+        data={"document_type": "cc_statement"},
+    )
+    assert r.status_code == 201
+    [stored] = [p for p in tmp_path.rglob("*") if p.is_file()]
+    assert stored.read_bytes() == contents
+
+    r = await auth_client.post(
+        "/documents/upload",
+        files={
+            "file": (
+                "big.pdf",
+                io.BytesIO(b"x" * (11 * 1024 * 1024)),
+                "application/pdf",
+            )
+        },
+        data={"document_type": "cc_statement"},
+    )
+    assert r.status_code == 413
+    # The aborted upload's temporary file is gone
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == [stored]
+
+
 async def test_upload_rejects_unsupported_type(auth_client, tmp_path, monkeypatch):
     monkeypatch.setattr(cfg.settings, "upload_dir", str(tmp_path))
     r = await auth_client.post(
@@ -110,3 +140,264 @@ async def test_get_prompt_for_receipt(auth_client, tmp_path, monkeypatch):
     assert r.status_code == 200
     assert "amount" in r.json()["prompt"]
     assert "JSON" in r.json()["prompt"]
+
+
+async def test_duplicate_upload_returns_existing_document(
+    auth_client, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(cfg.settings, "upload_dir", str(tmp_path))
+
+    def upload(name):
+        return auth_client.post(
+            "/documents/upload",
+            files={
+                "file": (
+                    name,
+                    io.BytesIO(b"%PDF-1.7 same statement"),
+                    "application/pdf",
+                )
+            },
+            data={"document_type": "cc_statement"},
+        )
+
+    first = await upload("march.pdf")
+    assert first.status_code == 201
+    await auth_client.patch(
+        f"/documents/{first.json()['id']}",
+        json={"status": "done", "extracted_data": {"total": "100.00"}},
+    )
+
+    again = await upload("march (1).pdf")
+    assert again.status_code == 200
+    assert again.json()["id"] == first.json()["id"]
+    assert again.json()["extracted_data"] == {"total": "100.00"}
+    assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+
+
+async def test_duplicate_upload_with_other_type_conflicts(
+    auth_client, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(cfg.settings, "upload_dir", str(tmp_path))
+
+    def upload(document_type):
+        return auth_client.post(
+            "/documents/upload",
+            files={
+                "file": ("scan.pdf", io.BytesIO(b"%PDF-1.7 scan"), "application/pdf")
+            },
+            data={"document_type": document_type},
+        )
+
+    first = await upload("receipt")
+    assert first.status_code == 201
+    again = await upload("cc_statement")
+    assert again.status_code == 409
+    assert "receipt" in again.json()["detail"]
+    docs = (await auth_client.get("/documents")).json()
+    assert [(d["id"], d["document_type"]) for d in docs] == [
+        (first.json()["id"], "receipt")
+    ]
+
+
+async def test_collect_orphans_removes_only_unreferenced_files(
+    auth_client, db, tmp_path, monkeypatch
+):
+    import os
+    from sqlalchemy import update
+    from app.models.document import Document
+    from app.services import uploads
+
+    monkeypatch.setattr(cfg.settings, "upload_dir", str(tmp_path))
+    await auth_client.post(
+        "/documents/upload",
+        files={"file": ("r.jpg", io.BytesIO(b"kept"), "image/jpeg")},
+        data={"document_type": "receipt"},
+    )
+    [kept] = [p for p in tmp_path.rglob("*") if p.is_file()]
+    # Rows keep the path as the API saw it, e.g. under the default relative
+    # upload_dir; the worker's root may be spelled differently.
+    await db.execute(
+        update(Document).values(file_path=f"uploads/{kept.parent.name}/{kept.name}")
+    )
+    await db.commit()
+    orphan = kept.with_name("0" * 64 + ".jpg")
+    fresh_orphan = kept.with_name("1" * 64 + ".jpg")
+    reuploaded = kept.with_name("2" * 64 + ".jpg")
+    orphan.write_bytes(b"left behind")
+    fresh_orphan.write_bytes(b"still uploading")
+    reuploaded.write_bytes(b"uploaded again")
+    old = kept.stat().st_mtime - 7200
+    for path in (kept, orphan, reuploaded):
+        os.utime(path, (old, old))
+
+    # The same bytes are uploaded again after the scan listed the file
+    stale_files = uploads._stale_files
+
+    def list_then_reupload(root, cutoff):
+        listed = stale_files(root, cutoff)
+        reuploaded.touch()
+        return listed
+
+    monkeypatch.setattr(uploads, "_stale_files", list_then_reupload)
+    assert await uploads.collect_orphans(db, tmp_path) == 1
+    assert kept.exists() and fresh_orphan.exists() and reuploaded.exists()
+    assert not orphan.exists()
+    assert not list(tmp_path.rglob("*.gc"))
+
+
+@pytest.fixture
+async def statement_upload(auth_client, tmp_path, monkeypatch):
+    """Upload a 10-page PDF statement; returns (document id, queued task ids).
+
+    Tasks are not sent to a broker: _process runs process_document eagerly,
+    against the test database.
+    """
+    import pymupdf
+    from sqlalchemy import NullPool
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from app.tasks import documents, runtime
+    from tests.conftest import TEST_DATABASE_URL
+
+    monkeypatch.setattr(cfg.settings, "upload_dir", str(tmp_path))
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    monkeypatch.setattr(
+        "app.core.database.AsyncSessionLocal",
+        async_sessionmaker(engine, expire_on_commit=False),
+    )
+    queued = {}
+    monkeypatch.setattr(
+        documents.process_document,
+        "apply_async",
+        lambda args, task_id: queued.update({args[0]: task_id}),
+    )
+
+    pdf = pymupdf.open()
+    for page_number in range(10):  # more than one chunk of pages
+        page = pdf.new_page()
+        page.insert_text((50, 72), f"03/{page_number + 1:02d}/2026")
+        page.insert_text((140, 72), f"Jollibee {page_number}")
+        page.insert_text((420, 72), "1,234.50")
+    r = await auth_client.post(
+        "/documents/upload",
+        files={"file": ("march.pdf", io.BytesIO(pdf.tobytes()), "application/pdf")},
+        data={"document_type": "cc_statement"},
+    )
+    assert r.status_code == 201
+    yield r.json()["id"], queued
+    runtime.stop()
+
+
+def _process(document_id: str, task_id: str) -> str:
+    from app.tasks import documents
+
+    result = documents.process_document.apply(args=[document_id], task_id=task_id)
+    return result.get()["status"]
+
+
+async def _assert_extracted(auth_client, document_id: str) -> None:
+    doc = (await auth_client.get(f"/documents/{document_id}")).json()
+    assert doc["status"] == "done"
+    txns = doc["extracted_data"]["transactions"]
+    assert doc["extracted_data"]["count"] == 10
+    assert txns[0]["amount"] == "1234.50"
+    assert txns[0]["date"] == "2026-03-01"
+    assert [t["description"] for t in txns] == [f"Jollibee {i}" for i in range(10)]
+
+
+async def test_pdf_statement_is_extracted_in_background(auth_client, statement_upload):
+    document_id, queued = statement_upload
+    assert list(queued) == [document_id]
+    assert _process(document_id, queued[document_id]) == "done"
+    # Already processed: a redelivered task leaves it alone
+    assert _process(document_id, queued[document_id]) == "skipped"
+    await _assert_extracted(auth_client, document_id)
+
+
+def _process_in_worker_child(document_id: str, task_id: str) -> str:
+    from app.tasks import runtime
+
+    try:
+        return _process(document_id, task_id)
+    finally:
+        runtime.stop()
+
+
+async def test_pdf_statement_is_extracted_in_prefork_child(
+    auth_client, statement_upload
+):
+    import asyncio
+    import billiard
+
+    # Celery's default pool: tasks run in daemon children, which may not
+    # start a process pool of their own.
+    document_id, queued = statement_upload
+    with billiard.Pool(1) as pool:
+        status = await asyncio.to_thread(
+            pool.apply, _process_in_worker_child, (document_id, queued[document_id])
+        )
+    assert status == "done"
+    await _assert_extracted(auth_client, document_id)
+
+
+async def test_stale_processing_document_is_requeued(auth_client, db, statement_upload):
+    import uuid
+    from datetime import datetime, timedelta, timezone
+    from sqlalchemy import select, update
+    from app.models.document import Document
+    from app.tasks import documents, runtime
+
+    document_id, queued = statement_upload
+    old_task_id = queued.pop(document_id)
+    assert _process(document_id, old_task_id) == "done"
+
+    async def set_processing(started_at):
+        await db.execute(
+            update(Document).values(
+                status="processing", processing_started_at=started_at
+            )
+        )
+        await db.commit()
+
+    # Still within the timeout, or set by hand through the API: left alone
+    for started_at in (datetime.now(timezone.utc), None):
+        await set_processing(started_at)
+        assert documents.requeue_stale_documents() == 0
+    # Its worker stalled an hour ago
+    await set_processing(datetime.now(timezone.utc) - timedelta(hours=1))
+    assert documents.requeue_stale_documents() == 1
+
+    doc = (await auth_client.get(f"/documents/{document_id}")).json()
+    assert doc["status"] == "pending"
+    task_id = await db.scalar(select(Document.celery_task_id))
+    assert task_id != old_task_id
+    assert queued == {document_id: task_id}
+    # The stalled task can neither claim the document again nor finish it
+    assert _process(document_id, old_task_id) == "skipped"
+    assert not runtime.run(
+        documents._finish(uuid.UUID(document_id), old_task_id, "failed")
+    )
+    assert _process(document_id, task_id) == "done"
+    assert await db.scalar(select(Document.processing_started_at)) is None
+
+
+async def test_stale_pending_statement_is_requeued(auth_client, db, statement_upload):
+    from datetime import datetime, timedelta, timezone
+    from sqlalchemy import update
+    from app.models.document import Document
+    from app.tasks import documents
+
+    # The upload's enqueue failed, so no task is coming for it
+    document_id, queued = statement_upload
+    task_id = queued.pop(document_id)
+    assert documents.requeue_stale_documents() == 0
+
+    await db.execute(
+        update(Document).values(
+            created_at=datetime.now(timezone.utc) - timedelta(hours=1)
+        )
+    )
+    await db.commit()
+    assert documents.requeue_stale_documents() == 1
+    assert queued == {document_id: task_id}
+    assert _process(document_id, task_id) == "done"
+    assert documents.requeue_stale_documents() == 0
@@ -0,0 +1,141 @@
+import uuid
+from decimal import Decimal
+import pytest
+from sqlalchemy import select, update
+from app.models.account_balance import AccountBalance
+from app.models.monthly_rollup import MonthlyRollup
+from app.services.ledger import balance_effects, reconcile_ledgers
+
+
+@pytest.fixture
+async def accounts(client):
+    await client.post("/auth/register", json={
+        "email": "ledger@test.com", "name": "Ledger User", "password": "password123"
+    })
+    bank = await client.post("/accounts", json={
+        "name": "BDO Savings", "type": "savings", "opening_balance": "10000.00"
+    })
+    wallet = await client.post("/accounts", json={
+        "name": "GCash", "type": "wallet", "opening_balance": "500.00"
+    })
+    return bank.json()["id"], wallet.json()["id"]
+
+
+async def _balance(client, account_id: str) -> str:
+    r = await client.get(f"/accounts/{account_id}")
+    return r.json()["current_balance"]
+
+
+def test_balance_effects_transfer_with_fee():
+    a, b = uuid.uuid4(), uuid.uuid4()
+    effects = balance_effects({
+        "account_id": a, "to_account_id": b, "type": "transfer",
+        "amount": "5000.00", "fee_amount": "18.00",
+    })
+    assert effects == {a: Decimal("-5018.00"), b: Decimal("5000.00")}
+
+
+async def test_balance_follows_create_update_delete(client, accounts):
+    bank_id, wallet_id = accounts
+    r = await client.post("/transactions", json={
+        "account_id": bank_id, "to_account_id": wallet_id, "amount": "1000.00",
+        "fee_amount": "15.00", "type": "transfer", "sub_type": "own_account",
+        "date": "2026-02-10",
+    })
+    txn_id = r.json()["id"]
+    assert await _balance(client, bank_id) == "8985.00"
+    assert await _balance(client, wallet_id) == "1500.00"
+
+    # Turning the transfer into a plain expense releases the wallet side
+    await client.patch(f"/transactions/{txn_id}", json={
+        "type": "expense", "to_account_id": None, "amount": "200.00",
+    })
+    assert await _balance(client, bank_id) == "9785.00"
+    assert await _balance(client, wallet_id) == "500.00"
+
+    # Moving the date shifts the daily delta with it
+    await client.patch(f"/transactions/{txn_id}", json={"date": "2026-02-12"})
+    r = await client.get(f"/accounts/{bank_id}/balance", params={"as_of": "2026-02-11"})
+    assert r.json()["balance"] == "10000.00"
+    r = await client.get(f"/accounts/{bank_id}/balance", params={"as_of": "2026-02-12"})
+    assert r.json()["balance"] == "9785.00"
+
+    await client.delete(f"/transactions/{txn_id}")
+    assert await _balance(client, bank_id) == "10000.00"
+
+    listing = await client.get("/accounts")
+    balances = {a["id"]: a["current_balance"] for a in listing.json()}
+    assert balances == {bank_id: "10000.00", wallet_id: "500.00"}
+
+
+async def test_reconcile_repairs_drift(client, db, accounts):
+    bank_id, _ = accounts
+    await client.post("/transactions", json={
+        "account_id": bank_id, "amount": "250.00", "type": "expense", "date": "2026-02-10",
+    })
+    report = await reconcile_ledgers(db, repair=False)
+    assert not any(report.values())
+
+    await db.execute(
+        update(AccountBalance)
+        .where(AccountBalance.account_id == uuid.UUID(bank_id))
+        .values(transactions_net=Decimal("99.00"))
+    )
+    await db.commit()
+
+    report = await reconcile_ledgers(db)
+    assert report["account_daily_deltas"] == report["monthly_rollups"] == []
+    drift = report["account_balances"]
+    assert len(drift) == 1
+    assert drift[0]["expected"] == Decimal("-250.00")
+
+    stored = await db.execute(
+        select(AccountBalance.transactions_net)
+        .where(AccountBalance.account_id == uuid.UUID(bank_id))
+    )
+    assert stored.scalar_one() == Decimal("-250.00")
+    report = await reconcile_ledgers(db, repair=False)
+    assert not any(report.values())
+
+
+async def _rollups(db) -> set[tuple]:
+    result = await db.execute(
+        select(
+            MonthlyRollup.month, MonthlyRollup.category_id, MonthlyRollup.type,
+            MonthlyRollup.total, MonthlyRollup.txn_count,
+        ).where(MonthlyRollup.txn_count != 0)
+    )
+    return {(str(r.month), r.category_id and str(r.category_id), r.type.value, str(r.total), r.txn_count)
+            for r in result}
+
+
+async def test_rollups_follow_edits_and_category_delete(client, db, accounts):
+    bank_id, _ = accounts
+    cat = await client.post("/categories", json={"name": "Coffee", "type": "expense"})
+    cat_id = cat.json()["id"]
+    for amount in ("120.00", "80.00"):
+        r = await client.post("/transactions", json={
+            "account_id": bank_id, "category_id": cat_id, "amount": amount,
+            "type": "expense", "date": "2026-03-30",
+        })
+    assert await _rollups(db) == {("2026-03-01", cat_id, "expense", "200.00", 2)}
+
+    # Re-dating one row moves it to the next month's bucket
+    await client.patch(f"/transactions/{r.json()['id']}", json={"date": "2026-04-02"})
+    assert await _rollups(db) == {
+        ("2026-03-01", cat_id, "expense", "120.00", 1),
+        ("2026-04-01", cat_id, "expense", "80.00", 1),
+    }
+
+    # Deleting the category folds its rollups into the uncategorized bucket
+    await client.post("/transactions", json={
+        "account_id": bank_id, "amount": "5.00", "type": "expense", "date": "2026-03-01",
+    })
+    await client.delete(f"/categories/{cat_id}")
+    db.expire_all()
+    assert await _rollups(db) == {
+        ("2026-03-01", None, "expense", "125.00", 2),
+        ("2026-04-01", None, "expense", "80.00", 1),
+    }
+    report = await reconcile_ledgers(db, repair=False)
+    assert not any(report.values())
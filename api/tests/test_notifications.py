@@ -1,3 +1,5 @@
+import asyncio
+import json
 import uuid
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -102,19 +104,43 @@ async def test_stream_returns_event_stream(auth_client: AsyncClient, monkeypatch
     """Verify the SSE endpoint returns correct content-type and 200.
 
     Redis is not available in the test environment. We mock get_redis to raise
-    immediately so the generator exits cleanly after yielding initial events,
+    immediately, so the stream listener can't start and the generator exits
+    cleanly after yielding initial events,
     allowing httpx's ASGITransport to consume the full response.
     """
     async def _no_redis():
         raise ConnectionError("Redis not available in tests")
 
-    monkeypatch.setattr("app.routers.notifications.get_redis", _no_redis)
+    monkeypatch.setattr("app.services.pubsub.get_redis", _no_redis)
 
     async with auth_client.stream("GET", "/notifications/stream") as r:
         assert r.status_code == 200
         assert "text/event-stream" in r.headers["content-type"]
 
 
+async def test_stream_hub_fans_out_per_user():
+    """Streams share one pattern subscription; each sees only its own user's messages."""
+    from app.services import pubsub
+
+    alice, bob = uuid.uuid4(), uuid.uuid4()
+    try:
+        async with (
+            pubsub.subscribe_notifications(alice) as a1,
+            pubsub.subscribe_notifications(alice) as a2,
+            pubsub.subscribe_notifications(bob) as b,
+        ):
+            assert pubsub.stream_stats()["sse.streams"] == 3
+            await pubsub.publish_notification(alice, {"title": "for alice"})
+            await pubsub.publish_notification(bob, {"title": "for bob"})
+            for queue, title in ((a1, "for alice"), (a2, "for alice"), (b, "for bob")):
+                data = await asyncio.wait_for(queue.get(), timeout=5)
+                assert json.loads(data)["title"] == title
+            assert a1.empty() and b.empty()
+        assert pubsub.stream_stats()["sse.streams"] == 0
+    finally:
+        await pubsub.close_redis()
+
+
 async def test_push_subscribe(auth_client: AsyncClient):
     r = await auth_client.post(
         "/notifications/push-subscribe",
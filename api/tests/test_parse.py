@@ -64,3 +64,17 @@ def test_parse_bulk_multiline_sms():
     )
     result = parse_bulk(text)
     assert result.count == 2
+
+
+def test_normalize_date_shapes():
+    from app.services.parser import _normalize_date
+
+    assert _normalize_date("2026-02-19") == "2026-02-19"
+    assert _normalize_date("2/9/2026") == "2026-02-09"
+    assert _normalize_date("02/09/26") == "2026-02-09"
+    assert _normalize_date("02/09/69") == "1969-02-09"
+    assert _normalize_date("feb 9 2026") == "2026-02-09"
+    assert _normalize_date("February 9, 2026") == "2026-02-09"
+    assert _normalize_date("2026-3-5") == "2026-03-05"  # via the strptime fallback
+    assert _normalize_date("02/30/2026") is None
+    assert _normalize_date("Sept 9, 2026") is None
@@ -0,0 +1,99 @@
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+import pytest_asyncio
+from sqlalchemy import extract, insert, select, text
+from sqlalchemy.dialects import postgresql
+from app.models.account import Account
+from app.models.monthly_rollup import MonthlyRollup
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services.periods import Period, custom_period, month_of, month_period, week_of
+
+USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+def test_month_period_is_half_open():
+    assert month_period(2024, 2) == Period(date(2024, 2, 1), date(2024, 3, 1))
+    assert month_period(2025, 12) == Period(date(2025, 12, 1), date(2026, 1, 1))
+    assert month_of(date(2024, 2, 29)).last_day == date(2024, 2, 29)
+
+
+def test_week_and_custom_periods():
+    # 2026-10-17 is a Saturday
+    assert week_of(date(2026, 10, 17)) == Period(date(2026, 10, 12), date(2026, 10, 19))
+    assert week_of(date(2026, 10, 17)).last_day == date(2026, 10, 18)
+    assert custom_period(date(2026, 1, 5), date(2026, 1, 5)) == Period(date(2026, 1, 5), date(2026, 1, 6))
+    assert custom_period(None, None).end is None
+    assert custom_period(date(2026, 1, 5), date.max) == Period(date(2026, 1, 5), None)
+
+
+async def _plan(db, stmt) -> list[dict]:
+    """Flattened EXPLAIN nodes with sequential scans disabled, so the planner
+    shows whether an index *can* serve the predicate regardless of table size."""
+    sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    await db.execute(text("SET LOCAL enable_seqscan = off"))
+    result = await db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    await db.rollback()
+
+    nodes, stack = [], [result.scalar_one()[0]["Plan"]]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.get("Plans", []))
+    return nodes
+
+
+def _index_conds(nodes: list[dict], index: str) -> str:
+    return " ".join(n.get("Index Cond", "") for n in nodes if n.get("Index Name") == index)
+
+
+@pytest_asyncio.fixture
+async def analyzed_transactions(db):
+    """A year of transactions for 20 users, with fresh planner statistics.
+
+    Tables are truncated between tests but never re-analyzed, so stats left
+    by earlier tests can make the single-column ix_transactions_date look as
+    cheap as ix_transactions_user_date. Known data keeps the plan stable.
+    """
+    users = [User(email=f"period{i}@test.com", name="Period", password_hash="x") for i in range(20)]
+    db.add_all(users)
+    await db.flush()
+    accounts = [Account(user_id=u.id, name="Bank", type="savings") for u in users]
+    db.add_all(accounts)
+    await db.flush()
+    await db.execute(insert(Transaction), [
+        {"user_id": a.user_id, "account_id": a.id, "created_by": a.user_id, "amount": Decimal("1.00"),
+         "type": "expense", "date": date(2026, 1, 1) + timedelta(days=day)}
+        for a in accounts for day in range(365)
+    ])
+    await db.commit()
+    await db.execute(text("ANALYZE transactions"))
+    await db.commit()
+
+
+async def test_period_filter_range_scans_user_date_index(db, analyzed_transactions):
+    period = month_period(2026, 3)
+    nodes = await _plan(db, select(Transaction.id).where(
+        Transaction.user_id == USER_ID, period.contains(Transaction.date),
+    ))
+    cond = _index_conds(nodes, "ix_transactions_user_date")
+    assert "user_id" in cond and "date >= '2026-03-01'" in cond and "date < '2026-04-01'" in cond
+
+
+async def test_extract_filter_cannot_use_date_range(db):
+    # The pattern periods.py replaces: the index can only match user_id.
+    nodes = await _plan(db, select(Transaction.id).where(
+        Transaction.user_id == USER_ID,
+        extract("year", Transaction.date) == 2026,
+        extract("month", Transaction.date) == 3,
+    ))
+    assert "date" not in _index_conds(nodes, "ix_transactions_user_date")
+
+
+async def test_rollup_month_lookup_uses_key_index(db):
+    nodes = await _plan(db, select(MonthlyRollup.total).where(
+        MonthlyRollup.user_id == USER_ID, MonthlyRollup.month == month_period(2026, 3).start,
+    ))
+    cond = _index_conds(nodes, "uq_monthly_rollups_key")
+    assert "user_id" in cond and "month" in cond
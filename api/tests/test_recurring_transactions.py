@@ -146,3 +146,65 @@ def test_advance_date_yearly():
     d = date(2026, 3, 1)
     result = advance_date(d, RecurrenceFrequency.yearly)
     assert result == date(2027, 3, 1)
+
+
+async def test_generate_catches_up_all_missed_occurrences(client, db, user_and_account, monkeypatch):
+    import uuid
+    from sqlalchemy import func, select, update
+    from app.models.notification import Notification
+    from app.models.recurring_transaction import RecurringTransaction
+    from app.models.transaction import Transaction
+    from app.services import recurring
+
+    pushes, published = [], []
+
+    async def fake_pushes(db, batch):
+        pushes.extend(push.title for push in batch)
+        return len(batch)
+
+    async def fake_publish(user_id, payload):
+        published.append(payload)
+
+    monkeypatch.setattr(recurring, "send_pushes", fake_pushes)
+    monkeypatch.setattr(recurring, "publish_notification", fake_publish)
+
+    ids = user_and_account
+    create = await client.post("/recurring-transactions", json={
+        "account_id": ids["account_id"], "amount": "100.00", "description": "Coffee",
+        "type": "expense", "frequency": "daily", "start_date": "2026-03-01",
+        "end_date": "2026-03-20",
+    })
+    rec_id = uuid.UUID(create.json()["id"])
+
+    # A shard run only sees its own users' rules
+    from app.services.sharding import all_shards
+    user_id = (await client.get("/auth/me")).json()["id"]
+    other = next(s for s in all_shards(4) if not s.owns(uuid.UUID(user_id)))
+    assert await recurring.generate_due_occurrences(db, date(2026, 3, 10), other) == 0
+
+    # Ten days overdue: one run creates all of them
+    assert await recurring.generate_due_occurrences(db, date(2026, 3, 10)) == 10
+    assert len(published) == 10 and pushes == ["Recurring Transactions Created"]
+    r = await client.get(f"/accounts/{ids['account_id']}")
+    assert r.json()["current_balance"] == "9000.00"
+    rec = await db.get(RecurringTransaction, rec_id)
+    assert rec.next_due_date == date(2026, 3, 11)
+
+    # Re-running from a stale next_due_date doesn't duplicate anything
+    await db.execute(
+        update(RecurringTransaction).where(RecurringTransaction.id == rec_id)
+        .values(next_due_date=date(2026, 3, 5))
+    )
+    await db.commit()
+    assert await recurring.generate_due_occurrences(db, date(2026, 3, 12)) == 2
+
+    # Stops at end_date and deactivates the rule
+    assert await recurring.generate_due_occurrences(db, date(2026, 4, 30)) == 8
+    await db.refresh(rec)
+    assert rec.is_active is False
+    count = await db.execute(
+        select(func.count()).select_from(Transaction).where(Transaction.recurring_id == rec_id)
+    )
+    assert count.scalar_one() == 20
+    notifications = await db.execute(select(func.count()).select_from(Notification))
+    assert notifications.scalar_one() == 20
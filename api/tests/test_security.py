@@ -26,3 +26,65 @@ def test_refresh_token_not_accepted_as_access():
 def test_invalid_token_raises():
     with pytest.raises(jwt.PyJWTError):
         decode_token("not.a.valid.token")
+
+
+async def test_password_hashing_runs_off_the_event_loop():
+    import asyncio
+    import time
+    from app.core.security import hash_password_async, verify_password_async
+
+    hashing = asyncio.create_task(hash_password_async("mysecretpassword"))
+    start = time.perf_counter()
+    await asyncio.sleep(0.01)
+    # The loop kept ticking while bcrypt (hundreds of ms) ran on the pool
+    assert time.perf_counter() - start < 0.1
+    assert not hashing.done()
+    hashed = await hashing
+    assert await verify_password_async("mysecretpassword", hashed)
+    assert not await verify_password_async("wrongpassword", hashed)
+
+
+async def test_password_pool_rejects_when_queue_is_full(monkeypatch):
+    import asyncio
+    from app.core import security
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "password_hash_workers", 1)
+    monkeypatch.setattr(settings, "password_hash_max_queue", 1)
+    security.metrics.wait_for_writes()  # a flush queued by an earlier test
+    security.flush_metrics()
+    recorded = {}
+    monkeypatch.setattr(security.metrics, "incr", lambda name, amount=1: recorded.update({name: amount}))
+    running = asyncio.create_task(security.hash_password_async("a"))
+    waiting = asyncio.create_task(security.hash_password_async("b"))
+    await asyncio.sleep(0)
+    assert security.password_pool_stats()["auth.bcrypt.queue_depth"] == 1
+    with pytest.raises(security.PasswordHasherBusy):
+        await security.hash_password_async("c")
+    await asyncio.gather(running, waiting)
+    assert security.password_pool_stats()["auth.bcrypt.running"] == 0
+
+    # Counted in memory; nothing reaches Redis until a flush
+    assert recorded == {}
+    security.flush_metrics()
+    assert recorded["auth.bcrypt.calls"] == 2
+    assert recorded["auth.bcrypt.rejected"] == 1
+    assert recorded["auth.bcrypt.queued"] == 1
+
+
+async def test_password_pool_flushes_metrics_off_the_event_loop(monkeypatch):
+    import threading
+    from app.core import metrics, security
+
+    metrics.wait_for_writes()
+    security.flush_metrics()
+    monkeypatch.setattr(security, "METRICS_FLUSH_EVERY", 2)
+    threads = set()
+    monkeypatch.setattr(
+        metrics, "incr", lambda name, amount=1: threads.add(threading.current_thread())
+    )
+    await security.hash_password_async("a")
+    await security.hash_password_async("b")
+    metrics.wait_for_writes()
+    assert threads
+    assert threading.current_thread() not in threads
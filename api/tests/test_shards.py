@@ -0,0 +1,67 @@
+import uuid
+import pytest
+from sqlalchemy import literal, select
+from sqlalchemy.dialects.postgresql import UUID
+from app.services.sharding import Shard, all_shards
+from app.tasks import runtime
+
+
+@pytest.fixture
+def eager_celery(monkeypatch):
+    from app.tasks.celery import celery_app
+
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+    yield
+    runtime.stop()
+
+
+def test_every_user_lands_in_exactly_one_shard():
+    shards = all_shards(8)
+    for _ in range(200):
+        user_id = uuid.uuid4()
+        assert sum(shard.owns(user_id) for shard in shards) == 1
+    with pytest.raises(ValueError):
+        all_shards(0)
+
+
+async def test_shard_predicate_matches_python(db):
+    for _ in range(20):
+        user_id = uuid.uuid4()
+        for shard in all_shards(5):
+            stmt = select(shard.contains(literal(user_id, UUID(as_uuid=True))))
+            assert (await db.execute(stmt)).scalar_one() is shard.owns(user_id)
+
+
+def test_dispatch_resumes_only_unfinished_shards(eager_celery, monkeypatch):
+    from app.core import metrics
+    from app.core.config import settings
+    from app.tasks import shards
+
+    calls = []
+    failing = {2}
+
+    async def job(shard: Shard) -> int:
+        calls.append(shard.index)
+        if shard.index in failing:
+            raise RuntimeError("boom")
+        return shard.index * 10
+
+    monkeypatch.setitem(shards.JOBS, "test", job)
+    monkeypatch.setattr(settings, "job_shard_count", 4)
+    run_id = f"test-{uuid.uuid4()}"
+    try:
+        assert shards.dispatch_shards("test", run_id) == [0, 1, 2, 3]
+        state = shards.run_state("test", run_id)
+        assert state[2]["status"] == "failed" and "boom" in state[2]["error"]
+        assert state[3] == {"status": "done", "duration_ms": state[3]["duration_ms"], "processed": 30}
+
+        # Resuming sends only the failed shard, with the run's original count
+        failing.clear()
+        monkeypatch.setattr(settings, "job_shard_count", 16)
+        calls.clear()
+        assert shards.dispatch_shards("test", run_id) == [2]
+        assert calls == [2]
+        assert all(s["status"] == "done" for s in shards.run_state("test", run_id).values())
+        assert shards.dispatch_shards("test", run_id) == []
+    finally:
+        metrics.get_sync_redis().delete(shards._run_key("test", run_id))
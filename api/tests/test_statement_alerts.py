@@ -154,3 +154,25 @@ async def test_no_duplicate_notification_on_double_run(db: AsyncSession, user_an
     )
     notifs = result.scalars().all()
     assert len(notifs) == 1  # only one, no duplicate
+
+
+async def test_rerun_skips_fanout_for_existing_reminders(db: AsyncSession, user_and_card):
+    user, cc = user_and_card
+    for days in (7, 7, 1):
+        await _create_statement(db, cc.id, due_date=date.today() + timedelta(days=days))
+
+    sent: list[str] = []
+
+    async def fake_discord(embeds):
+        sent.extend(e["title"] for e in embeds)
+
+    with patch("app.services.discord.send_discord_embeds", fake_discord):
+        assert await _async_check_statements() == 3
+        assert await _async_check_statements() == 0
+
+    assert sorted(sent) == ["Statement Due Tomorrow", "Statement Due in 7 Days", "Statement Due in 7 Days"]
+    result = await db.execute(
+        select(Notification.dedup_key).where(Notification.user_id == user.id)
+    )
+    keys = result.scalars().all()
+    assert len(keys) == 3 and all(k.startswith("statement_due:") for k in keys)
@@ -0,0 +1,38 @@
+import asyncio
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.tasks import runtime
+from tests.conftest import TEST_DATABASE_URL
+
+
+@pytest.fixture
+def task_runtime():
+    yield runtime
+    runtime.stop()
+
+
+async def _current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def test_tasks_share_one_loop(task_runtime):
+    first = task_runtime.run(_current_loop())
+    second = task_runtime.run(_current_loop())
+    assert first is second
+    assert first.is_running()
+
+
+def test_pool_connection_is_reused_across_tasks(task_runtime, setup_test_database):
+    # What asyncio.run() per task could not do: the second task gets the
+    # first task's pooled asyncpg connection back instead of a new one.
+    engine = create_async_engine(TEST_DATABASE_URL, pool_size=1, max_overflow=0)
+
+    async def backend_pid() -> int:
+        async with engine.connect() as conn:
+            return (await conn.execute(text("SELECT pg_backend_pid()"))).scalar_one()
+
+    try:
+        assert task_runtime.run(backend_pid()) == task_runtime.run(backend_pid())
+    finally:
+        task_runtime.run(engine.dispose())
@@ -1,3 +1,4 @@
+import uuid
 import pytest
 
 
@@ -280,3 +281,221 @@ async def test_patch_clears_optional_field(client, user_and_accounts):
     r2 = await client.patch(f"/transactions/{txn_id}", json={"category_id": None})
     assert r2.status_code == 200
     assert r2.json()["category_id"] is None
+
+
+async def test_cursor_pagination_walks_all_rows(client, user_and_accounts):
+    ids = user_and_accounts
+    for i in range(5):
+        await client.post("/transactions", json={
+            "account_id": ids["bank_id"], "amount": "10.00",
+            "type": "expense", "date": f"2026-02-0{1 + i % 2}",
+            "description": f"Row {i}",
+        })
+    r = await client.get("/transactions?paginate=cursor&limit=2")
+    assert r.status_code == 200
+    data = r.json()
+    assert data["total"] is None
+    seen = [t["id"] for t in data["items"]]
+    while data["next_cursor"]:
+        r = await client.get("/transactions", params={"cursor": data["next_cursor"], "limit": 2})
+        assert r.status_code == 200
+        data = r.json()
+        seen += [t["id"] for t in data["items"]]
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+    offset_ids = [t["id"] for t in (await client.get("/transactions?limit=5")).json()["items"]]
+    assert seen == offset_ids
+
+
+async def test_cursor_pagination_include_total(client, user_and_accounts):
+    ids = user_and_accounts
+    for _ in range(3):
+        await client.post("/transactions", json={
+            "account_id": ids["bank_id"], "amount": "10.00",
+            "type": "expense", "date": "2026-02-01",
+        })
+    r = await client.get("/transactions?paginate=cursor&limit=5&include_total=true")
+    data = r.json()
+    assert data["total"] == 3
+    assert data["next_cursor"] is None
+
+
+async def test_cursor_pagination_rejects_garbage_cursor(client, user_and_accounts):
+    r = await client.get("/transactions", params={"cursor": "not-a-cursor"})
+    assert r.status_code == 400
+
+
+async def test_bulk_create_updates_ledger(client, user_and_accounts, monkeypatch):
+    ids = user_and_accounts
+    dispatched = []
+    monkeypatch.setattr("app.routers.transactions.schedule_budget_alerts", dispatched.append)
+    rows = [
+        {"account_id": ids["bank_id"], "amount": "100.00", "type": "expense",
+         "date": "2026-02-01", "description": f"row {i}", "source": "paste_ai"}
+        for i in range(300)
+    ]
+    rows.append({
+        "account_id": ids["bank_id"], "to_account_id": ids["wallet_id"], "amount": "1000.00",
+        "fee_amount": "15.00", "type": "transfer", "sub_type": "own_account", "date": "2026-02-02",
+    })
+    r = await client.post("/transactions/bulk", json={"rows": rows})
+    assert r.status_code == 201
+    data = r.json()
+    assert data["errors"] == []
+    assert len(data["created"]) == 301
+    assert data["created"][0]["description"] == "row 0"
+    assert data["created"][-1]["type"] == "transfer"
+    assert len(dispatched) == 1
+
+    bank = await client.get(f"/accounts/{ids['bank_id']}")
+    wallet = await client.get(f"/accounts/{ids['wallet_id']}")
+    assert bank.json()["current_balance"] == "-21015.00"  # 10000 - 30000 - 1015
+    assert wallet.json()["current_balance"] == "6000.00"
+
+
+async def test_bulk_create_batches_inserts(client, user_and_accounts, count_queries):
+    ids = user_and_accounts
+    rows = [
+        {"account_id": ids["bank_id"], "amount": "1.00", "type": "expense",
+         "date": "2026-02-01", "description": f"row {i}"}
+        for i in range(2500)
+    ]
+    with count_queries() as statements:
+        r = await client.post("/transactions/bulk", json={"rows": rows})
+    inserts = [s for s in statements if s.startswith("INSERT INTO transactions")]
+    assert r.status_code == 201
+    created = r.json()["created"]
+    assert [t["description"] for t in created] == [f"row {i}" for i in range(2500)]
+    # 1,000 rows per multi-row INSERT, not one round trip per row
+    assert len(inserts) == 3
+
+async def test_bulk_create_atomic_rejects_whole_batch(client, user_and_accounts):
+    ids = user_and_accounts
+    r = await client.post("/transactions/bulk", json={"rows": [
+        {"account_id": ids["bank_id"], "amount": "50.00", "type": "expense", "date": "2026-02-01"},
+        {"account_id": ids["bank_id"], "amount": "-5.00", "type": "expense", "date": "2026-02-01"},
+    ]})
+    assert r.status_code == 422
+    assert [e["index"] for e in r.json()["detail"]] == [1]
+    listing = await client.get("/transactions")
+    assert listing.json()["total"] == 0
+
+
+async def test_bulk_create_partial_reports_bad_rows(client, user_and_accounts):
+    ids = user_and_accounts
+    r = await client.post("/transactions/bulk", json={"mode": "partial", "rows": [
+        {"account_id": ids["bank_id"], "amount": "50.00", "type": "expense", "date": "2026-02-01"},
+        {"account_id": str(uuid.uuid4()), "amount": "5.00", "type": "expense", "date": "2026-02-01"},
+        {"account_id": ids["bank_id"], "amount": "5.00", "type": "expense"},
+        {"account_id": ids["wallet_id"], "amount": "75.00", "type": "income", "date": "2026-02-03"},
+    ]})
+    assert r.status_code == 201
+    data = r.json()
+    assert [t["amount"] for t in data["created"]] == ["50.00", "75.00"]
+    assert [e["index"] for e in data["errors"]] == [1, 2]
+    assert data["errors"][0]["errors"] == ["account_id: not found"]
+    assert data["errors"][1]["errors"][0].startswith("date:")
+
+
+async def test_export_csv_and_ndjson(client, user_and_accounts):
+    import csv
+    import io
+    import json
+    ids = user_and_accounts
+    for i, day in enumerate(["2026-01-10", "2026-01-12", "2026-01-11"]):
+        await client.post("/transactions", json={
+            "account_id": ids["bank_id"], "amount": f"{i + 1}00.00", "type": "expense",
+            "date": day, "description": f"item, {i}",
+        })
+    await client.post("/transactions", json={
+        "account_id": ids["wallet_id"], "amount": "5.00", "type": "income", "date": "2026-01-13",
+    })
+
+    r = await client.get("/transactions/export", params={"account_id": ids["bank_id"]})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(r.text)))
+    assert [row["date"] for row in rows] == ["2026-01-12", "2026-01-11", "2026-01-10"]
+    assert rows[0]["description"] == "item, 1"
+    assert rows[0]["type"] == "expense" and rows[0]["fee_amount"] == ""
+
+    r = await client.get("/transactions/export", params={"format": "ndjson", "type": "income"})
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert len(lines) == 1
+    assert lines[0]["amount"] == "5.00" and lines[0]["to_account_id"] is None
+
+
+async def test_search_modes(client, user_and_accounts):
+    ids = user_and_accounts
+    for day, desc in [
+        ("2026-02-03", "Jollibee Ayala"),
+        ("2026-02-02", "Jollibee Ayala Jollibee refund"),
+        ("2026-02-01", "Mercury Drug"),
+    ]:
+        await client.post("/transactions", json={
+            "account_id": ids["bank_id"], "amount": "100.00", "type": "expense",
+            "date": day, "description": desc,
+        })
+
+    async def descriptions(**params):
+        r = await client.get("/transactions", params=params)
+        assert r.status_code == 200
+        return [t["description"] for t in r.json()["items"]]
+
+    # Typo still matches; unrelated rows don't
+    assert set(await descriptions(search="Jolibee", search_mode="fuzzy")) == {
+        "Jollibee Ayala", "Jollibee Ayala Jollibee refund",
+    }
+    assert await descriptions(search="jol ayal", search_mode="prefix") == [
+        "Jollibee Ayala", "Jollibee Ayala Jollibee refund",
+    ]
+    assert await descriptions(search="jol ayal") == []  # contains: literal substring
+    # Ranked: more occurrences of the term rank first, ahead of the newer row
+    assert await descriptions(search="jollibee", search_mode="fts") == [
+        "Jollibee Ayala Jollibee refund", "Jollibee Ayala",
+    ]
+    assert await descriptions(search="jollibee -refund", search_mode="fts") == ["Jollibee Ayala"]
+
+    r = await client.get("/transactions", params={
+        "search": "jollibee", "search_mode": "fts", "paginate": "cursor",
+    })
+    assert r.status_code == 400
+
+
+async def test_search_uses_description_indexes(db):
+    from sqlalchemy import select, text
+    from app.models.transaction import Transaction
+    from app.routers.transactions import TransactionFilters
+
+    def plan_sql(mode: str) -> str:
+        filters = TransactionFilters(
+            type=None, account_id=None, category_id=None, date_from=None, date_to=None,
+            search="grocer", search_mode=mode,
+        )
+        # The match predicate alone: on an empty table the planner would
+        # otherwise just pick the user_id index.
+        stmt = select(Transaction.id).where(filters._search_clause())
+        return str(stmt.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True}))
+
+    await db.execute(text("SET LOCAL enable_seqscan = off"))
+    for mode, index in [
+        ("contains", "ix_transactions_description_trgm"),
+        ("fuzzy", "ix_transactions_description_trgm"),
+        ("prefix", "ix_transactions_search_vector"),
+        ("fts", "ix_transactions_search_vector"),
+    ]:
+        plan = (await db.execute(text(f"EXPLAIN {plan_sql(mode)}"))).scalars().all()
+        assert any(index in line for line in plan), (mode, plan)
+    await db.rollback()
+
+
+async def test_date_to_at_max_date_is_open_ended(client, user_and_accounts):
+    ids = user_and_accounts
+    await client.post("/transactions", json={
+        "account_id": ids["bank_id"], "amount": "10.00", "type": "expense", "date": "2026-02-01",
+    })
+    r = await client.get("/transactions", params={"date_from": "2026-01-01", "date_to": "9999-12-31"})
+    assert r.status_code == 200
+    assert r.json()["total"] == 1
@@ -0,0 +1,71 @@
+import base64
+import os
+from unittest.mock import AsyncMock, patch
+import httpx
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from sqlalchemy import select
+import app.core.config as cfg
+from app.models.push_subscription import PushSubscription
+from app.models.user import User
+from app.services import web_push
+from app.services.web_push import Push, send_pushes
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).strip(b"=").decode()
+
+
+def _browser_keys() -> dict:
+    key = ec.generate_private_key(ec.SECP256R1())
+    public = key.public_key().public_bytes(
+        serialization.Encoding.X962, serialization.PublicFormat.UncompressedPoint
+    )
+    return {"p256dh": _b64(public), "auth": _b64(os.urandom(16))}
+
+
+async def test_send_pushes_concurrently_and_prunes_expired(db, monkeypatch):
+    vapid_key = ec.generate_private_key(ec.SECP256R1())
+    monkeypatch.setattr(
+        cfg.settings, "vapid_private_key",
+        _b64(vapid_key.private_numbers().private_value.to_bytes(32, "big")),
+    )
+    web_push._vapid_headers.clear()
+
+    users = [User(email=f"push{i}@test.com", name="Push", password_hash="x") for i in range(2)]
+    db.add_all(users)
+    await db.flush()
+    endpoints = {
+        "https://push.example.com/a": users[0].id,
+        "https://push.example.com/gone": users[0].id,
+        "https://push.example.com/b": users[1].id,
+    }
+    db.add_all(
+        PushSubscription(user_id=user_id, endpoint=endpoint, **_browser_keys())
+        for endpoint, user_id in endpoints.items()
+    )
+    await db.commit()
+
+    async def fake_post(self, url, **kwargs):
+        assert kwargs["headers"]["Authorization"].startswith("vapid t=")
+        assert kwargs["headers"]["Content-Encoding"] == "aes128gcm"
+        return httpx.Response(410 if url.endswith("/gone") else 201)
+
+    with (
+        patch("httpx.AsyncClient.post", fake_post),
+        patch.object(web_push.Vapid, "sign", wraps=web_push._vapid(cfg.settings.vapid_private_key).sign) as sign,
+    ):
+        sent = await send_pushes(db, [Push(u.id, "Title", "Body") for u in users])
+
+    assert sent == 2
+    # One push service, so one signature for the whole batch
+    assert sign.call_count == 1
+    result = await db.execute(select(PushSubscription.endpoint))
+    assert sorted(result.scalars().all()) == ["https://push.example.com/a", "https://push.example.com/b"]
+
+
+async def test_send_pushes_skipped_without_vapid_key(db, monkeypatch):
+    monkeypatch.setattr(cfg.settings, "vapid_private_key", "")
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+        assert await send_pushes(db, [Push(None, "Title", "Body")]) == 0
+        mock_post.assert_not_called()
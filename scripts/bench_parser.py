@@ -0,0 +1,86 @@
+"""
+Benchmark: freeform parser throughput.
+
+Generates LINES SMS/email-style bank alert lines (a quarter without an
+amount, which parse_bulk drops) and reports lines/s for parse_bulk and for
+parse_text per line. With --baseline, the same input is also run through
+another version of the parser module for comparison, e.g.:
+
+    git show <rev>:api/app/services/parser.py > /tmp/parser_old.py
+
+Run: cd api && uv run python ../scripts/bench_parser.py [--lines N] [--baseline /tmp/parser_old.py]
+"""
+import argparse
+import importlib.util
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from app.services import parser
+
+MERCHANTS = ["Jollibee SM North", "Mercury Drug", "Shell Katipunan", "Lazada", "Grab", "SM Supermarket"]
+TEMPLATES = [
+    "Your BDO account ending {acct} was debited ₱{amount} on {named} at {merchant}.",
+    "₱{amount} has been credited to your account on {iso}. Payroll from Acme Corp.",
+    "You paid PHP {amount} to {merchant} on {slash}. Ref no. {acct}",
+    "{amount} PHP was charged to your card ending {acct} at {merchant} for groceries.",
+    "Transfer to {merchant} of ₱{amount} dated {slash} was successful.",
+    "Reminder: your statement is ready. Log in to view it on {named}.",
+    "OTP {acct} is valid for 5 minutes. Do not share it with anyone.",
+]
+
+
+def make_lines(n: int) -> list[str]:
+    rng = random.Random(7)
+    lines = []
+    for _ in range(n):
+        month, day = rng.randint(1, 12), rng.randint(1, 28)
+        lines.append(rng.choice(TEMPLATES).format(
+            acct=rng.randint(1000, 9999),
+            amount=f"{rng.uniform(10, 50_000):,.2f}",
+            merchant=rng.choice(MERCHANTS),
+            iso=f"2026-{month:02d}-{day:02d}",
+            slash=f"{month}/{day}/2026",
+            named=f"{time.strftime('%b', (2026, month, 1, 0, 0, 0, 0, 1, 0))} {day}, 2026",
+        ))
+    return lines
+
+
+def measure(module, lines: list[str]) -> tuple[float, float]:
+    text = "\n".join(lines)
+    start = time.perf_counter()
+    module.parse_bulk(text)
+    bulk = len(lines) / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for line in lines:
+        module.parse_text(line)
+    single = len(lines) / (time.perf_counter() - start)
+    return bulk, single
+
+
+def load(path: str):
+    spec = importlib.util.spec_from_file_location("parser_baseline", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main(n: int, baseline: str | None) -> None:
+    lines = make_lines(n)
+    print(f"{n:,} lines")
+    runs = [("baseline", load(baseline))] if baseline else []
+    runs.append(("current", parser))
+    for label, module in runs:
+        bulk, single = measure(module, lines)
+        print(f"{label:<9} parse_bulk {bulk:10,.0f} lines/s   parse_text {single:10,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--lines", type=int, default=100_000)
+    arg_parser.add_argument("--baseline")
+    args = arg_parser.parse_args()
+    main(args.lines, args.baseline)
@@ -0,0 +1,112 @@
+"""
+Benchmark: PDF statement extraction throughput.
+
+Generates a corpus of STATEMENTS statements of PAGES pages each, with ROWS
+transaction rows per page, in a temporary directory. It then runs the
+process_document pipeline (pdf_extract.iter_statement_lines, then
+parse_bulk) over the corpus with 1 worker and with --workers workers, and
+reports pages/s and pages/s per core, for both extraction paths:
+
+  pool    solo/threads worker: chunks go to the extraction process pool.
+          --workers statements are read at once, so every pool process
+          has a chunk to work on and pages/s per core is not understated.
+  inline  prefork worker: --workers daemon children each read one
+          statement's chunks themselves, like worker --concurrency.
+
+Run: cd api && uv run python ../scripts/bench_pdf_extract.py [--statements N] [--pages N] [--workers N]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+import pymupdf
+from app.core.config import settings
+from app.services import pdf_extract
+from app.services.parser import parse_bulk
+
+ROWS = 35
+MERCHANTS = ["JOLLIBEE", "SM SUPERMARKET", "GRAB PH", "SHELL", "MERCURY DRUG", "LAZADA", "NETFLIX.COM"]
+
+
+def make_statement(path: Path, pages: int) -> None:
+    doc = pymupdf.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        page.insert_text((50, 50), "STATEMENT OF ACCOUNT", fontsize=14)
+        for row in range(ROWS):
+            y = 90 + row * 20
+            page.insert_text((50, y), f"03/{random.randint(1, 28):02d}/2026")
+            page.insert_text((130, y), f"{random.choice(MERCHANTS)} {random.randint(100, 999)}")
+            page.insert_text((440, y), f"{random.uniform(50, 20000):,.2f}")
+    doc.save(path)
+
+
+def extract(path: str) -> int:
+    """One statement through the task's pipeline; returns its transaction count."""
+    return sum(
+        parse_bulk("\n".join(chunk)).count for chunk in pdf_extract.iter_statement_lines(path)
+    )
+
+
+def run_pool(paths: list[str], workers: int) -> tuple[float, int]:
+    settings.pdf_extract_workers = workers
+    # Start every pool process outside the timing; they are spawned on demand
+    pool = pdf_extract._get_pool()
+    for future in [pool.submit(time.sleep, 0.2) for _ in range(workers)]:
+        future.result()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(workers) as statements:
+        transactions = sum(statements.map(extract, paths))
+    elapsed = time.perf_counter() - start
+    pdf_extract.shutdown()
+    return elapsed, transactions
+
+
+def run_inline(paths: list[str], workers: int) -> tuple[float, int]:
+    # multiprocessing.Pool children are daemons, as Celery's prefork children are
+    with multiprocessing.Pool(workers) as children:
+        children.map(int, range(workers))  # start the children outside the timing
+        start = time.perf_counter()
+        transactions = sum(children.imap_unordered(extract, paths))
+        elapsed = time.perf_counter() - start
+    return elapsed, transactions
+
+
+RUNS: dict[str, Callable[[list[str], int], tuple[float, int]]] = {
+    "pool": run_pool,
+    "inline": run_inline,
+}
+
+
+def main(statements: int, pages: int, workers: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [str(Path(tmp) / f"statement-{i}.pdf") for i in range(statements)]
+        for path in paths:
+            make_statement(Path(path), pages)
+        total = statements * pages
+        print(f"{statements} statements x {pages} pages ({total:,} pages, {ROWS} rows each)")
+        for name, run in RUNS.items():
+            for n in sorted({1, workers}):
+                elapsed, transactions = run(paths, n)
+                print(
+                    f"{name:<6} workers {n:>2}   {total / elapsed:8,.0f} pages/s   "
+                    f"{total / elapsed / n:7,.0f} pages/s/core   {transactions:,} transactions"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--statements", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    main(args.statements, args.pages, args.workers)
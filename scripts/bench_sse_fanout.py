@@ -0,0 +1,112 @@
+"""
+Benchmark: CLIENTS concurrent notification streams in one process.
+
+Opens CLIENTS streams, one per user, against the Redis at REDIS_URL. It then
+publishes MESSAGES notifications to random users and reports the time to
+open every stream, the Redis connections they held, and the
+publish-to-delivery latency. It runs twice: once with a subscription (and
+connection) per stream, the old behaviour, and once through the shared
+listener in app.services.pubsub.
+
+Run: cd api && uv run python ../scripts/bench_sse_fanout.py [--clients N] [--messages N] [--shared-only]
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from redis import ResponseError
+from redis.asyncio import Redis
+from app.core.config import settings
+from app.services import pubsub
+
+CONNECT_CONCURRENCY = 50  # dashboards reconnecting at once, not a SYN flood
+
+async def connected_clients() -> int | None:
+    r = Redis.from_url(settings.redis_url)
+    try:
+        return (await r.info("clients"))["connected_clients"]
+    except ResponseError:
+        return None  # server without INFO (e.g. a Redis stand-in)
+    finally:
+        await r.aclose()
+
+
+async def per_stream(users: list[uuid.UUID], stack: AsyncExitStack) -> dict[uuid.UUID, asyncio.Queue]:
+    queues: dict[uuid.UUID, asyncio.Queue] = {}
+    connecting = asyncio.Semaphore(CONNECT_CONCURRENCY)
+
+    async def open_stream(user_id: uuid.UUID) -> None:
+        r = Redis.from_url(settings.redis_url, decode_responses=True)
+        stack.push_async_callback(r.aclose)
+        ps = r.pubsub()
+        stack.push_async_callback(ps.aclose)
+        async with connecting:
+            await ps.subscribe(pubsub._channel(user_id))
+        queue = queues[user_id] = asyncio.Queue()
+
+        async def pump() -> None:
+            async for message in ps.listen():
+                if message["type"] == "message":
+                    queue.put_nowait(message["data"])
+
+        task = asyncio.create_task(pump())
+        stack.callback(task.cancel)
+
+    await asyncio.gather(*(open_stream(u) for u in users))
+    return queues
+
+
+async def shared(users: list[uuid.UUID], stack: AsyncExitStack) -> dict[uuid.UUID, asyncio.Queue]:
+    streams = [stack.enter_async_context(pubsub.subscribe_notifications(u)) for u in users]
+    return dict(zip(users, await asyncio.gather(*streams)))
+
+
+async def run(label: str, open_streams, clients: int, messages: int) -> None:
+    users = [uuid.uuid4() for _ in range(clients)]
+    before = await connected_clients()
+    async with AsyncExitStack() as stack:
+        start = time.perf_counter()
+        queues = await open_streams(users, stack)
+        opened = time.perf_counter() - start
+        after = await connected_clients()
+        connections = "n/a" if before is None else after - before
+
+        latencies = []
+        for _ in range(messages):
+            user_id = random.choice(users)
+            await pubsub.publish_notification(user_id, {"sent": time.perf_counter()})
+            data = await asyncio.wait_for(queues[user_id].get(), timeout=10)
+            latencies.append((time.perf_counter() - json.loads(data)["sent"]) * 1000)
+    await pubsub.close_redis()
+
+    latencies.sort()
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+    print(
+        f"{label:<11} open {opened:6.2f} s   redis connections {connections:>6}   "
+        f"delivery p50 {statistics.median(latencies):6.2f} ms   p99 {p99:6.2f} ms"
+    )
+
+
+async def main(clients: int, messages: int, shared_only: bool) -> None:
+    print(f"{clients:,} streams, {messages:,} notifications")
+    if not shared_only:
+        await run("per-stream", per_stream, clients, messages)
+    await run("shared", shared, clients, messages)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=5_000)
+    parser.add_argument("--messages", type=int, default=2_000)
+    parser.add_argument("--shared-only", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.clients, args.messages, args.shared_only))
@@ -0,0 +1,76 @@
+"""
+Benchmark: per-task overhead of asyncio.run() vs the persistent worker runtime.
+
+Runs the same trivial task body (open a session, SELECT 1) TASKS times each
+way against DATABASE_URL:
+
+- before: asyncio.run() per task. A pooled asyncpg connection can't outlive
+  its loop, so every task pays for a new loop plus a new connection (NullPool
+  is what makes that safe).
+- after: app.tasks.runtime.run() on one long-lived loop with a shared pool,
+  as Celery workers now do.
+
+Run: cd api && uv run python ../scripts/bench_task_runtime.py [--tasks N]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from sqlalchemy import NullPool, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.core.config import settings
+from app.tasks import runtime
+
+
+def task_body(sessionmaker):
+    async def _run() -> None:
+        async with sessionmaker() as db:
+            await db.execute(text("SELECT 1"))
+    return _run()
+
+
+def timed(n: int, submit) -> list[float]:
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        submit()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"{label:<8} mean {statistics.mean(samples):7.2f} ms   "
+        f"p50 {statistics.median(samples):7.2f} ms   p95 {p95:7.2f} ms"
+    )
+
+
+def main(tasks: int) -> None:
+    fresh = async_sessionmaker(create_async_engine(settings.database_url, poolclass=NullPool))
+    before = timed(tasks, lambda: asyncio.run(task_body(fresh)))
+
+    pooled_engine = create_async_engine(settings.database_url, pool_size=5)
+    pooled = async_sessionmaker(pooled_engine)
+    try:
+        after = timed(tasks, lambda: runtime.run(task_body(pooled)))
+    finally:
+        runtime.run(pooled_engine.dispose())
+        runtime.stop()
+
+    print(f"{tasks:,} tasks, body = one session + SELECT 1")
+    report("before", before)
+    report("after", after)
+    print(f"speedup  {statistics.mean(before) / statistics.mean(after):.1f}x per task")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=500)
+    main(parser.parse_args().tasks)
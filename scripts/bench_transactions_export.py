@@ -0,0 +1,99 @@
+"""
+Benchmark: streaming export of GET /transactions/export.
+
+Seeds a throwaway user with ROWS transactions (default 1,000,000) into the
+database pointed to by DATABASE_URL, then drains the export body in each
+format and reports throughput and peak RSS. The endpoint is driven directly
+(not through an HTTP test client, which would buffer the whole body), so the
+RSS figure is the server side's.
+
+Run: cd api && uv run python ../scripts/bench_transactions_export.py [--rows N]
+"""
+import argparse
+import asyncio
+import resource
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, select, text
+from app.core.database import AsyncSessionLocal
+from app.main import app
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.routers.transactions import TransactionFilters, export_transactions
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def seed(rows: int) -> uuid.UUID:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://localhost") as client:
+        r = await client.post("/auth/register", json={
+            "email": f"bench-{uuid.uuid4().hex[:8]}@example.com",
+            "name": "Bench", "password": "benchmark123",
+        })
+        user_id = uuid.UUID(r.json()["id"])
+        r = await client.post("/accounts", json={"name": "Bench", "type": "savings"})
+        account_id = uuid.UUID(r.json()["id"])
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            text("""
+                INSERT INTO transactions
+                    (user_id, account_id, amount, description, type, date, source, created_by)
+                SELECT :uid, :aid, round((1 + random() * 5000)::numeric, 2), 'Bench row ' || g,
+                       'expense', DATE '2026-01-01' - (g % 3650), 'manual', :uid
+                FROM generate_series(1, :n) AS g
+            """),
+            {"uid": user_id, "aid": account_id, "n": rows},
+        )
+        await db.commit()
+        await db.execute(text("ANALYZE transactions"))
+    return user_id
+
+
+async def drain(user: User, fmt: str) -> tuple[int, int, float]:
+    filters = TransactionFilters(None, None, None, None, None, None)
+    async with AsyncSessionLocal() as db:
+        start = time.perf_counter()
+        response = await export_transactions(fmt, filters, user, db)
+        size = lines = 0
+        async for chunk in response.body_iterator:
+            size += len(chunk)
+            lines += chunk.count("\n")
+        return size, lines, time.perf_counter() - start
+
+
+async def main(rows: int) -> None:
+    print(f"Seeding {rows:,} transactions...")
+    user_id = await seed(rows)
+    try:
+        async with AsyncSessionLocal() as db:
+            user = (await db.execute(select(User).where(User.id == user_id))).scalar_one()
+        print(f"baseline peak RSS {peak_rss_mb():.0f} MB")
+        print(f"{'format':>7} {'rows':>10} {'MB':>8} {'seconds':>8} {'rows/s':>10} {'peak RSS MB':>12}")
+        for fmt in ("csv", "ndjson"):
+            size, lines, secs = await drain(user, fmt)
+            data_rows = lines - 1 if fmt == "csv" else lines
+            print(
+                f"{fmt:>7} {data_rows:>10,} {size / 1e6:>8.1f} {secs:>8.1f} "
+                f"{data_rows / secs:>10,.0f} {peak_rss_mb():>12.0f}"
+            )
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(Transaction).where(Transaction.user_id == user_id))
+            await db.execute(delete(User).where(User.id == user_id))
+            await db.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    asyncio.run(main(parser.parse_args().rows))
@@ -0,0 +1,107 @@
+"""
+Benchmark: offset vs cursor pagination on GET /transactions.
+
+Seeds a throwaway user with ROWS transactions (default 1,000,000) straight into
+the database pointed to by DATABASE_URL, then times a 50-row page at increasing
+depths in both modes. Offset pages grow with depth (and pay for a full COUNT);
+cursor pages should stay flat.
+
+Run: cd api && uv run python ../scripts/bench_transactions_pagination.py [--rows N]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, select, text
+from app.core.database import AsyncSessionLocal
+from app.main import app
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.routers.transactions import _encode_cursor
+
+PAGE = 50
+REPEATS = 5
+
+
+async def seed(client: AsyncClient, rows: int) -> tuple[uuid.UUID, uuid.UUID]:
+    email = f"bench-{uuid.uuid4().hex[:8]}@example.com"
+    r = await client.post("/auth/register", json={
+        "email": email, "name": "Bench", "password": "benchmark123",
+    })
+    user_id = uuid.UUID(r.json()["id"])
+    r = await client.post("/accounts", json={"name": "Bench", "type": "savings"})
+    account_id = uuid.UUID(r.json()["id"])
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            text("""
+                INSERT INTO transactions
+                    (user_id, account_id, amount, description, type, date, source, created_by)
+                SELECT :uid, :aid, round((random() * 5000)::numeric, 2), 'Bench row ' || g,
+                       'expense', DATE '2026-01-01' - (g % 3650), 'manual', :uid
+                FROM generate_series(1, :n) AS g
+            """),
+            {"uid": user_id, "aid": account_id, "n": rows},
+        )
+        await db.commit()
+        await db.execute(text("ANALYZE transactions"))
+    return user_id, account_id
+
+
+async def cursor_at(user_id: uuid.UUID, depth: int) -> str | None:
+    if depth == 0:
+        return None
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Transaction)
+            .where(Transaction.user_id == user_id)
+            .order_by(Transaction.date.desc(), Transaction.created_at.desc(), Transaction.id.desc())
+            .offset(depth - 1)
+            .limit(1)
+        )
+        return _encode_cursor(result.scalar_one())
+
+
+async def timed(client: AsyncClient, params: dict) -> float:
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        r = await client.get("/transactions", params=params)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert r.status_code == 200, r.text
+    return statistics.median(samples)
+
+
+async def main(rows: int) -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://localhost") as client:
+        print(f"Seeding {rows:,} transactions...")
+        user_id, _ = await seed(client, rows)
+        try:
+            depths = [d for d in (0, 1_000, 10_000, 100_000, 500_000, rows - PAGE) if d <= rows - PAGE]
+            print(f"{'depth':>10} {'offset ms':>10} {'cursor ms':>10}")
+            for depth in depths:
+                offset_ms = await timed(client, {"limit": PAGE, "offset": depth})
+                cursor = await cursor_at(user_id, depth)
+                params = {"limit": PAGE, "paginate": "cursor"}
+                if cursor:
+                    params["cursor"] = cursor
+                cursor_ms = await timed(client, params)
+                print(f"{depth:>10,} {offset_ms:>10.1f} {cursor_ms:>10.1f}")
+        finally:
+            async with AsyncSessionLocal() as db:
+                await db.execute(delete(Transaction).where(Transaction.user_id == user_id))
+                await db.execute(delete(User).where(User.id == user_id))
+                await db.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    asyncio.run(main(parser.parse_args().rows))
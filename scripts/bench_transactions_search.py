@@ -0,0 +1,133 @@
+"""
+Benchmark: description search on GET /transactions, per search_mode.
+
+Grows a throwaway user's history to 10k, 100k and 1M transactions (override
+with --sizes) in the database pointed to by DATABASE_URL and reports p95
+latency of a first page for each search_mode, for a common term (~1 in 12
+rows) and a rare one (~1 in 5,000). The "no index" row is the old plan:
+the same ILIKE with ix_transactions_description_trgm dropped inside a
+rolled-back transaction.
+
+Run: cd api && uv run python ../scripts/bench_transactions_search.py [--sizes 10000,100000]
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, func, select, text
+from app.core.database import AsyncSessionLocal
+from app.main import app
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.routers.transactions import LIST_ORDER
+
+PAGE = 50
+REPEATS = 20
+MERCHANTS = [
+    "Mercury Drug", "Jollibee", "SM Supermarket", "Grab Food", "Meralco", "Shell",
+    "Puregold", "Netflix", "7-Eleven", "Starbucks", "Globe Telecom", "Lazada",
+]
+# (mode, common query, rare query)
+QUERIES = [
+    ("contains", "mercury", "shopee"),
+    ("fuzzy", "mercuri", "shoppee"),
+    ("prefix", "merc dru", "shop ref"),
+    ("fts", "mercury drug", "shopee refund"),
+]
+
+
+async def seed(user_id: uuid.UUID, account_id: uuid.UUID, start: int, stop: int) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            text("""
+                INSERT INTO transactions
+                    (user_id, account_id, amount, description, type, date, source, created_by)
+                SELECT :uid, :aid, round((1 + random() * 5000)::numeric, 2),
+                       CASE WHEN g % 5000 = 0 THEN 'Shopee refund ' || g
+                            ELSE (CAST(:merchants AS text[]))[1 + g % 12] || ' ' || left(md5(g::text), 6) END,
+                       'expense', DATE '2026-01-01' - (g % 3650), 'manual', :uid
+                FROM generate_series(:start, :stop - 1) AS g
+            """),
+            {"uid": user_id, "aid": account_id, "start": start, "stop": stop, "merchants": MERCHANTS},
+        )
+        await db.commit()
+        await db.execute(text("ANALYZE transactions"))
+
+
+def p95(samples: list[float]) -> float:
+    samples = sorted(samples)
+    return samples[max(int(len(samples) * 0.95) - 1, 0)]
+
+
+async def timed_api(client: AsyncClient, mode: str, query: str) -> float:
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        r = await client.get("/transactions", params={
+            "search": query, "search_mode": mode, "limit": PAGE,
+        })
+        samples.append((time.perf_counter() - start) * 1000)
+        assert r.status_code == 200, r.text
+    return p95(samples)
+
+
+async def timed_unindexed(user_id: uuid.UUID, query: str) -> float:
+    """The pre-index list query (count + first page) with the trigram index gone."""
+    base = select(Transaction).where(
+        Transaction.user_id == user_id, Transaction.description.ilike(f"%{query}%"),
+    )
+    samples = []
+    async with AsyncSessionLocal() as db:
+        await db.execute(text("DROP INDEX ix_transactions_description_trgm"))
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            await db.execute(select(func.count()).select_from(base.subquery()))
+            await db.execute(base.order_by(*LIST_ORDER).limit(PAGE))
+            samples.append((time.perf_counter() - start) * 1000)
+        await db.rollback()
+    return p95(samples)
+
+
+async def main(sizes: list[int]) -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://localhost") as client:
+        r = await client.post("/auth/register", json={
+            "email": f"bench-{uuid.uuid4().hex[:8]}@example.com",
+            "name": "Bench", "password": "benchmark123",
+        })
+        user_id = uuid.UUID(r.json()["id"])
+        r = await client.post("/accounts", json={"name": "Bench", "type": "savings"})
+        account_id = uuid.UUID(r.json()["id"])
+        try:
+            print(f"p95 ms over {REPEATS} requests, first page of {PAGE}")
+            print(f"{'rows':>10} {'mode':>10} {'common':>9} {'rare':>9}")
+            seeded = 0
+            for size in sizes:
+                await seed(user_id, account_id, seeded + 1, size + 1)
+                seeded = size
+                print(
+                    f"{size:>10,} {'no index':>10} {await timed_unindexed(user_id, 'mercury'):>9.1f} "
+                    f"{await timed_unindexed(user_id, 'shopee'):>9.1f}"
+                )
+                for mode, common, rare in QUERIES:
+                    print(
+                        f"{size:>10,} {mode:>10} {await timed_api(client, mode, common):>9.1f} "
+                        f"{await timed_api(client, mode, rare):>9.1f}"
+                    )
+        finally:
+            async with AsyncSessionLocal() as db:
+                await db.execute(delete(Transaction).where(Transaction.user_id == user_id))
+                await db.execute(delete(User).where(User.id == user_id))
+                await db.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    args = parser.parse_args()
+    asyncio.run(main([int(s) for s in args.sizes.split(",")]))
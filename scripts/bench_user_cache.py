@@ -0,0 +1,73 @@
+"""
+Benchmark: GET /auth/me throughput with and without the user cache.
+
+Registers a throwaway user in the database pointed to by DATABASE_URL and
+drives /auth/me in-process (ASGI transport, CONCURRENCY requests in flight)
+for REQUESTS requests each way: with user_cache_ttl_seconds=0 (a SELECT per
+request, the old behaviour) and with the default TTL.
+
+Run: cd api && uv run python ../scripts/bench_user_cache.py [--requests N] [--concurrency N]
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.main import app
+from app.models.user import User
+from app.services import user_cache
+
+
+async def drive(client: AsyncClient, requests: int, concurrency: int) -> float:
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            r = await client.get("/auth/me")
+            assert r.status_code == 200, r.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    ttl = settings.user_cache_ttl_seconds
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://localhost") as client:
+        r = await client.post("/auth/register", json={
+            "email": f"bench-{uuid.uuid4().hex[:8]}@example.com",
+            "name": "Bench", "password": "benchmark123",
+        })
+        user_id = uuid.UUID(r.json()["id"])
+        try:
+            await drive(client, 200, concurrency)  # warm the pool
+            settings.user_cache_ttl_seconds = 0
+            before = await drive(client, requests, concurrency)
+            settings.user_cache_ttl_seconds = ttl
+            user_cache.clear()
+            after = await drive(client, requests, concurrency)
+        finally:
+            async with AsyncSessionLocal() as db:
+                await db.execute(delete(User).where(User.id == user_id))
+                await db.commit()
+
+    print(f"{requests:,} GET /auth/me, concurrency {concurrency}")
+    print(f"no cache   {before:8,.0f} req/s")
+    print(f"cache      {after:8,.0f} req/s   hit ratio {user_cache.stats()['hit_ratio']:.3f}")
+    print(f"speedup    {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,103 @@
+"""
+Load test: latency of other endpoints during a burst of logins.
+
+Registers a throwaway user in the database pointed to by DATABASE_URL, then
+fires BURST concurrent logins while a probe is due on GET /health every 5 ms,
+and reports probe p50/p99 measured from each probe's due time. It runs
+twice: once with bcrypt called inline on the event loop (the old behaviour,
+emulated by bypassing the pool) and once through the bounded pool in
+app.core.security.
+
+Run: cd api && uv run python ../scripts/load_test_login_burst.py [--burst N]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete
+from app.core import security
+from app.core.database import AsyncSessionLocal
+from app.main import app
+from app.models.user import User
+
+PASSWORD = "benchmark123"
+PROBE_INTERVAL = 0.005
+
+
+async def _inline(fn, *args):
+    return fn(*args)
+
+
+async def burst(client: AsyncClient, email: str, logins: int) -> tuple[list[float], float]:
+    probes: list[float] = []
+    done = asyncio.Event()
+
+    async def probe() -> None:
+        # Latency is measured from when each probe was due, so time spent
+        # waiting for a blocked loop counts against it.
+        due = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(max(due - time.perf_counter(), 0))
+            r = await client.get("/health")
+            probes.append((time.perf_counter() - due) * 1000)
+            assert r.status_code == 200
+            due = max(due + PROBE_INTERVAL, time.perf_counter())
+
+    async def login() -> None:
+        r = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+        assert r.status_code in (200, 503), r.text
+
+    prober = asyncio.create_task(probe())
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await prober
+    return probes, elapsed
+
+
+def report(label: str, probes: list[float], elapsed: float, logins: int) -> None:
+    probes = sorted(probes)
+    p99 = probes[max(int(len(probes) * 0.99) - 1, 0)]
+    print(
+        f"{label:<9} probes {len(probes):>5}   p50 {statistics.median(probes):8.1f} ms   "
+        f"p99 {p99:8.1f} ms   logins/s {logins / elapsed:6.1f}"
+    )
+
+
+async def main(logins: int) -> None:
+    email = f"bench-{uuid.uuid4().hex[:8]}@example.com"
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://localhost") as client:
+        r = await client.post("/auth/register", json={
+            "email": email, "name": "Bench", "password": PASSWORD,
+        })
+        user_id = uuid.UUID(r.json()["id"])
+        try:
+            pooled = security._run_in_pool
+            security._run_in_pool = _inline
+            try:
+                inline = await burst(client, email, logins)
+            finally:
+                security._run_in_pool = pooled
+            offloaded = await burst(client, email, logins)
+        finally:
+            async with AsyncSessionLocal() as db:
+                await db.execute(delete(User).where(User.id == user_id))
+                await db.commit()
+
+    print(f"{logins} concurrent logins, GET /health probed every 5 ms")
+    report("inline", *inline, logins)
+    report("pool", *offloaded, logins)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--burst", type=int, default=32)
+    asyncio.run(main(parser.parse_args().burst))
@@ -0,0 +1,36 @@
+"""
+Verify (and by default repair) the materialized ledger tables against a full
+recompute from transactions. The same job runs nightly via Celery beat; use
+this for a manual rebuild after a bulk import or a restore.
+Run: cd api && uv run python ../scripts/reconcile_ledger.py [--verify-only]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from app.core.database import AsyncSessionLocal
+from app.services.ledger import reconcile_ledgers
+
+
+async def main(repair: bool) -> int:
+    async with AsyncSessionLocal() as db:
+        report = await reconcile_ledgers(db, repair=repair)
+    verb = "repaired" if repair else "found"
+    drifted = 0
+    for table, drift in report.items():
+        for d in drift:
+            key = ", ".join(f"{k}={v}" for k, v in d.items() if k not in ("expected", "actual"))
+            print(f"{table} [{key}]: expected {d['expected']}, stored {d['actual']}")
+        print(f"{table}: {len(drift)} drifted row(s) {verb}")
+        drifted += len(drift)
+    return 1 if drifted and not repair else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--verify-only", action="store_true", help="report drift without fixing it")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(repair=not args.verify_only)))